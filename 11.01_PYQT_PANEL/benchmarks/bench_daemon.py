@@ -0,0 +1,118 @@
+# === AXIOM_PY_HEADER ===
+# FILE: bench_daemon.py
+# TITLE: AXIOM BENCH — COLD CLI VS RENDER DAEMON
+# VERSION: v1.0
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/benchmarks]
+# COMMENT: Латентность одной иконки: холодный generate_svg.py против демона (тонкий клиент, запрос, конвейер).
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — Замеры cold CLI / svg_client.py / DaemonClient.render / pipeline во временной копии шаблонов.
+# =======================
+
+"""
+bench_daemon.py — сколько стоит одна иконка.
+Запуск: python benchmarks/bench_daemon.py [--number 30] [--preset VIKTOR_CORE]
+
+— cold_cli:        новый процесс python generate_svg.py --preset ... --out ... на каждую иконку
+— thin_client:     новый процесс python svg_client.py (те же флаги) -> демон
+— daemon_request:  одно соединение, запрос-ответ на каждую иконку
+— daemon_pipeline: одно соединение, все запросы одной пачкой
+Рендер идёт во временную папку (копия templates/ и svg_presets.json), ui/style не трогается.
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+UI_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui"))
+sys.path.insert(0, UI_DIR)
+
+from svg_client import DaemonClient  # noqa: E402
+
+
+def make_workspace():
+    work = tempfile.mkdtemp(prefix="axiom_bench_daemon_")
+    shutil.copytree(os.path.join(UI_DIR, "templates"), os.path.join(work, "templates"))
+    shutil.copy(os.path.join(UI_DIR, "svg_presets.json"), work)
+    os.makedirs(os.path.join(work, "style"))
+    return work
+
+
+def per_icon(label, timings):
+    timings = sorted(timings)
+    print(f"  {label:<16} median {statistics.median(timings) * 1000:8.2f} ms   "
+          f"p90 {timings[int(len(timings) * 0.9) - 1] * 1000:8.2f} ms")
+    return statistics.median(timings)
+
+
+def run_timed(cmd, cwd):
+    started = time.perf_counter()
+    subprocess.run(cmd, cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AXIOM cold CLI vs daemon benchmark")
+    parser.add_argument("--number", type=int, default=30, help="Иконок на замер")
+    parser.add_argument("--preset", type=str, default="VIKTOR_CORE")
+    args = parser.parse_args(argv)
+
+    work = make_workspace()
+    sock = os.path.join(work, "daemon.sock")
+    generate = os.path.join(UI_DIR, "generate_svg.py")
+    client = os.path.join(UI_DIR, "svg_client.py")
+    daemon = None
+    try:
+        print(f"Per-icon latency ({args.number} icons, preset {args.preset}):")
+        cold = per_icon("cold_cli", [
+            run_timed([sys.executable, generate, "--preset", args.preset, "--out", f"cold_{i}.svg", "--force"], work)
+            for i in range(args.number)
+        ])
+
+        daemon = subprocess.Popen([sys.executable, generate, "--serve", "--socket", sock],
+                                  cwd=work, stdout=subprocess.DEVNULL)
+        deadline = time.monotonic() + 10
+        while not os.path.exists(sock):
+            if time.monotonic() > deadline or daemon.poll() is not None:
+                raise RuntimeError("daemon did not start")
+            time.sleep(0.02)
+
+        per_icon("thin_client", [
+            run_timed([sys.executable, client, "--socket", sock, "--preset", args.preset,
+                       "--out", f"thin_{i}.svg", "--force"], work)
+            for i in range(args.number)
+        ])
+
+        with DaemonClient(sock) as conn:
+            conn.render(preset=args.preset, output="warmup.svg", force=True)
+            timings = []
+            for i in range(args.number):
+                started = time.perf_counter()
+                conn.render(preset=args.preset, output=f"req_{i}.svg", force=True)
+                timings.append(time.perf_counter() - started)
+            fast = per_icon("daemon_request", timings)
+
+            requests = [{"op": "render", "preset": args.preset, "output": f"pipe_{i}.svg", "force": True}
+                        for i in range(args.number)]
+            started = time.perf_counter()
+            assert all(r["ok"] for r in conn.pipeline(requests))
+            pipe = (time.perf_counter() - started) / args.number
+            print(f"  {'daemon_pipeline':<16} mean   {pipe * 1000:8.2f} ms")
+            conn.request({"op": "shutdown"})
+        daemon.wait(timeout=10)
+        print(f"  speedup (cold_cli / daemon_request): x{cold / fast:.0f}")
+    finally:
+        if daemon is not None and daemon.poll() is None:
+            daemon.kill()
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# === AXIOM_PY_HEADER ===
+# FILE: bench_template_engine.py
+# TITLE: AXIOM BENCH — TEMPLATE ENGINE
+# VERSION: v1.2
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/benchmarks]
+# COMMENT: Микро-бенчмарк: старый путь (чтение + str.format) против скомпилированных шаблонов.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — Сравнение str.format / FormatTemplate / SVGTemplate на badge и core.
+# v1.1 — 2026-10-18 — Проверка: числовое значение по умолчанию форматируется при отсутствии параметра; legacy-путь без блока {% if animate %}.
+# v1.2 — 2026-10-18 — Проверки: CSS {fill:red} в <style> — текст, умолчание 1e400 не ломает компиляцию.
+# =======================
+
+"""
+bench_template_engine.py — сравнение путей рендера одного шаблона.
+Запуск: python benchmarks/bench_template_engine.py [--number 20000]
+
+— legacy_read_format: open + read + str.format на каждый вызов (поведение render() v1.0)
+— format_cached:      предразобранный FormatTemplate (кеш v1.1)
+— svg_template:       скомпилированная функция SVGTemplate (v1.5)
+core.svg.j2 через str.format не рендерится ({% if %}), поэтому для него — только svg_template.
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+UI_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "ui")
+sys.path.insert(0, UI_DIR)
+
+from template_cache import FormatTemplate  # noqa: E402
+from svg_template import SVGTemplate  # noqa: E402
+
+TEMPLATES_DIR = os.path.join(UI_DIR, "templates")
+
+
+def load_preset_params(name):
+    with open(os.path.join(UI_DIR, "svg_presets.json"), encoding="utf-8") as f:
+        return json.load(f)["presets"][name]["params"]
+
+
+def legacy_source(path):
+    # Шаблон без синтаксиса default ({x|y} -> {x}) и без блоков {% if %} (пресет без animate —
+    # блок не рендерится), чтобы str.format его понял
+    import re
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    source = re.sub(r"^[ \t]*\{% if \w+ %\}.*?\{% endif %\}[ \t]*\n", "", source, flags=re.M | re.S)
+    return re.sub(r"\{(\w+)\|[^{}]*\}", r"{\1}", source)
+
+
+def bench(label, fn, number):
+    per_call = min(timeit.repeat(fn, number=number, repeat=3)) / number
+    print(f"  {label:<22} {per_call * 1e6:8.2f} µs/render")
+    return per_call
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AXIOM template engine micro-benchmark")
+    parser.add_argument("--number", type=int, default=20000, help="Рендеров на замер")
+    args = parser.parse_args(argv)
+
+    # badge: все три пути
+    badge_params = load_preset_params("LAB_BADGE")
+    badge_src = legacy_source(os.path.join(TEMPLATES_DIR, "badge.svg.j2"))
+    legacy_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_legacy_badge.svg.j2")
+    with open(legacy_path, "w", encoding="utf-8") as f:
+        f.write(badge_src)
+
+    def legacy_read_format():
+        with open(legacy_path, encoding="utf-8") as f:
+            return f.read().format(**badge_params)
+
+    fmt = FormatTemplate(badge_src)
+    with open(os.path.join(TEMPLATES_DIR, "badge.svg.j2"), encoding="utf-8") as f:
+        engine = SVGTemplate(f.read(), "badge.svg.j2")
+    assert engine.render(badge_params) == legacy_read_format()
+    # {x:.2f|0.5} без x: умолчание — число, спецификация формата применима
+    assert SVGTemplate("{x:.2f|0.5}").render({}) == "0.50"
+    assert SVGTemplate("{c|#fff}/{n|56}").render({}) == "#fff/56"
+    assert SVGTemplate("<style>.a{fill:red}.b{fill:#fff}</style>").render({}) == "<style>.a{fill:red}.b{fill:#fff}</style>"
+    assert SVGTemplate("{x|1e400}").render({}) == "1e400"
+
+    print("badge.svg.j2 (LAB_BADGE):")
+    try:
+        base = bench("legacy_read_format", legacy_read_format, args.number)
+        bench("format_cached", lambda: fmt.render(badge_params), args.number)
+        fast = bench("svg_template", lambda: engine.render(badge_params), args.number)
+        print(f"  speedup vs legacy: x{base / fast:.1f}")
+    finally:
+        os.remove(legacy_path)
+
+    # core: условный блок {% if label %} — только новый движок
+    core_params = load_preset_params("VIKTOR_CORE")
+    with open(os.path.join(TEMPLATES_DIR, "core.svg.j2"), encoding="utf-8") as f:
+        core = SVGTemplate(f.read(), "core.svg.j2")
+    print("core.svg.j2 (VIKTOR_CORE):")
+    bench("svg_template", lambda: core.render(core_params), args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# === AXIOM_PY_HEADER ===
+# FILE: bench_widget_construction.py
+# TITLE: AXIOM BENCH — WIDGET CONSTRUCTION
+# VERSION: v1.0
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/benchmarks]
+# COMMENT: Время построения окон при теме на уровне приложения против старых per-widget стилей.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — Замер LoginWindow / AxiomMainWindow (offscreen), режим --legacy-inline.
+# =======================
+
+"""
+bench_widget_construction.py — сколько стоит построить окно и отполировать его стилем.
+Запуск: python benchmarks/bench_widget_construction.py [--number 50] [--legacy-inline]
+
+— по умолчанию: тема применяется один раз к QApplication (ui/theme_manager.py)
+— --legacy-inline: как до v0.6/v1.4 — QSS читается с диска в каждом окне и ставится
+  на само окно, плюс inline setStyleSheet на логотип/подзаголовок/линию/подписи
+Окна строятся на платформе offscreen, замер включает show() + processEvents() (polish).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+PANEL_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, PANEL_DIR)
+
+from PyQt5.QtWidgets import QApplication, QLabel, QFrame  # noqa: E402
+
+from ui.theme_manager import theme_manager, STYLE_DIR, THEMES, DEFAULT_THEME  # noqa: E402
+
+# Inline-стили, которые окна ставили до перехода на селекторы
+LEGACY_INLINE = {
+    "AxiomLogo": "font-size:38px;color:#fd1a29;margin-bottom:6px;letter-spacing:0.2em;",
+    "AxiomSubtitle": "color:#fd1a29;font-size:16px;font-weight:600;letter-spacing:0.09em;margin-bottom:10px;",
+    "AxiomLine": "background:#fd1a29;max-height:2px;min-height:2px;border-radius:1px;margin:14px 0 14px 0;",
+    "fieldLabel": "color:#fd1a29;font-size:15px;font-weight:600;",
+}
+
+
+def apply_legacy_inline(window):
+    # Чтение QSS с диска на каждое окно + стили на отдельных виджетах
+    with open(os.path.join(STYLE_DIR, THEMES[DEFAULT_THEME]), "r", encoding="utf-8") as f:
+        window.setStyleSheet(f.read())
+    for widget in window.findChildren((QLabel, QFrame)):
+        key = widget.objectName() or widget.property("class")
+        if key in LEGACY_INLINE:
+            widget.setStyleSheet(LEGACY_INLINE[key])
+
+
+def bench_window(app, label, factory, number, legacy):
+    timings = []
+    for _ in range(number):
+        started = time.perf_counter()
+        window = factory()
+        if legacy:
+            apply_legacy_inline(window)
+        window.show()
+        app.processEvents()
+        timings.append(time.perf_counter() - started)
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    timings.sort()
+    print(f"  {label:<18} median {timings[len(timings) // 2] * 1000:7.2f} ms   "
+          f"min {timings[0] * 1000:7.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AXIOM widget construction benchmark")
+    parser.add_argument("--number", type=int, default=50, help="Построений на окно")
+    parser.add_argument("--legacy-inline", action="store_true",
+                        help="Старый путь: QSS на окне + inline-стили виджетов")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    if not args.legacy_inline:
+        theme_manager.apply(app)
+
+    from login_window import LoginWindow
+    from main_window import AxiomMainWindow
+
+    mode = "legacy inline" if args.legacy_inline else "app-level theme"
+    print(f"Widget construction ({mode}, {args.number} runs):")
+    bench_window(app, "LoginWindow", LoginWindow, args.number, args.legacy_inline)
+    bench_window(app, "AxiomMainWindow", AxiomMainWindow, args.number, args.legacy_inline)
+
+    # Переключение темы: один setStyleSheet на приложение
+    if not args.legacy_inline:
+        window = AxiomMainWindow()
+        window.show()
+        app.processEvents()
+        started = time.perf_counter()
+        theme_manager.switch("default")
+        app.processEvents()
+        print(f"  theme switch       {(time.perf_counter() - started) * 1000:7.2f} ms")
+        window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,557 @@
+# === AXIOM_PY_HEADER ===
+# FILE: run_suite.py
+# TITLE: AXIOM BENCH — SUITE RUNNER
+# VERSION: v1.5
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/benchmarks]
+# COMMENT: Набор бенчмарков горячих путей генератора, панели и логина; JSON-результаты и сравнение с baseline.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — Кейсы render / presets / fields / preview / credentials / cold_start, порог регрессии.
+# v1.1 — 2026-10-18 — Кейс gallery: галерея пресетов на 10 000 строк (сброс модели, шаг прокрутки, первый экран).
+# v1.2 — 2026-10-18 — Кейс animation: кадр SMIL-цикла (расчёт статичного SVG и растеризация).
+# v1.3 — 2026-10-18 — Кейс modules: реестр модулей из NAV на 100 / 500 секторов (без кеша, из кеша).
+# v1.4 — 2026-10-18 — Кейс sinks: пакет в папку (файл на выход) против одного zip / tar.gz (svg_sink.py).
+# v1.5 — 2026-10-18 — Кейс bundle: первый рендер CLI и открытие панели в новом процессе — без бандла и с бандлом.
+# =======================
+
+"""
+run_suite.py — общий прогон бенчмарков (headless: QT_QPA_PLATFORM=offscreen).
+Запуск:
+    python benchmarks/run_suite.py                      # все кейсы -> benchmarks/results/latest.json
+    python benchmarks/run_suite.py --save-baseline      # то же + сохранить как baseline.json
+    python benchmarks/run_suite.py --only render,presets --threshold 0.15
+
+Кейсы (метрики — время, меньше = лучше):
+— render       — рендер каждого шаблона: в память и в файл (µs)
+— presets      — холодная загрузка PresetStore (names + get) для JSON/JSONL разного размера (ms)
+— fields       — SVGGeneratorPanel: построение страницы полей и переключение шаблона (ms)   [Qt]
+— preview      — живой предпросмотр: start_preview_render -> _on_preview_rendered (ms)     [Qt]
+— animation    — кадр анимированного core.svg.j2: статичный SVG на момент t (µs), растеризация кадра (ms)
+— gallery      — галерея 10 000 пресетов: сброс модели, шаг прокрутки, миниатюры первого экрана (ms) [Qt]
+— sinks        — пакет N пресетов в jobs=1: папка (файл на выход), zip (deflate / stored), tar, tar.gz (ms)
+— modules      — ModuleRegistry: NAV на N секторов — построение индекса, загрузка из кеша, перезапись NAV (ms)
+— credentials  — CredentialStore: первая проверка (с чтением файла) и повторная vs число пользователей (ms)
+— bundle       — новый процесс: генератор + первый рендер всех шаблонов; открытие панели + предпросмотр [Qt];
+                 из исходников и из templates/.axiom_bundle.bin (ms)
+— cold_start   — новый процесс: импорт, QApplication, тема, показ LoginWindow (ms)          [Qt]
+Кейсы [Qt] пропускаются, если PyQt5 не установлен. Сравнение с baseline: метрика хуже
+baseline больше чем на --threshold (доля) — регрессия, код выхода 1.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PANEL_DIR = os.path.abspath(os.path.join(BENCH_DIR, ".."))
+UI_DIR = os.path.join(PANEL_DIR, "ui")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+sys.path.insert(0, UI_DIR)
+sys.path.insert(1, PANEL_DIR)
+
+from generate_svg import AxiomSVGGenerator  # noqa: E402
+from preset_store import PresetStore, write_jsonl  # noqa: E402
+
+TEMPLATES_DIR = os.path.join(UI_DIR, "templates")
+DEFAULT_THRESHOLD = 0.25
+
+
+class Skip(Exception):
+    pass
+
+
+def per_call(fn, number, repeat=5):
+    # Лучшее из repeat прогонов по number вызовов — секунды на вызов
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+_qt_app = None
+
+
+def qt_app():
+    global _qt_app
+    try:
+        from PyQt5.QtWidgets import QApplication
+    except ImportError:
+        raise Skip("PyQt5 not installed")
+    if _qt_app is None:
+        _qt_app = QApplication.instance() or QApplication([sys.argv[0]])
+    return _qt_app
+
+
+# ==== Кейсы: fn(ctx) -> {метрика: значение} ====
+def bench_render(ctx):
+    gen = AxiomSVGGenerator(TEMPLATES_DIR, ctx["tmp"])
+    gen.verbose = False
+    number = 200 if ctx["quick"] else 2000
+    metrics = {}
+    for tpl in gen.list_templates():
+        gen.render_to_string(tpl, {})  # прогрев кеша шаблонов
+        metrics[f"render.{tpl}.memory_us"] = per_call(lambda: gen.render_to_string(tpl, {}), number) * 1e6
+        metrics[f"render.{tpl}.file_us"] = per_call(
+            lambda: gen.render(tpl, {}, "bench_render.svg", force=True), number // 10) * 1e6
+    return metrics
+
+
+def _synthetic_presets(count):
+    templates = ("core.svg.j2", "badge.svg.j2")
+    return {
+        f"BENCH_{i:06d}": {
+            "template": templates[i % 2],
+            "description": f"Synthetic preset #{i}",
+            "params": {"size": 16 + i % 64, "color": f"#{i * 2654435761 % 0xFFFFFF:06x}",
+                       "glow_opacity": round(i % 100 / 100, 2), "label": f"P{i}"},
+        }
+        for i in range(count)
+    }
+
+
+def bench_presets(ctx):
+    sizes = (100, 1000) if ctx["quick"] else (100, 1000, 10000, 50000)
+    metrics = {}
+    for count in sizes:
+        presets = _synthetic_presets(count)
+        json_path = os.path.join(ctx["tmp"], f"presets_{count}.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"presets": presets}, f, ensure_ascii=False)
+        jsonl_path = os.path.join(ctx["tmp"], f"presets_{count}.jsonl")
+        write_jsonl(presets, jsonl_path)
+        last = f"BENCH_{count - 1:06d}"
+        for fmt, path in (("json", json_path), ("jsonl", jsonl_path)):
+            def cold_load():
+                store = PresetStore(path)
+                store.names()
+                store.get(last)
+            metrics[f"presets.{fmt}.{count}_ms"] = per_call(cold_load, 1, repeat=3 if count > 1000 else 7) * 1000
+        metrics[f"presets.file_kb.{count}"] = os.path.getsize(json_path) / 1024
+    return metrics
+
+
+def _make_panel(ctx):
+    qt_app()
+    from ui.panel_svg_generator import SVGGeneratorPanel
+    panel = SVGGeneratorPanel(templates_dir=TEMPLATES_DIR, style_dir=ctx["tmp"])
+    panel.show()
+    return panel
+
+
+def _spin(app, until, timeout=5.0):
+    deadline = time.perf_counter() + timeout
+    while not until():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("Qt event wait timed out")
+        app.processEvents()
+
+
+def bench_fields(ctx):
+    app = qt_app()
+    panel = _make_panel(ctx)
+    templates = [panel.template_combo.itemText(i) for i in range(panel.template_combo.count())]
+    if len(templates) < 2:
+        raise Skip("need at least two templates")
+    repeat = 10 if ctx["quick"] else 50
+    cold, warm = [], []
+    for _ in range(repeat):
+        # Холодно: страницы полей удалены — смена шаблона строит страницу заново
+        panel.clear_param_fields()
+        app.processEvents()
+        started = time.perf_counter()
+        panel.template_combo.setCurrentText(templates[1] if panel.template_combo.currentText() == templates[0]
+                                            else templates[0])
+        app.processEvents()
+        cold.append(time.perf_counter() - started)
+    for i in range(repeat):
+        started = time.perf_counter()
+        panel.template_combo.setCurrentText(templates[i % 2])
+        app.processEvents()
+        warm.append(time.perf_counter() - started)
+    panel.close()
+    return {"fields.switch_cold_ms": min(cold) * 1000, "fields.switch_warm_ms": min(warm) * 1000}
+
+
+def bench_preview(ctx):
+    app = qt_app()
+    panel = _make_panel(ctx)
+    done = []
+    panel._preview_signals.finished.connect(lambda seq, *_: done.append(seq))
+    timings = []
+    for _ in range(10 if ctx["quick"] else 50):
+        started = time.perf_counter()
+        panel.start_preview_render()
+        seq = panel._preview_seq
+        _spin(app, lambda: seq in done)
+        timings.append(time.perf_counter() - started)
+    panel.close()
+    timings.sort()
+    return {"preview.roundtrip_ms": timings[len(timings) // 2] * 1000}
+
+
+def bench_animation(ctx):
+    gen = AxiomSVGGenerator(TEMPLATES_DIR, ctx["tmp"])
+    anim = gen.render_animation("core.svg.j2", {"animate": 1, "label": "Ω"})
+    times = anim.frame_times(24)
+    number = 200 if ctx["quick"] else 2000
+    cursor = iter(range(10 ** 9))
+    metrics = {"animation.bake_frame_us": per_call(lambda: anim.frame(times[next(cursor) % len(times)]),
+                                                   number) * 1e6}
+    try:
+        qt_app()
+    except Skip:
+        return metrics  # без PyQt5 — только расчёт кадров
+    from icon_service import rasterize_image
+    frame = anim.frame(times[len(times) // 2]).encode("utf-8")
+    metrics["animation.raster_frame_256_ms"] = per_call(lambda: rasterize_image(frame, 256),
+                                                        20 if ctx["quick"] else 100) * 1000
+    return metrics
+
+
+def bench_gallery(ctx):
+    app = qt_app()
+    from ui.preset_gallery import PresetGalleryModel, PresetGalleryView
+    count = 2000 if ctx["quick"] else 10000
+    presets_path = os.path.join(ctx["tmp"], f"gallery_{count}.jsonl")
+    write_jsonl(_synthetic_presets(count), presets_path)
+    gen = AxiomSVGGenerator(TEMPLATES_DIR, ctx["tmp"], presets_path=presets_path)
+    names = gen.preset_store.names()
+    model = PresetGalleryModel(gen)
+    view = PresetGalleryView(model)
+    view.resize(480, 360)
+    view.show()
+
+    started = time.perf_counter()
+    model.set_names(names)
+    app.processEvents()
+    reset_ms = (time.perf_counter() - started) * 1000
+
+    # Первый экран: от запроса видимых строк до последней готовой миниатюры
+    started = time.perf_counter()
+    view.request_visible()
+    _spin(app, lambda: not model.stats()["pending"], timeout=30)
+    first_screen_ms = (time.perf_counter() - started) * 1000
+
+    # Прокрутка: шаг на полэкрана, отрисовка сразу (миниатюры догружаются в фоне)
+    bar = view.verticalScrollBar()
+    steps = []
+    for value in range(0, bar.maximum(), max(1, view.viewport().height() // 2))[:200]:
+        started = time.perf_counter()
+        bar.setValue(value)
+        view.viewport().repaint()
+        app.processEvents()
+        steps.append(time.perf_counter() - started)
+    _spin(app, lambda: not model.stats()["pending"], timeout=30)
+    view.close()
+    steps.sort()
+    return {
+        f"gallery.reset_{count}_ms": reset_ms,
+        "gallery.first_screen_ms": first_screen_ms,
+        "gallery.scroll_step_p50_ms": steps[len(steps) // 2] * 1000,
+        "gallery.scroll_step_p90_ms": steps[int(len(steps) * 0.9)] * 1000,
+    }
+
+
+def bench_sinks(ctx):
+    from svg_batch import run_batch
+    from svg_sink import open_sink
+    count = 500 if ctx["quick"] else 5000
+    items = [{"template": p["template"], "params": p["params"], "output": f"{name.lower()}.svg"}
+             for name, p in _synthetic_presets(count).items()]
+    metrics = {}
+    runs = iter(range(100))
+    cases = (("dir", "out_dir", True), ("zip", "out.zip", True), ("zip_stored", "out.zip", False),
+             ("tar", "out.tar", True), ("tar_gz", "out.tar.gz", True))
+    for kind, target, compress in cases:
+        def run():
+            # Каждый прогон — в новый путь: папка не перезаписывается поверх прошлых файлов
+            path = os.path.join(ctx["tmp"], f"sinks_{next(runs)}_{target}")
+            run_batch(items, TEMPLATES_DIR, ctx["tmp"], jobs=1, incremental=False,
+                      sink=open_sink(path, compress))
+
+        metrics[f"sinks.{count}.{kind}_ms"] = per_call(run, 1, repeat=3) * 1000
+    return metrics
+
+
+def _synthetic_nav(root, sectors):
+    # Корневой NAV + по вложенному NAV в каждой папке сектора (как 11.00 / 11.01)
+    def meta(stamp):
+        return {"version": "BETA", "status": "auto_generated", "updated_at": stamp}
+
+    tree = []
+    for i in range(sectors):
+        folder = f"{i:03d}_SECTOR"
+        files = [{"title": f"{i:03d}.00.n_NAV.json", "type": "file", "depth": 1, "id": f"{i:03d}.00.n",
+                  "name": "NAV", "zone": folder}]
+        files += [{"title": f"MODULE {i}.{j}", "type": "file", "depth": 1, "id": f"mod{j}", "name": "panel",
+                   "zone": f"[{folder}/ui]", "file": f"mod{j}_panel.py", "status": "ACTIVE",
+                   "comment": f"Synthetic module {i}.{j}"} for j in range(6)]
+        tree.append({"title": folder, "type": "folder", "depth": 0, "zone": folder, "children": files})
+        os.makedirs(os.path.join(root, folder), exist_ok=True)
+        with open(os.path.join(root, folder, f"{i:03d}.00.n_NAV.json"), "w", encoding="utf-8") as f:
+            json.dump({"_meta": meta("2026-10-18T00:00:00"), "tree": files}, f)
+    path = os.path.join(root, "00.00.n_NAV.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"_meta": meta("2026-10-18T00:00:00"), "tree": tree}, f)
+    return path
+
+
+def bench_modules(ctx):
+    from module_registry import ModuleRegistry
+    metrics = {}
+    for sectors in ((100,) if ctx["quick"] else (100, 500)):
+        root = os.path.join(ctx["tmp"], f"nav_{sectors}")
+        nav = _synthetic_nav(root, sectors)
+        cache = os.path.join(root, ".axiom_modules.cache")
+
+        def cold():
+            if os.path.exists(cache):
+                os.remove(cache)
+            ModuleRegistry(nav, cache).children("")
+
+        metrics[f"modules.{sectors}.build_ms"] = per_call(cold, 1) * 1000
+        ModuleRegistry(nav, cache).ensure_loaded()
+        metrics[f"modules.{sectors}.cached_ms"] = per_call(lambda: ModuleRegistry(nav, cache).children(""), 5) * 1000
+
+        def touched():
+            os.utime(nav)  # файл перезаписан, updated_at тот же: JSON читается, индекс — из кеша
+            ModuleRegistry(nav, cache).children("")
+
+        metrics[f"modules.{sectors}.touched_ms"] = per_call(touched, 1) * 1000
+    return metrics
+
+
+def bench_credentials(ctx):
+    from users.credential_store import CredentialStore, hash_password
+    # Одна дешёвая строка хеша на всех: меряем индекс и чтение файла, а не стоимость KDF
+    encoded = hash_password("bench-password", iterations=1000)
+    sizes = (10, 1000) if ctx["quick"] else (10, 1000, 10000, 100000)
+    metrics = {}
+    for count in sizes:
+        path = os.path.join(ctx["tmp"], f"auth_{count}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"users": [{"login": f"user{i}", "password_hash": encoded} for i in range(count)]}, f)
+        target = f"user{count // 2}"
+
+        def cold():
+            CredentialStore(path).verify(target, "bench-password")
+        store = CredentialStore(path)
+        store.verify(target, "bench-password")
+        metrics[f"credentials.{count}.cold_ms"] = per_call(cold, 1, repeat=3) * 1000
+        metrics[f"credentials.{count}.verify_ms"] = per_call(
+            lambda: store.verify(target, "bench-password"), 20) * 1000
+    return metrics
+
+
+_COLD_START = """
+import time, sys
+t0 = time.perf_counter()
+sys.argv = ["main.py"]
+import main
+app = main.QApplication(sys.argv)
+main.apply_axiom_style(app)
+login = main.LoginWindow()
+login.show()
+app.processEvents()
+print("READY", (time.perf_counter() - t0) * 1000)
+"""
+
+
+_FIRST_RENDER = """
+import sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {ui!r})
+from generate_svg import AxiomSVGGenerator
+gen = AxiomSVGGenerator({templates!r}, {style!r})
+for name in gen.list_templates():
+    gen.render_to_string(name, {{}})
+gen.preset_store.names()
+print("READY", (time.perf_counter() - t0) * 1000)
+"""
+
+_PANEL_OPEN = """
+import sys, time
+t0 = time.perf_counter()
+sys.path.insert(0, {panel!r})
+from PyQt5.QtWidgets import QApplication
+app = QApplication([sys.argv[0]])
+from ui.panel_svg_generator import SVGGeneratorPanel
+panel = SVGGeneratorPanel(templates_dir={templates!r}, style_dir={style!r})
+panel.show()
+panel.preview_svg()
+app.processEvents()
+print("READY", (time.perf_counter() - t0) * 1000)
+"""
+
+
+def _subprocess_ms(script, runs):
+    # Лучшее из runs: время от старта скрипта до READY (без запуска интерпретатора)
+    best = None
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", script], cwd=PANEL_DIR, check=True,
+                             capture_output=True, text=True).stdout
+        ms = float(out.split("READY", 1)[1].split()[0])
+        best = ms if best is None else min(best, ms)
+    return best
+
+
+def bench_bundle(ctx):
+    # Копия шаблонов (x copies каждого) + пресеты; до — без бандла, после — с бандлом
+    from template_bundle import build_bundle
+    try:
+        import PyQt5  # noqa: F401
+        has_qt = True
+    except ImportError:
+        has_qt = False
+    runs = 3 if ctx["quick"] else 7
+    metrics = {}
+    for copies, presets in ((1, 6), (20, 5000)):
+        base = os.path.join(ctx["tmp"], f"bundle_{copies}")
+        templates = os.path.join(base, "templates")
+        os.makedirs(templates)
+        for name in os.listdir(TEMPLATES_DIR):
+            if name.endswith(".svg.j2"):
+                for i in range(copies):
+                    target = name if copies == 1 else name.replace(".svg.j2", f"_{i:02d}.svg.j2")
+                    shutil.copyfile(os.path.join(TEMPLATES_DIR, name), os.path.join(templates, target))
+        with open(os.path.join(base, "svg_presets.json"), "w", encoding="utf-8") as f:
+            json.dump({"presets": _synthetic_presets(presets)}, f, ensure_ascii=False)
+        fmt = {"ui": UI_DIR, "panel": PANEL_DIR, "templates": templates, "style": ctx["tmp"]}
+        for stage in ("sources", "bundle"):
+            if stage == "bundle":
+                build_bundle(templates, os.path.join(base, "svg_presets.json"))
+            key = f"bundle.{copies * 2}tpl_{presets}p"
+            metrics[f"{key}.first_render.{stage}_ms"] = _subprocess_ms(_FIRST_RENDER.format(**fmt), runs)
+            if has_qt:
+                metrics[f"{key}.panel_open.{stage}_ms"] = _subprocess_ms(_PANEL_OPEN.format(**fmt), runs)
+    return metrics
+
+
+def bench_cold_start(ctx):
+    try:
+        import PyQt5  # noqa: F401
+    except ImportError:
+        raise Skip("PyQt5 not installed")
+    process_ms, inner_ms = [], []
+    for _ in range(3 if ctx["quick"] else 7):
+        started = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", _COLD_START], cwd=PANEL_DIR, check=True,
+                             capture_output=True, text=True).stdout
+        process_ms.append((time.perf_counter() - started) * 1000)
+        inner_ms.append(float(out.split("READY", 1)[1].split()[0]))
+    return {"cold_start.process_ms": min(process_ms), "cold_start.login_shown_ms": min(inner_ms)}
+
+
+CASES = {
+    "render": bench_render,
+    "presets": bench_presets,
+    "fields": bench_fields,
+    "preview": bench_preview,
+    "gallery": bench_gallery,
+    "animation": bench_animation,
+    "modules": bench_modules,
+    "sinks": bench_sinks,
+    "bundle": bench_bundle,
+    "credentials": bench_credentials,
+    "cold_start": bench_cold_start,
+}
+
+
+# ==== Результаты и baseline ====
+def run_cases(names, quick):
+    ctx = {"tmp": tempfile.mkdtemp(prefix="axiom_bench_"), "quick": quick}
+    results, skipped = {}, {}
+    try:
+        for name in names:
+            started = time.perf_counter()
+            try:
+                metrics = CASES[name](ctx)
+            except Skip as e:
+                skipped[name] = str(e)
+                print(f"[{name}] skipped: {e}")
+                continue
+            results.update(metrics)
+            print(f"[{name}] {len(metrics)} metrics in {time.perf_counter() - started:.1f}s")
+    finally:
+        shutil.rmtree(ctx["tmp"], ignore_errors=True)
+    return results, skipped
+
+
+def compare(results, baseline, threshold):
+    # -> список регрессий; печатает таблицу метрик, общих с baseline
+    regressions = []
+    print(f"{'metric':<40} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name in sorted(results):
+        base = baseline.get(name)
+        if base is None or base <= 0 or name.startswith("presets.file_kb"):
+            continue
+        change = results[name] / base - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<40} {base:12.3f} {results[name]:12.3f} {change:+7.0%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="AXIOM benchmark suite")
+    parser.add_argument("--only", type=str, help=f"Кейсы через запятую: {','.join(CASES)}")
+    parser.add_argument("--quick", action="store_true", help="Меньше итераций и размеров (дымовой прогон)")
+    parser.add_argument("--out", type=str, default=os.path.join(RESULTS_DIR, "latest.json"))
+    parser.add_argument("--baseline", type=str, default=os.path.join(RESULTS_DIR, "baseline.json"))
+    parser.add_argument("--save-baseline", action="store_true", help="Сохранить результаты как baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Допустимое ухудшение, доля (0.25 = +25%%)")
+    args = parser.parse_args(argv)
+
+    names = args.only.split(",") if args.only else list(CASES)
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+
+    results, skipped = run_cases(names, args.quick)
+    report = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+            "skipped": skipped,
+        },
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1, sort_keys=True)
+    print(f"Results: {args.out}")
+
+    if args.save_baseline:
+        shutil.copyfile(args.out, args.baseline)
+        print(f"Baseline saved: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print("No baseline yet (--save-baseline to create one)")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline["meta"].get("quick") != args.quick:
+        print("⚠ baseline was recorded with a different --quick setting")
+    regressions = compare(results, baseline["results"], args.threshold)
+    if regressions:
+        print(f"❗ {len(regressions)} regression(s) over +{args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"OK: no regressions over +{args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,7 @@
 # === AXIOM_PY_HEADER ===
 # FILE: login_window.py
 # TITLE: LOGIN WINDOW MODULE
-# VERSION: v0.3
+# VERSION: v0.7
 # STATUS: DRAFT
 # ZONE: [11_SYSTEM_INTERFACE]
 # COMMENT: Окно авторизации с фирменной "карточкой" и поддержкой QSS-стиля из axiom_style.qss.
@@ -11,41 +11,56 @@
 # v0.1 — 2025-07-26 — MVP: базовая форма логина.
 # v0.2 — 2025-07-26 — Вынесена авторизация в users/auth.json, SHA256-хеш.
 # v0.3 — 2025-07-26 — Дизайн-карточка, objectName, центрирование, поддержка QSS.
+# v0.4 — 2026-10-18 — Проверка через users/credential_store.py: индекс по логину, reload по mtime, compare_digest.
+# v0.5 — 2026-10-18 — Проверка пароля (медленный KDF) в рабочем потоке, busy-состояние кнопки и полей.
+# v0.6 — 2026-10-18 — Без собственного чтения QSS и inline-стилей: тема приходит от ui/theme_manager.py (objectName/class).
+# v0.7 — 2026-10-18 — Спан auth.check (ui/perf.py) вокруг проверки пароля.
 # =======================
 
 """
 login_window.py — окно авторизации AXIOM PANEL.
 - Фирменная карточка (card-компоновка) с QSS-стилем.
-- Логины и хеши паролей хранятся в users/auth.json.
+- Логины и хеши паролей хранятся в users/auth.json (pbkdf2_sha256 / scrypt / legacy SHA256).
+- Проверка пароля идёт в рабочем потоке — окно не замирает на время медленного KDF.
 - Можно расширять под любой будущий UI и модули.
 """
 
 from PyQt5.QtWidgets import (
     QDialog, QLabel, QLineEdit, QPushButton, QVBoxLayout, QWidget, QFrame, QMessageBox
 )
-from PyQt5.QtCore import Qt
-import hashlib
-import json
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
 import os
 
+from users.credential_store import CredentialStore
+from ui.perf import span
+
 # === Путь к auth.json ===
 AUTH_FILE = os.path.join(
     os.path.dirname(__file__), "users", "auth.json"
 )
 
+# Один разобранный индекс на процесс; файл перечитывается только при изменении mtime
+_credential_store = CredentialStore(AUTH_FILE)
+
 def check_credentials(login, password):
-    if not os.path.exists(AUTH_FILE):
-        return False
-    try:
-        with open(AUTH_FILE, "r") as f:
-            data = json.load(f)
-    except Exception:
-        return False
-    hash_pw = hashlib.sha256(password.encode()).hexdigest()
-    for user in data.get("users", []):
-        if user["login"] == login and user["password_hash"] == hash_pw:
-            return True
-    return False
+    with span("auth.check"):
+        return _credential_store.verify(login, password)
+
+class CredentialCheckThread(QThread):
+    # KDF (pbkdf2/scrypt) отпускает GIL — цикл событий Qt продолжает рисовать окно
+    checked = pyqtSignal(bool)
+
+    def __init__(self, login, password, parent=None):
+        super().__init__(parent)
+        self.login = login
+        self.password = password
+
+    def run(self):
+        try:
+            ok = check_credentials(self.login, self.password)
+        except Exception:
+            ok = False
+        self.checked.emit(ok)
 
 class LoginWindow(QDialog):
     def __init__(self, parent=None):
@@ -54,14 +69,7 @@ class LoginWindow(QDialog):
         self.setMinimumSize(470, 440)
         self.setMaximumSize(700, 680)
 
-        # === Apply QSS style ===
-        qss_path = os.path.join(
-            os.path.dirname(__file__),
-            "ui", "style", "axiom_red.qss"
-        )
-        if os.path.exists(qss_path):
-            with open(qss_path, "r", encoding="utf-8") as f:
-                self.setStyleSheet(f.read())
+        # === QSS: тема применяется один раз к QApplication (ui/theme_manager.py) ===
 
         # === Карточка (обёртка) ===
         card = QWidget(self)
@@ -73,7 +81,7 @@ class LoginWindow(QDialog):
         # SVG-лого — можешь заменить на свой QPixmap/QSvgWidget
         label_logo = QLabel("⦓Ξ⦔")
         label_logo.setAlignment(Qt.AlignCenter)
-        label_logo.setStyleSheet("font-size:38px;color:#fd1a29;margin-bottom:6px;letter-spacing:0.2em;")
+        label_logo.setObjectName("AxiomLogo")
         card_layout.addWidget(label_logo)
 
         # Заголовок (title)
@@ -85,24 +93,24 @@ class LoginWindow(QDialog):
         # Subtitle
         label_subtitle = QLabel("ACCESS TO SYSTEM CORE // PROTOCOL: RED")
         label_subtitle.setAlignment(Qt.AlignCenter)
-        label_subtitle.setStyleSheet("color:#fd1a29;font-size:16px;font-weight:600;letter-spacing:0.09em;margin-bottom:10px;")
+        label_subtitle.setObjectName("AxiomSubtitle")
         card_layout.addWidget(label_subtitle)
 
         # Разделитель
         line = QFrame()
         line.setFrameShape(QFrame.HLine)
-        line.setStyleSheet("background:#fd1a29;max-height:2px;min-height:2px;border-radius:1px;margin:14px 0 14px 0;")
+        line.setObjectName("AxiomLine")
         card_layout.addWidget(line)
 
         # Логин
         label_user = QLabel("Логин:")
-        label_user.setStyleSheet("color:#fd1a29;font-size:15px;font-weight:600;")
+        label_user.setProperty("class", "fieldLabel")
         input_user = QLineEdit()
         input_user.setPlaceholderText("Введите логин")
 
         # Пароль
         label_pass = QLabel("Пароль:")
-        label_pass.setStyleSheet("color:#fd1a29;font-size:15px;font-weight:600;")
+        label_pass.setProperty("class", "fieldLabel")
         input_pass = QLineEdit()
         input_pass.setPlaceholderText("Введите пароль")
         input_pass.setEchoMode(QLineEdit.Password)
@@ -132,13 +140,43 @@ class LoginWindow(QDialog):
 
         self.input_user = input_user
         self.input_pass = input_pass
+        self.button_login = button_login
+        self._check_thread = None
         button_login.clicked.connect(self.check_login)
 
     def check_login(self):
+        if self._check_thread is not None:
+            return  # проверка уже идёт (повторный Enter)
         user = self.input_user.text()
         pwd = self.input_pass.text()
-        if check_credentials(user, pwd):
+        self.set_busy(True)
+        self._check_thread = CredentialCheckThread(user, pwd, self)
+        self._check_thread.checked.connect(self._on_checked)
+        self._check_thread.finished.connect(self._check_thread.deleteLater)
+        self._check_thread.start()
+
+    def _on_checked(self, ok):
+        self._check_thread = None
+        self.set_busy(False)
+        if ok:
             self.accept()
         else:
             QMessageBox.warning(self, "Ошибка входа", "Неверный логин или пароль.")
+            self.input_pass.setFocus()
+
+    def set_busy(self, busy):
+        self.button_login.setEnabled(not busy)
+        self.button_login.setText("ПРОВЕРКА…" if busy else "ВОЙТИ")
+        self.input_user.setEnabled(not busy)
+        self.input_pass.setEnabled(not busy)
+        if busy:
+            self.setCursor(Qt.BusyCursor)
+        else:
+            self.unsetCursor()
+
+    def reject(self):
+        # Не закрывать диалог, пока поток проверки жив (QThread уничтожился бы на ходу)
+        if self._check_thread is not None:
+            self._check_thread.wait()
+        super().reject()
 
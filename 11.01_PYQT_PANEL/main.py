@@ -1,7 +1,7 @@
 # === AXIOM_PY_HEADER ===
 # FILE: main.py
 # TITLE: PYQT PANEL LAUNCHER
-# VERSION: v0.2
+# VERSION: v0.5
 # STATUS: DRAFT
 # ZONE: [11_SYSTEM_INTERFACE]
 # COMMENT: Точка входа для панели AXIOM SYSTEM V2. Подключает QSS-дизайн из ui/style/axiom_style.qss, запускает окна логина и основное окно.
@@ -10,52 +10,124 @@
 # === CHANGELOG ===
 # v0.1 — 2025-07-26 — Инициализация файла, базовая структура и описание.
 # v0.2 — 2025-07-26 — Подключение QSS-стиля, поддержка структуры ui/style/axiom_style.qss.
+# v0.3 — 2026-10-18 — Ленивый старт: main_window импортируется после логина (прогрев в фоне), флаг --startup-profile.
+# v0.4 — 2026-10-18 — QSS через ui/theme_manager.py: одна загрузка, одна тема на всё приложение.
+# v0.5 — 2026-10-18 — Флаги --perf / --perf-trace / --profile / --log-level (ui/perf.py, logging вместо print).
 # =======================
 
 """
 main.py — основной лаунчер панели AXIOM SYSTEM V2.
-- Подключает дизайн-стиль (QSS) из ui/style/axiom_style.qss
+- Подключает дизайн-стиль (QSS) через ui/theme_manager.py (тема RED по умолчанию)
 - Стартует окно логина (login_window.py)
 - При успехе запускает главное рабочее окно (main_window.py)
+- main_window (и всё, что за ним) импортируется лениво: прогрев в фоне, пока пользователь вводит логин
+- --startup-profile — разбивка времени старта по фазам
+- --perf PATH / --perf-trace PATH — замеры спанов (ui/perf.py) в JSON / Chrome trace при выходе
+- --profile PATH — cProfile всей сессии в PATH (.prof), топ по cumulative — в лог
+- --log-level LEVEL — уровень логов axiom.* (по умолчанию INFO)
 """
 
+import time
+_T0 = time.perf_counter()  # отсчёт фазы import — до загрузки PyQt5
+
 import sys
-import os
+import argparse
+import atexit
+import importlib
+import logging
+import threading
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer
 
 from login_window import LoginWindow   # Окно авторизации
-from main_window import AxiomMainWindow     # Главное рабочее окно
+from ui.theme_manager import theme_manager, DEFAULT_THEME
+from ui import perf
+# Главное рабочее окно (main_window.py) — импортируется лениво, см. warm_main_window()
+
+log = logging.getLogger("axiom.panel")
+
+class StartupProfile:
+    # Отметки фаз старта: печатаются таблицей при --startup-profile
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.marks = [("start", _T0)]
+
+    def mark(self, phase):
+        if self.enabled:
+            self.marks.append((phase, time.perf_counter()))
+
+    def report(self):
+        if not self.enabled:
+            return
+        print("=== AXIOM STARTUP PROFILE ===")
+        for (_, prev), (phase, t) in zip(self.marks, self.marks[1:]):
+            print(f"  {phase:<20} +{(t - prev) * 1000:8.1f} ms   (t={(t - _T0) * 1000:8.1f} ms)")
+
+def warm_main_window():
+    # Импорт модулей главного окна в фоне (только import — виджеты создаются в GUI-потоке)
+    def _warm():
+        for module in ("main_window", "ui.panel_svg_generator"):
+            try:
+                importlib.import_module(module)
+            except Exception:
+                pass  # ошибка всплывёт при обычном импорте, когда модуль понадобится
+    thread = threading.Thread(target=_warm, name="axiom-warmup", daemon=True)
+    thread.start()
+    return thread
 
 # === Блок подключения QSS-стиля ===
-def apply_axiom_style(app):
+def apply_axiom_style(app, theme=DEFAULT_THEME):
     """
-    Загружает QSS-стиль AXIOM из ui/style/axiom_style.qss
-    и применяет его ко всему приложению.
+    Применяет QSS-тему AXIOM ко всему приложению (один раз, через менеджер тем).
+    Окна не ставят собственных стилей — всё оформление берётся из темы.
     """
-    qss_path = os.path.join(
-        os.path.dirname(__file__),
-        "ui", "style", "axiom_style.qss"
-    )
-    if os.path.exists(qss_path):
-        with open(qss_path, "r", encoding="utf-8") as f:
-            style = f.read()
-            app.setStyleSheet(style)
-            print(f"AXIOM QSS Style loaded from {qss_path}")
-    else:
-        print(f"⚠️ QSS файл не найден: {qss_path}")
+    theme_manager.apply(app, theme)
+    log.info(f"AXIOM QSS theme applied: {theme}")
+
+def parse_launcher_args(argv):
+    # Флаги лаунчера; всё остальное (-style, -platform ...) уходит в QApplication
+    parser = argparse.ArgumentParser(description="AXIOM PANEL", add_help=False)
+    parser.add_argument("--startup-profile", action="store_true")
+    parser.add_argument("--perf", type=str, metavar="PATH")
+    parser.add_argument("--perf-trace", type=str, metavar="PATH")
+    parser.add_argument("--profile", type=str, metavar="PATH")
+    parser.add_argument("--log-level", type=str, default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    args, rest = parser.parse_known_args(argv[1:])
+    return args, argv[:1] + rest
+
+def _stop_profile(path):
+    log.info(perf.profile_stop(path))
 
 def main():
-    app = QApplication(sys.argv)
+    args, argv = parse_launcher_args(list(sys.argv))
+    logging.basicConfig(level=args.log_level, format="%(message)s")
+    if args.perf or args.perf_trace:
+        perf.dump_at_exit(args.perf, args.perf_trace)
+    if args.profile:
+        perf.profile_start()
+        atexit.register(_stop_profile, args.profile)
+    profile = StartupProfile(args.startup_profile)
+    profile.mark("import")
+
+    app = QApplication(argv)
+    profile.mark("QApplication")
     apply_axiom_style(app)  # подключаем QSS до создания окон
+    profile.mark("QSS")
 
     # === Запуск окна логина ===
     login = LoginWindow()
+    warm_main_window()  # пока пользователь вводит логин — грузим главное окно в фоне
+    QTimer.singleShot(0, lambda: profile.mark("login shown"))
     if login.exec_() == login.Accepted:
+        profile.mark("login accepted")
         # === Успешный вход: открываем основное окно ===
+        from main_window import AxiomMainWindow
         window = AxiomMainWindow()
         window.show()
+        QTimer.singleShot(0, lambda: (profile.mark("main window shown"), profile.report()))
         sys.exit(app.exec_())
     else:
+        profile.report()
         sys.exit()
 
 if __name__ == "__main__":
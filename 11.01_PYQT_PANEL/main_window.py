@@ -1,7 +1,7 @@
 # === AXIOM_PY_HEADER ===
 # FILE: main_window.py
 # TITLE: AXIOM MAIN PANEL — SYSTEM WINDOW (WITH SVG GENERATOR)
-# VERSION: v1.2
+# VERSION: v1.7
 # STATUS: ACTIVE
 # ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/]
 # COMMENT: Главное sci-fi окно с управлением и внешним QSS-дизайном.
@@ -13,26 +13,49 @@
 # v1.0 — 2025-07-26 — Первая sci-fi версия с GUI-интеграцией SVG Generator.
 # v1.1 — 2025-07-26 — Красная sci-fi версия с меню управления.
 # v1.2 — 2025-07-26 — Очистка, поддержка внешнего QSS, objectName для элементов.
+# v1.3 — 2026-10-18 — SVG Generator (QtSvg + ядро генератора) импортируется лениво — при первом открытии.
+# v1.4 — 2026-10-18 — Inline-стили заменены objectName-селекторами; переключение темы (red/default) из меню «Настройки».
+# v1.5 — 2026-10-18 — Иконка окна через ui/icon_service.py (PNG-кеш), путь от папки панели, а не от CWD.
+# v1.6 — 2026-10-18 — Статус-бар со сводкой perf.py, в «Настройках» — замеры, cProfile и выгрузка в perf/.
+# v1.7 — 2026-10-18 — Меню «📦 Модули» из NAV.json (ui/module_registry.py): подменю строятся при раскрытии, модули импортируются при открытии.
 # =======================
 
 import sys
 import os
+import time
+import logging
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, QFrame, QHBoxLayout
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, QFrame, QHBoxLayout,
+    QMenu, QActionGroup
 )
-from PyQt5.QtGui import QFont, QIcon
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QTimer
 
-from ui.panel_svg_generator import SVGGeneratorPanel
+from ui.theme_manager import theme_manager
+from ui.icon_service import icon_service
+from ui.module_registry import module_registry
+from ui import perf
+
+PANEL_DIR = os.path.dirname(os.path.abspath(__file__))
+WINDOW_ICON = os.path.join(PANEL_DIR, "ui", "style", "axiom_core.svg")
+PERF_DIR = os.path.join(PANEL_DIR, "perf")  # выгрузки замеров и .prof (не в git)
+PERF_REFRESH_MS = 1000
+
+log = logging.getLogger("axiom.panel")
+
+SVG_GENERATOR_MODULE = "11.01_PYQT_PANEL/ui/panel_svg_generator.py"  # ключ записи в module_registry
+
+# ui.panel_svg_generator (QtSvg + ядро генератора) и модули секторов импортируются в open_module()
 
 class AxiomMainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("AXIOM PANEL — Main")
-        self.setWindowIcon(QIcon("ui/style/axiom_core.svg"))
+        self.setWindowIcon(icon_service.icon(WINDOW_ICON))
         self.resize(470, 440)
-        self.svg_panel = None
+        self.module_windows = {}  # путь записи NAV -> открытое окно модуля
         self.init_ui()
+        self.init_perf_status()
 
     def init_ui(self):
         # Центрируем карточку как в login_window
@@ -51,7 +74,7 @@ class AxiomMainWindow(QMainWindow):
         # SVG-лого или символ
         label_logo = QLabel("⦓Ξ⦔")
         label_logo.setAlignment(Qt.AlignCenter)
-        label_logo.setStyleSheet("font-size:38px;color:#fd1a29;margin-bottom:6px;letter-spacing:0.2em;")
+        label_logo.setObjectName("AxiomLogo")
         card_layout.addWidget(label_logo)
 
         # Заголовок (title)
@@ -63,13 +86,13 @@ class AxiomMainWindow(QMainWindow):
         # Subtitle
         label_subtitle = QLabel("SYSTEM CORE // PROTOCOL: RED")
         label_subtitle.setAlignment(Qt.AlignCenter)
-        label_subtitle.setStyleSheet("color:#fd1a29;font-size:16px;font-weight:600;letter-spacing:0.09em;margin-bottom:10px;")
+        label_subtitle.setObjectName("AxiomSubtitle")
         card_layout.addWidget(label_subtitle)
 
         # Разделитель
         line = QFrame()
         line.setFrameShape(QFrame.HLine)
-        line.setStyleSheet("background:#fd1a29;max-height:2px;min-height:2px;border-radius:1px;margin:14px 0 14px 0;")
+        line.setObjectName("AxiomLine")
         card_layout.addWidget(line)
 
         # --- Sci-fi меню управления ---
@@ -88,12 +111,16 @@ class AxiomMainWindow(QMainWindow):
         settings_btn.setObjectName("settingsBtn")
         settings_btn.setFont(QFont("JetBrains Mono", 12))
         settings_btn.setCursor(Qt.PointingHandCursor)
+        settings_menu = self.build_theme_menu(settings_btn)
+        self.add_perf_actions(settings_menu)
+        settings_btn.setMenu(settings_menu)
         menu_layout.addWidget(settings_btn)
 
         modules_btn = QPushButton("📦 Модули")
         modules_btn.setObjectName("modulesBtn")
         modules_btn.setFont(QFont("JetBrains Mono", 12))
         modules_btn.setCursor(Qt.PointingHandCursor)
+        modules_btn.setMenu(self.build_modules_menu(modules_btn))
         menu_layout.addWidget(modules_btn)
 
         card_layout.addLayout(menu_layout)
@@ -108,21 +135,132 @@ class AxiomMainWindow(QMainWindow):
         vbox.addStretch(1)
         self.setCentralWidget(central_widget)
 
-    def open_svg_generator(self):
-        if not self.svg_panel or not self.svg_panel.isVisible():
-            self.svg_panel = SVGGeneratorPanel()
-            self.svg_panel.show()
+    def build_theme_menu(self, parent):
+        # Переключение темы на лету: один setStyleSheet на QApplication
+        menu = QMenu(parent)
+        group = QActionGroup(menu)
+        for name in theme_manager.themes():
+            action = menu.addAction(f"Тема: {name.upper()}")
+            action.setCheckable(True)
+            action.setChecked(name == theme_manager.current)
+            action.triggered.connect(lambda _, n=name: theme_manager.switch(n))
+            group.addAction(action)
+        return menu
+
+    # ---- Инструментация (ui/perf.py) ----
+    def init_perf_status(self):
+        # Сводка самых дорогих спанов; таймер обновляет её, только пока замеры включены
+        self.perf_label = QLabel()
+        self.perf_label.setObjectName("AxiomPerfStatus")
+        self.statusBar().addPermanentWidget(self.perf_label, 1)
+        self.perf_timer = QTimer(self)
+        self.perf_timer.setInterval(PERF_REFRESH_MS)
+        self.perf_timer.timeout.connect(self.refresh_perf_status)
+        self.set_perf_enabled(perf.is_enabled())
+
+    def refresh_perf_status(self):
+        self.perf_label.setText(perf.summary())
+
+    def set_perf_enabled(self, enabled):
+        if enabled:
+            perf.enable(trace=True)
+            self.refresh_perf_status()
+            self.perf_timer.start()
         else:
-            self.svg_panel.raise_()
-            self.svg_panel.activateWindow()
+            perf.disable()
+            self.perf_timer.stop()
+            self.perf_label.setText("")
+
+    def add_perf_actions(self, menu):
+        menu.addSeparator()
+        perf_action = menu.addAction("Замеры (статус-бар)")
+        perf_action.setCheckable(True)
+        perf_action.setChecked(perf.is_enabled())
+        perf_action.toggled.connect(self.set_perf_enabled)
+
+        profile_action = menu.addAction("cProfile")
+        profile_action.setCheckable(True)
+        profile_action.setChecked(perf.profiling())
+        profile_action.toggled.connect(self.toggle_profile)
+
+        dump_action = menu.addAction("Сохранить замеры (JSON + trace)")
+        dump_action.triggered.connect(self.dump_perf)
+
+    def _perf_path(self, suffix):
+        os.makedirs(PERF_DIR, exist_ok=True)
+        return os.path.join(PERF_DIR, time.strftime("panel_%Y%m%d_%H%M%S") + suffix)
+
+    def toggle_profile(self, enabled):
+        if enabled:
+            perf.profile_start()
+            self.statusBar().showMessage("cProfile: запись...")
+            return
+        path = self._perf_path(".prof")
+        log.info(perf.profile_stop(path))
+        self.statusBar().showMessage(f"cProfile: {path}", 5000)
+
+    def dump_perf(self):
+        json_path = perf.dump_json(self._perf_path(".perf.json"))
+        trace_path = perf.dump_chrome_trace(self._perf_path(".trace.json"))
+        log.info(f"perf: {json_path}, {trace_path}")
+        self.statusBar().showMessage(f"Замеры: {json_path}", 5000)
+
+    # ---- Модули (ui/module_registry.py) ----
+    def build_modules_menu(self, parent, folder=""):
+        # Пустое меню; NAV читается и пункты создаются при первом раскрытии (каждого уровня отдельно)
+        menu = QMenu(parent)
+        menu.aboutToShow.connect(lambda: self.populate_modules_menu(menu, folder))
+        return menu
+
+    def populate_modules_menu(self, menu, folder):
+        if menu.actions():
+            return
+        try:
+            entries = module_registry.children(folder)
+        except OSError as e:
+            log.error(f"❗ Реестр модулей: {e}")
+            entries = []
+        if not entries:
+            menu.addAction("(пусто)").setEnabled(False)
+            return
+        for entry in entries:
+            if entry.kind == "folder":
+                sub = self.build_modules_menu(menu, entry.path)
+                sub.setTitle(f"📁 {entry.title}")
+                sub.setEnabled(module_registry.has_children(entry.path))
+                menu.addMenu(sub)
+                continue
+            action = menu.addAction(entry.title)
+            action.setToolTip(entry.comment)
+            action.setStatusTip(f"{entry.path} — {entry.status}" if entry.status else entry.path)
+            action.setEnabled(bool(entry.entry))
+            action.triggered.connect(lambda _, p=entry.path: self.open_module(p))
+        menu.setToolTipsVisible(True)
+
+    def open_module(self, path):
+        window = self.module_windows.get(path)
+        if window is not None and window.isVisible():
+            window.raise_()
+            window.activateWindow()
+            return window
+        try:
+            factory = module_registry.resolve(path)
+        except (ImportError, LookupError, AttributeError) as e:
+            log.error(f"❗ Модуль {path}: {e}")
+            self.statusBar().showMessage(f"Модуль не открыт: {e}", 5000)
+            return None
+        window = factory()
+        self.module_windows[path] = window
+        window.show()
+        return window
+
+    def open_svg_generator(self):
+        return self.open_module(SVG_GENERATOR_MODULE)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    # Используем твой axiom_red.qss (файл уже готов и лежит в ui/style)
-    qss_path = os.path.join(os.path.dirname(__file__), "ui", "style", "axiom_red.qss")
-    if os.path.exists(qss_path):
-        with open(qss_path, "r", encoding="utf-8") as f:
-            app.setStyleSheet(f.read())
+    # Тема axiom_red.qss через общий менеджер тем (ui/style)
+    theme_manager.apply(app, "red")
     window = AxiomMainWindow()
     window.show()
     sys.exit(app.exec_())
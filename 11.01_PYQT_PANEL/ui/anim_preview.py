@@ -0,0 +1,88 @@
+# === AXIOM_PY_HEADER ===
+# FILE: anim_preview.py
+# TITLE: AXIOM SVG GENERATOR — ANIMATION PREVIEW PLAYER
+# VERSION: v1.0
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Проигрывание SMIL-анимации в панели из кольцевого буфера заранее растеризованных кадров.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — prerender_cycle() (фон, QImage) + AnimationPlayer (QLabel, FrameRing, кадр по прошедшему времени).
+# =======================
+
+"""
+anim_preview.py — режим «Анимация» в предпросмотре SVGGeneratorPanel.
+QSvgWidget перечитывает и перерисовывает весь документ на каждый тик анимации. Здесь один цикл
+растеризуется заранее (prerender_cycle, в пуле потоков) в кадры нужного размера, а тик таймера —
+только setPixmap() готового кадра из FrameRing.
+Память: кадров не больше PREVIEW_MAX_FRAMES (fps снижается для длинных циклов), сторона не больше PREVIEW_MAX_PX.
+"""
+
+from PyQt5.QtCore import Qt, QElapsedTimer, QTimer
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QLabel
+
+from .icon_service import rasterize_image
+from .svg_animate import AnimatedSVG, FrameRing
+from .perf import span
+
+PREVIEW_FPS = 24
+PREVIEW_MAX_FRAMES = 144  # 6 с при 24 fps; ~37 MB при 256 px
+PREVIEW_MAX_PX = 256
+
+
+def prerender_cycle(svg_bytes, px, fps=PREVIEW_FPS, max_frames=PREVIEW_MAX_FRAMES):
+    # -> (список QImage одного цикла, фактический fps, длительность цикла); вызывается вне GUI-потока
+    anim = AnimatedSVG(svg_bytes)
+    cycle = anim.cycle_duration()
+    if not anim.animated or cycle <= 0:
+        return [rasterize_image(svg_bytes, px)], fps, 0.0
+    fps = min(fps, max_frames / cycle)
+    with span("anim.prerender"):
+        images = [rasterize_image(anim.frame(t).encode("utf-8"), px) for t in anim.frame_times(fps, cycle)]
+    return images, fps, cycle
+
+
+class AnimationPlayer(QLabel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("AnimationPlayer")
+        self.setAlignment(Qt.AlignCenter)
+        self.ring = FrameRing()
+        self._clock = QElapsedTimer()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    def load_frames(self, images, fps, dpr=1.0):
+        # QPixmap только в GUI-потоке: конвертация один раз на цикл, не на тик
+        pixmaps = []
+        for image in images:
+            pm = QPixmap.fromImage(image)
+            pm.setDevicePixelRatio(dpr)
+            pixmaps.append(pm)
+        self.ring.reset(pixmaps, fps)
+        self.setPixmap(pixmaps[0])
+        if len(pixmaps) > 1:
+            self._timer.setInterval(max(1, round(1000 / fps)))
+            self._clock.start()
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    def stop(self):
+        self._timer.stop()
+
+    def _tick(self):
+        self.setPixmap(self.ring.at(self._clock.elapsed() / 1000))
+
+    def hideEvent(self, event):
+        self.stop()
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if len(self.ring) > 1:
+            self._clock.start()
+            self._timer.start()
@@ -1,7 +1,7 @@
 # === AXIOM_PY_HEADER ===
 # FILE: generate_svg.py
 # TITLE: AXIOM SVG GENERATOR — CORE MODULE
-# VERSION: v1.0
+# VERSION: v2.9
 # STATUS: ACTIVE / EXPANDABLE
 # ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
 # COMMENT: Ядро SVG-генератора. Автоматизация создания sci-fi svg на основе шаблонов и параметров.
@@ -9,6 +9,25 @@
 # DATE: 2025-07-26
 # === CHANGELOG ===
 # v1.0 — 2025-07-26 — Стартовая версия генератора (ядро, шаблоны, CLI, presets).
+# v1.1 — 2026-10-18 — Кеш скомпилированных шаблонов (template_cache.py), счётчики hit/miss.
+# v1.2 — 2026-10-18 — render_to_string()/render_to_bytes(): рендер в память без записи на диск.
+# v1.3 — 2026-10-18 — Пакетный режим CLI (--batch / --all-presets / --jobs) через svg_batch.py.
+# v1.4 — 2026-10-18 — template_params(): список параметров шаблона с типами (кешируется с шаблоном).
+# v1.5 — 2026-10-18 — Встроенный шаблонизатор svg_template.py ({% if %}, {% for %}, default) вместо str.format.
+# v1.6 — 2026-10-18 — Инкрементальный режим (output_index.py): пропуск неизменённых SVG, атомарная запись, --force.
+# v1.7 — 2026-10-18 — Пресеты через общий PresetStore (preset_store.py); --preset берёт params и шаблон пресета, --presets PATH.
+# v1.8 — 2026-10-18 — --png 16,32,64,128@2x: растеризация выходов в style/png через icon_service.py (пул процессов, PNG-кеш).
+# v1.9 — 2026-10-18 — --atlas NAME: спрайт <symbol> + PNG-атлас + JSON-индекс из пресетов/манифеста (svg_atlas.py).
+# v2.0 — 2026-10-18 — --watch: перерендер затронутых выходов при правке шаблонов/пресетов (svg_watch.py), --poll, --debounce.
+# v2.1 — 2026-10-18 — Стадия оптимизации выхода (svg_optimize.py): optimize=0..2, --optimize, отчёт о размере и времени разбора.
+# v2.2 — 2026-10-18 — --sweep: семейства вариантов (декартово произведение осей) потоковым рендером (svg_sweep.py).
+# v2.3 — 2026-10-18 — --serve: демон рендера на asyncio (svg_daemon.py), unix-сокет или --port; клиент — svg_client.py.
+# v2.4 — 2026-10-18 — Спаны perf.py (template / format / optimize / write), logging вместо print в render(), --log-level, --perf / --perf-trace.
+# v2.5 — 2026-10-18 — render_animation() и --frames png|apng|gif, --fps, --frame-size: кадры SMIL-цикла (svg_animate.py).
+# v2.6 — 2026-10-18 — render_output() (байты + запись индекса) и --archive PATH: пакет/перебор в один zip/tar (svg_sink.py).
+# v2.7 — 2026-10-18 — Предкомпилированный бандл шаблонов и пресетов (template_bundle.py): загрузка при старте, --build-bundle, --no-bundle.
+# v2.8 — 2026-10-18 — --archive без --batch / --all-presets / --sweep — ошибка, а не молча файл в style/.
+# v2.9 — 2026-10-18 — Проверки --archive — до выбора режима: с --serve / --watch / --atlas / --build-bundle / --list — ошибка.
 # =======================
 
 """
@@ -20,76 +39,399 @@ generate_svg.py — основной модуль генерации SVG для
 import os
 import argparse
 import json
+import logging
+import sys
+
+try:
+    from .perf import span, incr, dump_at_exit
+    from .template_cache import TemplateCache
+    from .svg_template import SVGTemplate, TemplateSyntaxError
+    from .output_index import OutputIndex, atomic_write, content_digest, params_digest
+    from .preset_store import PresetStore, find_presets_path
+    from .svg_optimize import optimize_svg, OPTIMIZE_LEVELS
+    from .template_bundle import apply_bundle, build_bundle
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from perf import span, incr, dump_at_exit
+    from template_cache import TemplateCache
+    from svg_template import SVGTemplate, TemplateSyntaxError
+    from output_index import OutputIndex, atomic_write, content_digest, params_digest
+    from preset_store import PresetStore, find_presets_path
+    from svg_optimize import optimize_svg, OPTIMIZE_LEVELS
+    from template_bundle import apply_bundle, build_bundle
+
+log = logging.getLogger("axiom.svg")
 
 class AxiomSVGGenerator:
-    def __init__(self, templates_dir="templates", style_dir="style"):
+    def __init__(self, templates_dir="templates", style_dir="style", cache_size=64, incremental=False,
+                 presets_path=None, optimize=0, bundle=True):
         self.templates_dir = templates_dir
         self.style_dir = style_dir
+        # Пресеты: общий ленивый PresetStore (json / jsonl / папка-шарды)
+        self.preset_store = PresetStore(presets_path or find_presets_path(templates_dir))
+        self.template_cache = TemplateCache(compiler=SVGTemplate, max_entries=cache_size)
+        self.verbose = True  # «SVG создан: ...» после render() — INFO (иначе DEBUG)
+        # Инкрементальный режим: неизменённые выходы (тот же шаблон + параметры) не перезаписываются
+        self.output_index = OutputIndex(style_dir) if incremental else None
+        self.write_stats = {"written": 0, "skipped": 0}
+        # Пост-обработка выхода: 0 — как есть, 1 — без комментариев/пробелов, 2 — + числа и дефолты
+        if optimize not in OPTIMIZE_LEVELS:
+            raise ValueError(f"optimize must be one of {OPTIMIZE_LEVELS}")
+        self.optimize = optimize
+        # Бандл (templates/.axiom_bundle.bin): свежие шаблоны и пресеты — без разбора; bundle — True / False / путь
+        self.bundle_stats = None
+        if bundle:
+            self.bundle_stats = apply_bundle(self, bundle if isinstance(bundle, str) else None)
 
-    def render(self, template_name, params, output_name):
-        # Загрузка шаблона
+    def get_template(self, template_name):
+        # Скомпилированный шаблон из кеша (перечитывается только при изменении файла)
         tpl_path = os.path.join(self.templates_dir, template_name)
-        if not os.path.exists(tpl_path):
-            raise FileNotFoundError(f"Template {template_name} not found in {self.templates_dir}")
-        with open(tpl_path, encoding="utf-8") as f:
-            template = f.read()
-        svg_code = template.format(**params)
+        try:
+            return self.template_cache.get(tpl_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template {template_name} not found in {self.templates_dir}") from None
+        except TemplateSyntaxError as e:
+            raise TemplateSyntaxError(f"{template_name}: {e}") from None
+
+    def template_params(self, template_name):
+        # Параметры шаблона {имя: color|opacity|size|text}; разбор — один раз на версию файла
+        return dict(self.get_template(template_name).params)
+
+    def cache_stats(self):
+        # Счётчики кеша шаблонов: hits / misses / evictions / entries
+        return self.template_cache.stats()
+
+    def render_to_string(self, template_name, params):
+        # Рендер в строку — без записи на диск (предпросмотр, пайплайны)
+        with span("svg.template"):
+            template = self.get_template(template_name)
+        return self._format(template, params)
+
+    def _format(self, template, params):
+        with span("svg.format"):
+            svg = template.render(params)
+        if self.optimize:
+            with span("svg.optimize"):
+                svg = optimize_svg(svg, self.optimize)
+        return svg
+
+    def render_to_bytes(self, template_name, params):
+        # Рендер в UTF-8 байты (например, для QSvgWidget.load(QByteArray))
+        return self.render_to_string(template_name, params).encode("utf-8")
+
+    def render_animation(self, template_name, params):
+        # Анимированный шаблон (params animate, *_dur ...) -> AnimatedSVG: кадр на любой момент цикла
+        try:
+            from .svg_animate import AnimatedSVG
+        except ImportError:
+            from svg_animate import AnimatedSVG
+        return AnimatedSVG(self.render_to_string(template_name, params))
+
+    def _variant(self):
+        return f"opt{self.optimize}" if self.optimize else ""
+
+    def render_output(self, template_name, params):
+        # -> (байты SVG, запись индекса) без записи на диск: выход для sink'а (svg_sink.py)
+        with span("svg.template"):
+            template = self.get_template(template_name)
+        svg_bytes = self._format(template, params).encode("utf-8")
+        return svg_bytes, {
+            "hash": content_digest(template.source, params, self._variant()),
+            "params_hash": params_digest(params),
+            "template": template_name,
+        }
+
+    def render(self, template_name, params, output_name, force=False):
+        with span("svg.template"):
+            template = self.get_template(template_name)
         out_path = os.path.join(self.style_dir, output_name)
-        with open(out_path, "w", encoding="utf-8") as out:
-            out.write(svg_code)
-        print(f"SVG создан: {out_path}")
+        digest = None
+        if self.output_index is not None:
+            digest = content_digest(template.source, params, self._variant())
+            if not force and self.output_index.is_current(output_name, digest, out_path):
+                self.write_stats["skipped"] += 1
+                incr("svg.skipped")
+                return out_path
+        svg_bytes = self._format(template, params).encode("utf-8")
+        with span("svg.write"):
+            atomic_write(out_path, svg_bytes)
+        self.write_stats["written"] += 1
+        incr("svg.written")
+        if digest is not None:
+            self.output_index.set(output_name, {
+                "hash": digest, "size": len(svg_bytes), "template": template_name,
+            })
+        log.log(logging.INFO if self.verbose else logging.DEBUG, "SVG создан: %s", out_path)
         return out_path
 
+    def build_bundle(self, path=None):
+        # Собрать бандл из текущих шаблонов и пресетов -> (путь, сводка)
+        return build_bundle(self.templates_dir, self.preset_store.path, path)
+
+    def save_index(self):
+        # Сохранить индекс выходов (один раз в конце прогона, а не после каждого файла)
+        if self.output_index is not None:
+            self.output_index.save()
+
     def list_templates(self):
         # Вывод доступных шаблонов
         return [f for f in os.listdir(self.templates_dir) if f.endswith('.svg.j2')]
 
-    def load_presets(self, presets_file="svg_presets.json"):
-        # (опционально) загрузка готовых профилей
-        p_path = os.path.join(self.templates_dir, presets_file)
-        if os.path.exists(p_path):
-            with open(p_path, encoding="utf-8") as f:
-                return json.load(f)
-        return {}
+    def load_presets(self):
+        # Совместимость: все пресеты в формате svg_presets.json ({"presets": {...}})
+        return self.preset_store.as_dict()
 
 # ==== CLI ====
-if __name__ == "__main__":
+def report_optimization(gen, items, sample=200):
+    # Размер и время разбора: тот же рендер без оптимизации против текущего уровня (выборка до sample)
+    try:
+        from .svg_optimize import optimization_report
+    except ImportError:
+        from svg_optimize import optimization_report
+    pairs = []
+    for item in items[:sample]:
+        raw = gen.get_template(item["template"]).render(item.get("params", {}))
+        pairs.append((raw.encode("utf-8"), optimize_svg(raw, gen.optimize).encode("utf-8")))
+    print(optimization_report(pairs, gen.optimize)[0])
+
+def export_png(gen, outputs, spec, jobs=None):
+    # Выходы (имена в style/) -> PNG во всех размерах; 1 — если были ошибки
+    try:
+        from .icon_service import run_png_export
+    except ImportError:
+        from icon_service import run_png_export
+    paths = [os.path.join(gen.style_dir, name) for name in outputs]
+    try:
+        results = run_png_export(paths, spec, gen.style_dir, jobs=jobs)
+    except ValueError as e:
+        print(f"❗ {e}")
+        return 1
+    return 1 if any(r[1] for r in results) else 0
+
+def export_frames(gen, template, params, output, fmt, fps, px, jobs=None):
+    # Один цикл анимации выхода -> style/frames/<stem>/ (png) или style/<stem>.apng|.gif; 1 — при ошибке
+    try:
+        from .svg_animate import run_frame_export
+    except ImportError:
+        from svg_animate import run_frame_export
+    stem = os.path.splitext(os.path.basename(output))[0]
+    try:
+        run_frame_export(gen.render_to_string(template, params), gen.style_dir, stem, fmt, fps, px, jobs)
+    except (ValueError, RuntimeError) as e:
+        print(f"❗ {e}")
+        return 1
+    return 0
+
+def main(argv=None):
     parser = argparse.ArgumentParser(description="AXIOM SVG GENERATOR")
     parser.add_argument("--template", "-t", type=str, required=False, help="Название шаблона (пример: core.svg.j2)")
     parser.add_argument("--params", "-p", type=str, help="Параметры в формате JSON (пример: '{\"color\": \"#ae51ff\", \"size\": 56}')")
     parser.add_argument("--out", "-o", type=str, help="Имя svg-файла на выходе (например, axiom_core.svg)")
     parser.add_argument("--preset", type=str, help="Имя профиля из svg_presets.json (пример: VIKTOR_CORE)")
+    parser.add_argument("--presets", type=str, help="Файл/папка пресетов (.json, .jsonl или папка-шарды); по умолчанию svg_presets.json")
     parser.add_argument("--list", action="store_true", help="Показать все шаблоны")
-    args = parser.parse_args()
+    parser.add_argument("--batch", type=str, help="Пакетный рендер по манифесту JSON/JSONL (template, params, output)")
+    parser.add_argument("--all-presets", action="store_true", help="Пакетный рендер всех пресетов из svg_presets.json")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Число воркеров для пакетного режима (по умолчанию — по ядру)")
+    parser.add_argument("--force", action="store_true", help="Перезаписать выходы, даже если шаблон и параметры не менялись")
+    parser.add_argument("--archive", type=str, metavar="PATH",
+                        help="--batch / --all-presets / --sweep: все выходы в один архив style/PATH (.zip, .tar, .tar.gz, .tar.xz) с индексом")
+    parser.add_argument("--png", type=str, help="Растеризовать выходы в style/png (пример: 16,32,64,128@2x); без рендера — все SVG из style/")
+    parser.add_argument("--atlas", type=str, help="Собрать атлас NAME (style/NAME.sprite.svg, .atlas.png, .atlas.json) из --batch или всех пресетов")
+    parser.add_argument("--atlas-cell", type=str, default="64", help="Ячейка PNG-атласа (пример: 64 или 64@2x)")
+    parser.add_argument("--atlas-svg-only", action="store_true", help="Атлас без PNG-текстуры (только спрайт и индекс)")
+    parser.add_argument("--watch", action="store_true", help="Следить за шаблонами и пресетами (или --batch манифестом) и перерендеривать затронутые выходы")
+    parser.add_argument("--poll", action="store_true", help="--watch через опрос файлов вместо inotify")
+    parser.add_argument("--debounce", type=int, default=100, help="--watch: склейка пачки событий, мс (по умолчанию 100)")
+    parser.add_argument("--optimize", type=int, choices=OPTIMIZE_LEVELS, default=0,
+                        help="Оптимизация выхода: 0 — нет, 1 — комментарии/пробелы, 2 — + округление чисел и атрибуты по умолчанию")
+    parser.add_argument("--sweep", nargs="+", metavar="AXIS",
+                        help="Перебор параметров поверх --preset/--params (пример: color=hsl(0..360/64) size=16,32,64)")
+    parser.add_argument("--serve", action="store_true", help="Запустить демон рендера (прогретые шаблоны, JSON-строки; клиент — svg_client.py)")
+    parser.add_argument("--socket", type=str, help="--serve: путь unix-сокета (по умолчанию во временной папке)")
+    parser.add_argument("--port", type=int, help="--serve: TCP-порт на localhost вместо unix-сокета")
+    parser.add_argument("--frames", type=str, choices=["png", "apng", "gif"],
+                        help="Кадры одного цикла SMIL-анимации выхода: png (style/frames/<имя>/), apng или gif (нужен Pillow)")
+    parser.add_argument("--fps", type=int, default=24, help="--frames: кадров в секунду (по умолчанию 24)")
+    parser.add_argument("--frame-size", type=int, help="--frames: размер кадра, px (по умолчанию — size из параметров)")
+    parser.add_argument("--build-bundle", action="store_true",
+                        help="Собрать templates/.axiom_bundle.bin: все шаблоны (байткод) и пресеты для быстрого старта")
+    parser.add_argument("--no-bundle", action="store_true", help="Не читать бандл — компилировать шаблоны из исходников")
+    parser.add_argument("--log-level", type=str, default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="Уровень логов axiom.* (DEBUG — в том числе каждый записанный SVG)")
+    parser.add_argument("--perf", type=str, metavar="PATH", help="Замеры спанов (perf.py): агрегаты JSON в PATH при выходе")
+    parser.add_argument("--perf-trace", type=str, metavar="PATH", help="То же в формате Chrome trace (chrome://tracing, Perfetto)")
+    args = parser.parse_args(argv)
+
+    # Сводки модулей (Batch: / PNG: / Atlas: / [watch] ...) — в stdout, как прежде
+    logging.basicConfig(level=args.log_level, format="%(message)s", stream=sys.stdout)
+    if args.perf or args.perf_trace:
+        # Спаны пишет только этот процесс: воркеры пакетного режима не замеряются
+        dump_at_exit(args.perf, args.perf_trace)
+
+    # Архив: выходы пакета / перебора не файлами в style/, а одним zip / tar.
+    # Проверяется до выбора режима — иначе --serve / --watch / --atlas молча игнорировали бы флаг
+    sink = None
+    if args.archive:
+        try:
+            from .svg_sink import open_sink, archive_mode
+        except ImportError:
+            from svg_sink import open_sink, archive_mode
+        if archive_mode(args.archive) is None:
+            print("❗ --archive: нужен файл .zip, .tar, .tar.gz / .tgz, .tar.xz или .tar.bz2")
+            exit(1)
+        if args.serve or args.watch or args.atlas or args.build_bundle or args.list:
+            print("❗ --archive не сочетается с --serve / --watch / --atlas / --build-bundle / --list")
+            exit(1)
+        if args.png or args.frames:
+            print("❗ --archive не сочетается с --png / --frames: растеризация читает SVG из style/")
+            exit(1)
+        if not (args.batch or args.all_presets or args.sweep):
+            print("❗ --archive — только для --batch / --all-presets / --sweep: одиночный рендер пишется в style/")
+            exit(1)
 
     gen = AxiomSVGGenerator(
         templates_dir="templates",
-        style_dir="style"
+        style_dir="style",
+        incremental=True,
+        presets_path=args.presets,
+        optimize=args.optimize,
+        bundle=not (args.no_bundle or args.build_bundle)
     )
 
+    if args.build_bundle:
+        path, info = gen.build_bundle()
+        print(f"Bundle: {path} — {info['templates']} templates, {info['presets']} presets, "
+              f"{info['bytes'] / 1024:.1f} KB")
+        exit(0)
+
     if args.list:
         print("Доступные шаблоны:")
         for t in gen.list_templates():
             print(f" - {t}")
         exit(0)
 
+    # Только растеризация: все SVG из style/
+    if args.png and not (args.batch or args.all_presets or args.template or args.preset):
+        svgs = sorted(f for f in os.listdir(gen.style_dir) if f.endswith(".svg"))
+        exit(export_png(gen, svgs, args.png, args.jobs))
+
+    # Демон: один прогретый генератор на всё время работы
+    if args.serve:
+        try:
+            from .svg_daemon import run_daemon, DEFAULT_SOCKET
+        except ImportError:
+            from svg_daemon import run_daemon, DEFAULT_SOCKET
+        run_daemon(gen, socket_path=args.socket or DEFAULT_SOCKET, port=args.port)
+        exit(0)
+
+    # Наблюдение: граф шаблон/пресет -> выходы, перерендер только затронутого
+    if args.watch:
+        try:
+            from .svg_watch import WatchSession
+        except ImportError:
+            from svg_watch import WatchSession
+        gen.verbose = False
+        WatchSession(gen, manifest=args.batch).run(poll=args.poll, debounce=args.debounce / 1000)
+        exit(0)
+
+    # Атлас: все иконки в один спрайт + одну PNG-текстуру, без отдельных файлов
+    if args.atlas:
+        try:
+            from .svg_batch import load_manifest, items_from_presets
+            from .svg_atlas import run_atlas
+            from .icon_service import parse_sizes
+        except ImportError:
+            from svg_batch import load_manifest, items_from_presets
+            from svg_atlas import run_atlas
+            from icon_service import parse_sizes
+        items = load_manifest(args.batch) if args.batch else items_from_presets(gen.preset_store)
+        cells = parse_sizes(args.atlas_cell)
+        if len(cells) != 1:
+            print("❗ --atlas-cell: нужен один размер (например, 64@2x)")
+            exit(1)
+        _, errors = run_atlas(gen, items, args.atlas, cell=cells[0][0], dpr=cells[0][1], png=not args.atlas_svg_only)
+        exit(1 if errors else 0)
+
+    # Пакетный режим: манифест или все пресеты -> пул процессов
+    if args.batch or args.all_presets:
+        try:
+            from .svg_batch import load_manifest, items_from_presets, run_batch
+        except ImportError:
+            from svg_batch import load_manifest, items_from_presets, run_batch
+        items = []
+        if args.batch:
+            items.extend(load_manifest(args.batch))
+        if args.all_presets:
+            items.extend(items_from_presets(gen.preset_store))
+        if args.archive:
+            sink = open_sink(os.path.join(gen.style_dir, args.archive))
+        results = run_batch(items, gen.templates_dir, gen.style_dir, jobs=args.jobs, force=args.force,
+                            optimize=args.optimize, sink=sink)
+        failed = any(r[2] for r in results)
+        if args.optimize:
+            report_optimization(gen, [items[r[0]] for r in results if not r[2]])
+        if args.png:
+            failed = export_png(gen, [r[1] for r in results if not r[2]], args.png, args.jobs) or failed
+        exit(1 if failed else 0)
+
     # Параметры по preset'у (если выбран)
     params = {}
     if args.preset:
-        presets = gen.load_presets()
-        preset_data = presets.get("presets", {}).get(args.preset)
+        preset_data = gen.preset_store.get(args.preset)
         if not preset_data:
             print(f"Профиль {args.preset} не найден в svg_presets.json")
             exit(1)
-        params.update(preset_data)
+        params.update(preset_data.get("params", {}))
+        args.template = args.template or preset_data.get("template")
 
     # Параметры через CLI (приоритетны)
     if args.params:
         params.update(json.loads(args.params))
 
+    # Перебор: оси поверх базовых параметров, имена <stem>_<номер>.svg
+    if args.sweep:
+        try:
+            from .svg_sweep import parse_axes, run_sweep
+        except ImportError:
+            from svg_sweep import parse_axes, run_sweep
+        if not args.template:
+            print("❗ Для --sweep укажи шаблон --template или --preset")
+            exit(1)
+        try:
+            axes = parse_axes(args.sweep)
+        except ValueError as e:
+            print(f"❗ {e}")
+            exit(1)
+        if args.out:
+            stem = os.path.splitext(args.out)[0]
+        elif args.preset:
+            stem = args.preset.lower()
+        else:
+            stem = args.template.split(".")[0]
+        if args.archive:
+            sink = open_sink(os.path.join(gen.style_dir, args.archive))
+        counts = run_sweep(args.template, axes, params, stem, gen.templates_dir, gen.style_dir,
+                           jobs=args.jobs, optimize=args.optimize, sink=sink)
+        exit(1 if counts["failed"] else 0)
+
     # Проверка обязательных
     if not args.template or not args.out or not params:
         print("❗ Укажи шаблон --template, выходной файл --out и параметры (через --params и/или --preset)!")
         exit(1)
 
-    gen.render(args.template, params, args.out)
+    gen.render(args.template, params, args.out, force=args.force)
+    gen.save_index()
+    if args.optimize:
+        report_optimization(gen, [{"template": args.template, "params": params}])
+    print(f"Записано: {gen.write_stats['written']}, пропущено (без изменений): {gen.write_stats['skipped']}")
+    status = 0
+    if args.png:
+        status |= export_png(gen, [args.out], args.png, args.jobs)
+    if args.frames:
+        px = args.frame_size or int(float(params.get("size", 56)))
+        status |= export_frames(gen, args.template, params, args.out, args.frames, args.fps, px, args.jobs)
+    if status:
+        exit(status)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+# === AXIOM_PY_HEADER ===
+# FILE: icon_service.py
+# TITLE: AXIOM ICON SERVICE
+# VERSION: v1.2
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Растеризация SVG в QPixmap/PNG с кешем в памяти и на диске, multi-DPI варианты иконок.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — IconService: LRU QPixmap + PNG-кеш по хешу SVG и размеру; экспорт --png в пуле процессов.
+# v1.1 — 2026-10-18 — rasterize_image(): растр в QImage (для атласов svg_atlas.py).
+# v1.2 — 2026-10-18 — logging (axiom.svg) вместо print для сводок и ошибок.
+# =======================
+
+"""
+icon_service.py — иконки из сгенерированных SVG без повторного разбора SVG.
+— pixmap(path, size, dpr) / icon(path): повторный запрос — попадание в dict (LRU, ограничен по числу записей).
+— Промах: PNG ищется в style/.icon_cache/<sha256(SVG)>_<px>.png; SVG рендерится через QSvgRenderer
+  только если такого PNG ещё нет (QtSvg импортируется лениво).
+— export_pngs(): растеризация выходов генератора в style/png/<имя>_<размер>.png в пуле процессов.
+Размеры: «16,32,64,128@2x» — 128@2x это иконка 128 логических пикселей при DPR 2 (256×256 PNG).
+QPixmap — только GUI-поток; в воркерах экспорта используется QImage на платформе offscreen.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from .output_index import atomic_write
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from output_index import atomic_write
+
+log = logging.getLogger("axiom.svg")
+
+STYLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style")
+ICON_CACHE_DIR = ".icon_cache"
+PNG_DIR = "png"
+DEFAULT_ICON_SIZES = (16, 24, 32, 48, 64)
+
+
+def parse_sizes(spec):
+    # "16,32,64,128@2x" -> [(16, 1.0), (32, 1.0), (64, 1.0), (128, 2.0)]
+    sizes = []
+    for part in spec.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        size, _, scale = part.partition("@")
+        try:
+            dpr = float(scale.rstrip("x")) if scale else 1.0
+            sizes.append((int(size), dpr))
+        except ValueError:
+            raise ValueError(f"Bad PNG size: {part!r} (ожидается N или N@Kx)")
+        if sizes[-1][0] <= 0 or dpr <= 0:
+            raise ValueError(f"Bad PNG size: {part!r}")
+    return sizes
+
+
+def size_label(size, dpr):
+    # Суффикс имени файла: 16 / 128@2x / 64@1.5x
+    return str(size) if dpr == 1 else f"{size}@{dpr:g}x"
+
+
+def svg_digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def cached_png_path(cache_dir, digest, px):
+    return os.path.join(cache_dir, f"{digest[:40]}_{px}.png")
+
+
+def ensure_gui_app():
+    # QSvgRenderer/шрифтам нужен QGuiApplication; в CLI и воркерах — платформа offscreen
+    from PyQt5.QtGui import QGuiApplication
+    global _gui_app
+    if QGuiApplication.instance() is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        _gui_app = QGuiApplication([])
+    return QGuiApplication.instance()
+
+
+_gui_app = None
+
+
+def rasterize_image(svg_data, px):
+    # SVG -> QImage px×px (прозрачный фон, пропорции viewBox сохраняются)
+    from PyQt5.QtCore import QByteArray, QRectF, Qt
+    from PyQt5.QtGui import QImage, QPainter
+    from PyQt5.QtSvg import QSvgRenderer
+
+    renderer = QSvgRenderer(QByteArray(svg_data))
+    if not renderer.isValid():
+        raise ValueError("Invalid SVG")
+    image = QImage(px, px, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    view = renderer.viewBoxF()
+    w, h = (view.width(), view.height()) if view.isValid() else (px, px)
+    scale = px / max(w, h, 1e-9)
+    target = QRectF((px - w * scale) / 2, (px - h * scale) / 2, w * scale, h * scale)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setRenderHint(QPainter.SmoothPixmapTransform)
+    renderer.render(painter, target)
+    painter.end()
+    return image
+
+
+def rasterize_png(svg_data, px):
+    from PyQt5.QtCore import QBuffer, QIODevice
+
+    image = rasterize_image(svg_data, px)
+    buf = QBuffer()
+    buf.open(QIODevice.WriteOnly)
+    image.save(buf, "PNG")
+    return bytes(buf.data())
+
+
+def load_or_rasterize(svg_data, px, cache_dir):
+    # -> (png_bytes, from_disk); новый PNG кладётся в дисковый кеш
+    cached = cached_png_path(cache_dir, svg_digest(svg_data), px)
+    try:
+        with open(cached, "rb") as f:
+            return f.read(), True
+    except OSError:
+        pass
+    png = rasterize_png(svg_data, px)
+    os.makedirs(cache_dir, exist_ok=True)
+    atomic_write(cached, png, suffix=".png")
+    return png, False
+
+
+class IconService:
+    """
+    Кеш растровых иконок для GUI. Ключ в памяти — (путь, размер, DPR), значение — QPixmap/QIcon.
+    SVG считается неизменным, пока не вызван invalidate(path) (например, после перерендера).
+    """
+
+    def __init__(self, cache_dir=None, max_entries=256):
+        self.cache_dir = cache_dir or os.path.join(STYLE_DIR, ICON_CACHE_DIR)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def _lookup(self, key):
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def _store(self, key, value):
+        self._entries[key] = value
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pixmap(self, path, size, dpr=1.0):
+        from PyQt5.QtGui import QPixmap
+
+        path = os.path.abspath(path)
+        key = ("pixmap", path, size, dpr)
+        pm = self._lookup(key)
+        if pm is not None:
+            return pm
+        self.misses += 1
+        pm = QPixmap()
+        try:
+            with open(path, "rb") as f:
+                svg_data = f.read()
+        except OSError:
+            return pm
+        png, from_disk = load_or_rasterize(svg_data, max(1, round(size * dpr)), self.cache_dir)
+        self.disk_hits += from_disk
+        pm.loadFromData(png, "PNG")
+        pm.setDevicePixelRatio(dpr)
+        self._store(key, pm)
+        return pm
+
+    def icon(self, path, sizes=DEFAULT_ICON_SIZES, dpr=None):
+        # QIcon со всеми размерами; DPR по умолчанию — экрана приложения
+        from PyQt5.QtGui import QGuiApplication, QIcon
+
+        if dpr is None:
+            app = QGuiApplication.instance()
+            dpr = app.devicePixelRatio() if app is not None else 1.0
+        path = os.path.abspath(path)
+        key = ("icon", path, tuple(sizes), dpr)
+        icon = self._lookup(key)
+        if icon is not None:
+            return icon
+        icon = QIcon()
+        for size in sizes:
+            pm = self.pixmap(path, size, dpr)
+            if not pm.isNull():
+                icon.addPixmap(pm)
+        self._store(key, icon)
+        return icon
+
+    def invalidate(self, path=None):
+        if path is None:
+            self._entries.clear()
+            return
+        path = os.path.abspath(path)
+        for key in [k for k in self._entries if k[1] == path]:
+            del self._entries[key]
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+
+# Общий экземпляр для окон и панелей
+icon_service = IconService()
+
+
+# ==== Экспорт PNG (CLI --png): пул процессов, QGuiApplication на воркер ====
+_worker_cache_dir = None
+
+
+def _init_png_worker(cache_dir):
+    global _worker_cache_dir
+    _worker_cache_dir = cache_dir
+    ensure_gui_app()
+
+
+def _export_one(job):
+    # -> (out_path, error, status); status — written / skipped / failed
+    svg_path, out_path, px = job
+    try:
+        with open(svg_path, "rb") as f:
+            svg_data = f.read()
+        png, _ = load_or_rasterize(svg_data, px, _worker_cache_dir)
+        try:
+            with open(out_path, "rb") as f:
+                if f.read() == png:
+                    return out_path, None, "skipped"
+        except OSError:
+            pass
+        atomic_write(out_path, png, suffix=".png")
+        return out_path, None, "written"
+    except Exception as e:
+        return out_path, f"{type(e).__name__}: {e}", "failed"
+
+
+def export_pngs(svg_paths, sizes, out_dir, cache_dir, jobs=None):
+    """
+    Растеризует каждый SVG во все размеры: out_dir/<имя>_<16|128@2x>.png.
+    Возвращает [(out_path, error, status)]; jobs=1 — без пула, в текущем процессе.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    jobs_list = []
+    for svg_path in svg_paths:
+        stem = os.path.splitext(os.path.basename(svg_path))[0]
+        for size, dpr in sizes:
+            out_path = os.path.join(out_dir, f"{stem}_{size_label(size, dpr)}.png")
+            jobs_list.append((svg_path, out_path, max(1, round(size * dpr))))
+    if not jobs_list:
+        return []
+    jobs = min(jobs or os.cpu_count() or 1, len(jobs_list))
+    if jobs == 1:
+        _init_png_worker(cache_dir)
+        return [_export_one(job) for job in jobs_list]
+    chunksize = max(1, len(jobs_list) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_png_worker, initargs=(cache_dir,)) as pool:
+        return list(pool.map(_export_one, jobs_list, chunksize=chunksize))
+
+
+def run_png_export(svg_paths, spec, style_dir="style", jobs=None):
+    # Экспорт + отчёт в стиле run_batch()
+    sizes = parse_sizes(spec)
+    started = time.perf_counter()
+    results = export_pngs(
+        svg_paths, sizes,
+        out_dir=os.path.join(style_dir, PNG_DIR),
+        cache_dir=os.path.join(style_dir, ICON_CACHE_DIR),
+        jobs=jobs,
+    )
+    elapsed = time.perf_counter() - started
+    failed = [r for r in results if r[1]]
+    for out_path, error, _ in failed:
+        log.error(f"❗ {out_path}: {error}")
+    written = sum(1 for r in results if r[2] == "written")
+    skipped = sum(1 for r in results if r[2] == "skipped")
+    rate = len(results) / elapsed if elapsed > 0 else 0.0
+    log.info(f"PNG: {len(results) - len(failed)} ok ({written} written, {skipped} skipped), "
+             f"{len(failed)} failed, {elapsed:.2f}s, {rate:.1f} images/sec")
+    return results
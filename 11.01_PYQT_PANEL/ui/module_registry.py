@@ -0,0 +1,262 @@
+# === AXIOM_PY_HEADER ===
+# FILE: module_registry.py
+# TITLE: AXIOM PANEL — MODULE REGISTRY
+# VERSION: v1.0
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Реестр секторов и модулей из NAV.json: индекс по id / zone / родителю, компактный кеш, ленивый импорт.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — ModuleRegistry: обход NAV-деревьев (корневое + вложенные), кеш marshal с инвалидацией по _meta.updated_at, resolve() через importlib.
+# =======================
+
+"""
+module_registry.py — источник кнопки «📦 Модули» главного окна.
+— Корень — 11.00.n_NAV.json сектора; вложенные NAV (напр. 11.01.00.n_NAV.json) находятся по самим
+  деревьям — файл *.n_NAV.json внутри папки. Записи вложенного NAV перекрывают записи родителя.
+— Каждая запись получает уникальный ключ — путь от папки сектора (id в NAV повторяются).
+  Индексы: by_id, by_zone (зона без скобок и хвостовых /), children (путь родителя -> пути).
+— Кеш (.axiom_modules.cache рядом с панелью) — marshal кортежей и индексов. Проверка: os.stat NAV-файлов;
+  если файлы менялись — JSON читается, и при том же _meta.updated_at индекс берётся из кеша,
+  иначе строится заново.
+— Загрузка — при первом обращении, не при старте. Модуль сектора импортируется только в resolve() — при открытии.
+"""
+
+import importlib
+import json
+import logging
+import marshal
+import os
+from collections import namedtuple
+
+try:
+    from .perf import span, incr
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from perf import span, incr
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+PANEL_DIR = os.path.dirname(UI_DIR)
+SECTOR_DIR = os.path.dirname(PANEL_DIR)
+ROOT_NAV = os.path.join(SECTOR_DIR, "11.00.n_NAV.json")
+CACHE_FILE = os.path.join(PANEL_DIR, ".axiom_modules.cache")
+CACHE_VERSION = 1
+NAV_SUFFIX = ".n_NAV.json"
+
+# Точки входа модулей, которые открываются из панели: путь от папки сектора -> "модуль:виджет".
+# Запись NAV может задать свою точку входа полем "entry" (приоритетнее этой таблицы).
+OPENERS = {
+    "11.01_PYQT_PANEL/ui/panel_svg_generator.py": "ui.panel_svg_generator:SVGGeneratorPanel",
+}
+
+ModuleEntry = namedtuple("ModuleEntry", "path parent kind title id zone status comment entry")
+
+log = logging.getLogger("axiom.panel")
+
+
+def normalize_zone(zone):
+    # "[11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]" -> "11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui"
+    return (zone or "").strip().strip("[]").strip("/")
+
+
+def _file_stat(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+class ModuleRegistry:
+    def __init__(self, root_nav=ROOT_NAV, cache_file=CACHE_FILE):
+        self.root_nav = os.path.abspath(root_nav)
+        self.root_dir = os.path.dirname(self.root_nav)
+        self.cache_file = cache_file
+        self._sources = None  # ((путь NAV, mtime_ns, size, updated_at), ...)
+        self._entries = None  # путь -> ModuleEntry
+        self._rows = ()  # те же записи кортежами — для кеша
+        self._index = ({}, {}, {})  # by_id / by_zone / children по номерам записей — для кеша
+        self._by_id = {}
+        self._by_zone = {}
+        self._children = {}
+
+    # ---- Загрузка ----
+    def ensure_loaded(self):
+        if self._entries is None:
+            self.reload()
+        return self
+
+    def reload(self):
+        with span("modules.load"):
+            cached = self._read_cache()
+            if cached is not None and self._stats_match(cached[0]):
+                incr("modules.cache_hit")
+                self._install(*cached)
+                return self
+            navs = self._read_navs()
+            stamps = tuple((path, updated_at) for path, _, _, updated_at in navs[0])
+            if cached is not None and tuple((p, u) for p, _, _, u in cached[0]) == stamps:
+                # Файлы перезаписаны, но генератор NAV не менял дерево: индекс прежний
+                incr("modules.cache_hit")
+                self._install(navs[0], *cached[1:])
+            else:
+                incr("modules.rebuild")
+                self._install(navs[0], *self._build(navs[1]))
+            self._write_cache()
+        return self
+
+    def invalidate(self):
+        self._entries = None
+
+    def _read_navs(self):
+        # -> (источники, [(путь папки NAV от корня, дерево), ...]); вложенные NAV — по ссылкам в деревьях
+        sources, trees = [], []
+        queue = [(self.root_nav, "")]
+        seen = set()
+        while queue:
+            path, prefix = queue.pop(0)
+            if path in seen or not os.path.isfile(path):
+                continue
+            seen.add(path)
+            mtime, size = _file_stat(path)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                log.error(f"❗ NAV {path}: {e}")
+                continue
+            sources.append((path, mtime, size, str(data.get("_meta", {}).get("updated_at", ""))))
+            tree = data.get("tree", [])
+            trees.append((prefix, tree))
+            for folder in self._nested_navs(tree, prefix):
+                queue.append((os.path.join(self.root_dir, *folder.split("/")), os.path.dirname(folder)))
+        return tuple(sources), trees
+
+    def _nested_navs(self, tree, prefix):
+        # Файлы *.n_NAV.json внутри папок дерева (сам корневой NAV лежит на уровне prefix — пропускается)
+        stack = [(node, prefix) for node in tree]
+        while stack:
+            node, parent = stack.pop()
+            name = node.get("file") or node.get("title", "")
+            path = f"{parent}/{name}" if parent else name
+            if node.get("type") == "folder":
+                stack.extend((child, path) for child in node.get("children", []))
+            elif parent != prefix and name.endswith(NAV_SUFFIX):
+                yield path
+
+    def _build(self, trees):
+        # Записи -> кортежи (marshal-совместимо) и индексы по номеру записи
+        merged = {}
+        for prefix, tree in trees:
+            stack = [(node, prefix) for node in reversed(tree)]
+            while stack:
+                node, parent = stack.pop()
+                title = node.get("title", "")
+                kind = node.get("type", "file")
+                name = title if kind == "folder" else node.get("file") or title
+                path = f"{parent}/{name}" if parent else name
+                merged[path] = (
+                    path, parent, kind, title, node.get("id") or "", normalize_zone(node.get("zone")),
+                    node.get("status") or "", node.get("comment") or "",
+                    node.get("entry") or OPENERS.get(path, ""),
+                )
+                if kind == "folder":
+                    stack.extend((child, path) for child in reversed(node.get("children", [])))
+        entries = tuple(merged.values())
+        by_id, by_zone, children = {}, {}, {}
+        for i, (path, parent, _, _, entry_id, zone, _, _, _) in enumerate(entries):
+            if entry_id:
+                by_id.setdefault(entry_id, []).append(i)
+            by_zone.setdefault(zone, []).append(i)
+            children.setdefault(parent, []).append(i)
+        return entries, by_id, by_zone, children
+
+    def _install(self, sources, entries, by_id, by_zone, children):
+        self._sources = tuple(tuple(s) for s in sources)
+        rows = [ModuleEntry(*row) for row in entries]
+        self._rows = tuple(entries)
+        self._entries = {entry.path: entry for entry in rows}
+        self._by_id = {key: [rows[i] for i in idx] for key, idx in by_id.items()}
+        self._by_zone = {key: [rows[i] for i in idx] for key, idx in by_zone.items()}
+        self._children = {key: [rows[i] for i in idx] for key, idx in children.items()}
+        self._index = (by_id, by_zone, children)
+
+    # ---- Кеш ----
+    def _stats_match(self, sources):
+        for path, mtime, size, _ in sources:
+            try:
+                if _file_stat(path) != (mtime, size):
+                    return False
+            except OSError:
+                return False
+        return bool(sources)
+
+    def _read_cache(self):
+        if not self.cache_file:
+            return None
+        try:
+            with open(self.cache_file, "rb") as f:
+                # Один read + loads: marshal.load() по файлу читает мелкими порциями
+                version, root, openers, *cached = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if version != CACHE_VERSION or root != self.root_nav or openers != OPENERS:
+            return None
+        return cached
+
+    def _write_cache(self):
+        if not self.cache_file:
+            return
+        payload = (CACHE_VERSION, self.root_nav, OPENERS, self._sources, self._rows, *self._index)
+        tmp = self.cache_file + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(marshal.dumps(payload))
+            os.replace(tmp, self.cache_file)
+        except OSError as e:
+            log.debug(f"module cache not written: {e}")
+
+    # ---- Запросы ----
+    def get(self, path):
+        return self.ensure_loaded()._entries.get(path)
+
+    def entries(self):
+        return list(self.ensure_loaded()._entries.values())
+
+    def by_id(self, entry_id):
+        return list(self.ensure_loaded()._by_id.get(entry_id, ()))
+
+    def by_zone(self, zone):
+        return list(self.ensure_loaded()._by_zone.get(normalize_zone(zone), ()))
+
+    def zones(self):
+        return sorted(self.ensure_loaded()._by_zone)
+
+    def children(self, parent=""):
+        return list(self.ensure_loaded()._children.get(parent, ()))
+
+    def has_children(self, parent):
+        return parent in self.ensure_loaded()._children
+
+    def sources(self):
+        return [path for path, *_ in self.ensure_loaded()._sources]
+
+    # ---- Открытие ----
+    def resolve(self, entry):
+        # Импорт модуля записи — только здесь; -> объект точки входа (класс виджета / функция)
+        path = entry if isinstance(entry, str) else entry.path
+        entry = self.get(path)
+        # Встроенные точки входа работают и без записи в NAV (дерево ещё не перегенерировано)
+        spec = entry.entry if entry is not None else OPENERS.get(path, "")
+        if not spec:
+            raise LookupError(f"Module has no entry point: {path}")
+        module_name, _, attr = spec.partition(":")
+        with span("modules.import"):
+            module = importlib.import_module(module_name)
+        incr("modules.opened")
+        return getattr(module, attr) if attr else module
+
+    def stats(self):
+        self.ensure_loaded()
+        return {"entries": len(self._entries), "navs": len(self._sources), "ids": len(self._by_id),
+                "zones": len(self._by_zone), "openable": sum(1 for e in self._entries.values() if e.entry)}
+
+
+module_registry = ModuleRegistry()
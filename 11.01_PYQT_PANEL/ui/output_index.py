@@ -0,0 +1,124 @@
+# === AXIOM_PY_HEADER ===
+# FILE: output_index.py
+# TITLE: AXIOM SVG GENERATOR — OUTPUT INDEX
+# VERSION: v1.4
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Индекс выходных SVG по хешу (шаблон + параметры) и атомарная запись файлов.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — Инкрементальный режим: пропуск неизменённых выходов, запись через temp + rename.
+# v1.1 — 2026-10-18 — atomic_write(): суффикс временного файла задаётся (PNG-кеш иконок).
+# v1.2 — 2026-10-18 — content_digest(..., variant): уровень оптимизации входит в хеш выхода.
+# v1.3 — 2026-10-18 — params_digest(): хеш одних параметров (индекс архивов svg_sink.py).
+# v1.4 — 2026-10-18 — atomic_write(): права файла — 0o666 без umask (как open(path, "w")), а не 0600 от mkstemp.
+# =======================
+
+"""
+output_index.py — контентно-адресуемый индекс выходов генератора.
+— Ключ выхода: sha256(исходник шаблона + нормализованные параметры).
+— Индекс хранится рядом с выходами: style/.axiom_svg_index.json.
+— Если хеш совпал и файл на месте — запись пропускается; иначе файл пишется атомарно.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+INDEX_FILE = ".axiom_svg_index.json"
+INDEX_VERSION = 1
+
+
+def _default_file_mode():
+    # Права, которые дал бы open(path, "w"): 0o666 без umask процесса
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+FILE_MODE = _default_file_mode()  # mkstemp создаёт 0600 — временный файл выставляется в это перед os.replace
+
+
+def normalize_params(params):
+    # Стабильное представление параметров: порядок ключей и формат не влияют на хеш
+    return json.dumps(params, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def params_digest(params):
+    # Хеш только параметров: какие выходы архива отрисованы с одинаковыми параметрами
+    return hashlib.sha256(normalize_params(params).encode("utf-8")).hexdigest()
+
+
+def content_digest(template_source, params, variant=""):
+    # variant — всё, что меняет байты выхода помимо шаблона и параметров (например, «opt2»)
+    h = hashlib.sha256(template_source.encode("utf-8"))
+    h.update(b"\0")
+    h.update(normalize_params(params).encode("utf-8"))
+    if variant:
+        h.update(b"\0" + variant.encode("utf-8"))
+    return h.hexdigest()
+
+
+def atomic_write(path, data, suffix=".svg"):
+    # Запись через временный файл в той же папке + os.replace (наблюдатели не видят полуфайл)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=suffix, dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class OutputIndex:
+    def __init__(self, style_dir):
+        self.path = os.path.join(style_dir, INDEX_FILE)
+        self.entries = None  # загружается лениво
+        self.dirty = False
+
+    def _load(self):
+        self.entries = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.entries = data.get("outputs", {})
+
+    def is_current(self, output_name, digest, out_path):
+        # Выход актуален: хеш совпал и файл на диске того же размера
+        if self.entries is None:
+            self._load()
+        entry = self.entries.get(output_name)
+        if not entry or entry.get("hash") != digest:
+            return False
+        try:
+            return os.path.getsize(out_path) == entry.get("size")
+        except OSError:
+            return False
+
+    def set(self, output_name, entry):
+        if self.entries is None:
+            self._load()
+        self.entries[output_name] = entry
+        self.dirty = True
+
+    def update(self, entries):
+        for name, entry in entries.items():
+            self.set(name, entry)
+
+    def save(self):
+        if not self.dirty:
+            return
+        data = {"version": INDEX_VERSION, "outputs": dict(sorted(self.entries.items()))}
+        atomic_write(self.path, json.dumps(data, ensure_ascii=False, indent=1))
+        self.dirty = False
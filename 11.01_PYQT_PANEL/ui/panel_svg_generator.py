@@ -1,7 +1,7 @@
 # === AXIOM_PY_HEADER ===
 # FILE: panel_svg_generator.py
 # TITLE: AXIOM SVG GENERATOR — GUI PANEL
-# VERSION: v0.1
+# VERSION: v0.9
 # STATUS: DRAFT / WORKING
 # ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
 # COMMENT: Визуальный модуль для генерации и предпросмотра SVG (интеграция ядра генератора).
@@ -9,6 +9,14 @@
 # DATE: 2025-07-26
 # === CHANGELOG ===
 # v0.1 — 2025-07-26 — Рабочая версия панели, поддержка шаблонов, параметров, предпросмотра и экспорта.
+# v0.2 — 2026-10-18 — Предпросмотр рендерится в память (QByteArray), без временного _tmp_preview.svg.
+# v0.3 — 2026-10-18 — Живой предпросмотр: debounce-таймер, рендер на QThreadPool, отбрасывание устаревших по seq.
+# v0.4 — 2026-10-18 — Поля параметров строятся по интроспекции шаблона; страницы полей кешируются по шаблону.
+# v0.5 — 2026-10-18 — Пресеты через общий PresetStore: фоновая загрузка, фильтр по шаблону, перезагрузка по изменению файла.
+# v0.6 — 2026-10-18 — Спан preview.load (perf.py): разбор SVG в QSvgWidget.
+# v0.7 — 2026-10-18 — Галерея пресетов с миниатюрами (preset_gallery.py): создаётся по кнопке, клик применяет пресет.
+# v0.8 — 2026-10-18 — Режим «Анимация»: цикл SMIL растеризуется в фоне и проигрывается из кольцевого буфера (anim_preview.py).
+# v0.9 — 2026-10-18 — Ошибка перечитывания пресетов (битый JSON, файл недоступен) — в строку статуса, прежние пресеты остаются.
 # =======================
 
 """
@@ -18,15 +26,23 @@ panel_svg_generator.py — GUI для генерации и предпросмо
 
 import sys
 import os
-import json
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QComboBox, QLineEdit, QFileDialog, QSpinBox, QScrollArea, QMessageBox
+    QComboBox, QLineEdit, QFileDialog, QSpinBox, QScrollArea, QMessageBox, QCheckBox,
+    QStackedWidget
 )
 from PyQt5.QtSvg import QSvgWidget
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QByteArray, QTimer, QThreadPool, QFileSystemWatcher
 
 from .generate_svg import AxiomSVGGenerator
+from .preview_worker import PreviewRenderTask, PreviewSignals, BackgroundTask, TaskSignals
+from .perf import span
+
+LIVE_PREVIEW_DELAY_MS = 150  # пауза после последнего нажатия до перерендера
+
+# Подсказки в полях по выведенному типу параметра
+PARAM_HINTS = {"color": "#rrggbb", "opacity": "0.0 – 1.0", "size": "px", "text": "текст",
+               "duration": "сек", "flag": "1 — вкл"}
 
 class SVGGeneratorPanel(QWidget):
     def __init__(self, templates_dir="templates", style_dir="style"):
@@ -35,9 +51,22 @@ class SVGGeneratorPanel(QWidget):
         self.templates_dir = templates_dir
         self.style_dir = style_dir
         self.generator = AxiomSVGGenerator(templates_dir, style_dir)
-        self.presets = self.load_presets()
+        self.preset_store = self.generator.preset_store
+        self._presets_ready = False
         self.svg_widget = QSvgWidget()
         self.param_widgets = {}
+        self._param_pages = {}  # шаблон -> (сигнатура параметров, страница, {имя: QLineEdit})
+
+        # --- Живой предпросмотр: debounce + фоновый пул + номер последовательности ---
+        self._preview_seq = 0
+        self._preview_pool = QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(1)
+        self._preview_signals = PreviewSignals()
+        self._preview_signals.finished.connect(self._on_preview_rendered)
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(LIVE_PREVIEW_DELAY_MS)
+        self._preview_timer.timeout.connect(self.start_preview_render)
 
         self.init_ui()
 
@@ -53,19 +82,27 @@ class SVGGeneratorPanel(QWidget):
 
         # --- 2. Пресеты (если есть) ---
         self.preset_combo = QComboBox()
-        self.preset_combo.addItem("(Без пресета)")
-        for key in self.presets:
-            self.preset_combo.addItem(key)
+        self.preset_combo.addItem("(Без пресета)")  # список заполнится после фоновой загрузки
         self.preset_combo.currentIndexChanged.connect(self.preset_selected)
+        self.gallery_btn = QPushButton("Галерея")
+        self.gallery_btn.setCheckable(True)
+        self.gallery_btn.toggled.connect(self.toggle_gallery)
+        preset_row = QHBoxLayout()
+        preset_row.addWidget(self.preset_combo, stretch=1)
+        preset_row.addWidget(self.gallery_btn)
         layout.addWidget(QLabel("Профиль/Пресет:"))
-        layout.addWidget(self.preset_combo)
+        layout.addLayout(preset_row)
+        # Галерея миниатюр создаётся при первом открытии — панель открывается без неё
+        self.gallery = None
+        self.gallery_model = None
+        self.gallery_box = QVBoxLayout()
+        layout.addLayout(self.gallery_box)
 
         # --- 3. Параметры шаблона ---
         self.param_area = QScrollArea()
         self.param_area.setWidgetResizable(True)
-        self.param_widget = QWidget()
-        self.param_layout = QVBoxLayout(self.param_widget)
-        self.param_area.setWidget(self.param_widget)
+        self.param_stack = QStackedWidget()
+        self.param_area.setWidget(self.param_stack)
         layout.addWidget(QLabel("Параметры SVG:"))
         layout.addWidget(self.param_area)
 
@@ -79,69 +116,167 @@ class SVGGeneratorPanel(QWidget):
         btn_layout.addWidget(self.save_btn)
         layout.addLayout(btn_layout)
 
+        self.live_check = QCheckBox("Живой предпросмотр")
+        self.live_check.setChecked(True)
+        self.live_check.toggled.connect(self.schedule_live_preview)
+        self.anim_check = QCheckBox("Анимация")
+        self.anim_check.setToolTip("Проиграть SMIL-анимацию из заранее растеризованных кадров")
+        self.anim_check.toggled.connect(self.toggle_animation)
+        check_row = QHBoxLayout()
+        check_row.addWidget(self.live_check)
+        check_row.addWidget(self.anim_check)
+        layout.addLayout(check_row)
+
         layout.addWidget(QLabel("SVG Preview:"))
-        layout.addWidget(self.svg_widget, stretch=1)
+        # Статичный предпросмотр — QSvgWidget; проигрыватель кадров создаётся при первом включении «Анимации»
+        self.preview_stack = QStackedWidget()
+        self.preview_stack.addWidget(self.svg_widget)
+        self.anim_player = None
+        self._anim_seq = 0
+        layout.addWidget(self.preview_stack, stretch=1)
+        self.preview_status = QLabel("")
+        self.preview_status.setObjectName("previewStatus")
+        layout.addWidget(self.preview_status)
 
         self.setLayout(layout)
         self.resize(480, 650)
         self.template_changed()  # инициализация параметров
+        self.load_presets()
 
     def load_presets(self):
-        # Поиск svg_presets.json в templates
-        p_path = os.path.join(self.templates_dir, "svg_presets.json")
-        if os.path.exists(p_path):
-            with open(p_path, encoding="utf-8") as f:
-                data = json.load(f)
-            return data.get("presets", {})
-        return {}
+        # Пресеты грузятся в пуле потоков — открытие панели не ждёт разбора большой библиотеки
+        self._preset_signals = TaskSignals()
+        self._preset_signals.done.connect(self._on_presets_loaded)
+        self._preset_signals.failed.connect(lambda e: self.preview_status.setText(f"⚠ Пресеты: {e}"))
+        task = BackgroundTask(self._preset_signals, self._load_presets_bg, self.template_combo.currentText())
+        QThreadPool.globalInstance().start(task)
+
+    def _load_presets_bg(self, template):
+        self.preset_store.ensure_loaded(template)
+        return self.preset_store.watched_paths()
+
+    def _on_presets_loaded(self, watched_paths):
+        self._presets_ready = True
+        self._preset_watcher = QFileSystemWatcher(watched_paths, self)
+        self._preset_watcher.fileChanged.connect(self._on_presets_file_changed)
+        self._preset_watcher.directoryChanged.connect(self._on_presets_file_changed)
+        self.populate_presets()
+
+    def _on_presets_file_changed(self, path):
+        # Редакторы часто пересоздают файл — путь пропадает из watcher, добавляем заново
+        if os.path.exists(path) and path not in self._preset_watcher.files() + self._preset_watcher.directories():
+            self._preset_watcher.addPath(path)
+        try:
+            changed = self.preset_store.refresh()
+        except (OSError, ValueError) as e:
+            # Файл сохранён наполовину или с ошибкой: остаёмся на прежних пресетах до следующего изменения
+            self.preview_status.setText(f"⚠ Пресеты: {e}")
+            return
+        if changed:
+            if self.gallery_model is not None:
+                self.gallery_model.invalidate()
+            self.populate_presets()
+
+    def populate_presets(self):
+        # Комбо пресетов — только пресеты выбранного шаблона (индекс по шаблону в PresetStore)
+        if not self._presets_ready:
+            return
+        current = self.preset_combo.currentText()
+        names = self.preset_store.names(self.template_combo.currentText())
+        self.preset_combo.blockSignals(True)
+        self.preset_combo.clear()
+        self.preset_combo.addItem("(Без пресета)")
+        self.preset_combo.addItems(names)
+        self.preset_combo.setCurrentIndex(max(self.preset_combo.findText(current), 0))
+        self.preset_combo.blockSignals(False)
+        if self.gallery_model is not None:
+            self.gallery_model.set_names(names)
+
+    def toggle_gallery(self, visible):
+        if self.gallery is None:
+            if not visible:
+                return
+            from .preset_gallery import PresetGalleryModel, PresetGalleryView
+            self.gallery_model = PresetGalleryModel(self.generator, parent=self)
+            self.gallery = PresetGalleryView(self.gallery_model)
+            self.gallery.setMinimumHeight(220)
+            self.gallery.presetActivated.connect(self.apply_preset)
+            self.gallery_box.addWidget(self.gallery)
+            if self._presets_ready:
+                self.gallery_model.set_names(self.preset_store.names(self.template_combo.currentText()))
+        self.gallery.setVisible(visible)
+
+    def apply_preset(self, name):
+        # Клик по миниатюре = выбор пресета в списке (поля заполняются, живой предпросмотр перезапускается)
+        index = self.preset_combo.findText(name)
+        if index <= 0:
+            return
+        if index == self.preset_combo.currentIndex():
+            self.preset_selected()  # повторный клик — вернуть значения пресета в поля
+        else:
+            self.preset_combo.setCurrentIndex(index)
 
     def template_changed(self):
-        # При смене шаблона — обновить поля параметров
+        # При смене шаблона — показать его поля (страница строится один раз и переиспользуется)
         tpl = self.template_combo.currentText()
-        # По умолчанию: params = список параметров из шаблона или стандарт
-        # Для MVP: выводим поля вручную (расширь под свои параметры!)
-        self.clear_param_fields()
-        # Минимальный набор, можешь расширять под любые шаблоны
-        param_names = [
-            "size", "color", "bg", "glow_color", "glow_opacity", "blade_opacity", "ring_opacity",
-            "core_color", "core_opacity", "label", "label_color", "label_size", "bg_opacity", "border_width",
-            "border_opacity", "decor_color", "decor_opacity"
-        ]
-        for pname in param_names:
+        if not tpl:
+            return
+        try:
+            spec = self.generator.template_params(tpl)
+        except Exception as e:
+            self.preview_status.setText(f"⚠ {e}")
+            spec = {}
+        signature = tuple(spec.items())
+        cached = self._param_pages.get(tpl)
+        if cached is None or cached[0] != signature:
+            # Шаблона ещё не было или его набор параметров изменился на диске
+            if cached is not None:
+                self.clear_param_fields(tpl)
+            page, edits = self._build_param_page(spec)
+            self.param_stack.addWidget(page)
+            self._param_pages[tpl] = (signature, page, edits)
+        _, page, edits = self._param_pages[tpl]
+        self.param_stack.setCurrentWidget(page)
+        self.param_widgets = edits
+        self.populate_presets()
+        self.schedule_live_preview()
+
+    def _build_param_page(self, spec):
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        edits = {}
+        for pname, ptype in spec.items():
             hl = QHBoxLayout()
             lbl = QLabel(pname + ":")
             edit = QLineEdit()
+            edit.setPlaceholderText(PARAM_HINTS.get(ptype, ""))
+            edit.setToolTip(ptype)
+            edit.textChanged.connect(self.schedule_live_preview)
             hl.addWidget(lbl)
             hl.addWidget(edit)
-            self.param_layout.addLayout(hl)
-            self.param_widgets[pname] = edit
-        self.param_widget.setLayout(self.param_layout)
-
-    def clear_param_fields(self):
-        # Очистить все поля параметров
-        for i in reversed(range(self.param_layout.count())):
-            item = self.param_layout.itemAt(i)
-            if item:
-                w = item.widget()
-                if w:
-                    w.deleteLater()
-                else:
-                    # это layout, удаляем его элементы
-                    l = item.layout()
-                    if l:
-                        for j in reversed(range(l.count())):
-                            lw = l.itemAt(j).widget()
-                            if lw:
-                                lw.deleteLater()
-                        l.deleteLater()
-                    self.param_layout.removeItem(item)
+            page_layout.addLayout(hl)
+            edits[pname] = edit
+        page_layout.addStretch(1)
+        return page, edits
+
+    def clear_param_fields(self, tpl=None):
+        # Удалить закешированные страницы полей (одного шаблона или все)
+        names = [tpl] if tpl is not None else list(self._param_pages)
+        for name in names:
+            entry = self._param_pages.pop(name, None)
+            if entry is None:
+                continue
+            page = entry[1]
+            self.param_stack.removeWidget(page)
+            page.deleteLater()
         self.param_widgets = {}
 
     def preset_selected(self):
         # Если выбран профиль — подгрузить параметры
         preset_name = self.preset_combo.currentText()
-        if preset_name and preset_name in self.presets:
-            params = self.presets[preset_name]["params"]
+        preset = self.preset_store.get(preset_name) if self.preset_combo.currentIndex() > 0 else None
+        if preset:
+            params = preset.get("params", {})
             for k, v in params.items():
                 if k in self.param_widgets:
                     self.param_widgets[k].setText(str(v))
@@ -165,15 +300,83 @@ class SVGGeneratorPanel(QWidget):
     def preview_svg(self):
         tpl = self.template_combo.currentText()
         params = self.get_params()
-        tmp_svg = "_tmp_preview.svg"
         try:
-            self.generator.render(tpl, params, tmp_svg)
-            self.svg_widget.load(tmp_svg)
-            if os.path.exists(tmp_svg):
-                os.remove(tmp_svg)
+            svg_bytes = self.generator.render_to_bytes(tpl, params)
+            if self.anim_check.isChecked():
+                self.start_animation_prerender(svg_bytes)
+                return
+            self.svg_widget.load(QByteArray(svg_bytes))
         except Exception as e:
             QMessageBox.warning(self, "Ошибка генерации", str(e))
 
+    def schedule_live_preview(self, *_):
+        # На каждое нажатие — только перезапуск таймера (O(1) в GUI-потоке)
+        if self.live_check.isChecked():
+            self._preview_timer.start()
+
+    def start_preview_render(self):
+        # Снимок параметров и отправка рендера в фоновый пул
+        self._preview_seq += 1
+        task = PreviewRenderTask(
+            self.generator, self.template_combo.currentText(), self.get_params(),
+            self._preview_seq, self._preview_signals, lambda: self._preview_seq,
+        )
+        self._preview_pool.start(task)
+
+    def _on_preview_rendered(self, seq, svg_bytes, error):
+        if seq != self._preview_seq:
+            return  # устаревший результат — уже запрошен более свежий
+        if error:
+            self.preview_status.setText(f"⚠ {error}")
+            return
+        self.preview_status.setText("")
+        if self.anim_check.isChecked():
+            self.start_animation_prerender(svg_bytes)
+            return
+        with span("preview.load"):
+            self.svg_widget.load(QByteArray(svg_bytes))
+
+    # ---- Анимация: кадры одного цикла в фоне -> AnimationPlayer ----
+    def toggle_animation(self, enabled):
+        if enabled:
+            if self.anim_player is None:
+                from .anim_preview import AnimationPlayer
+                self.anim_player = AnimationPlayer()
+                self.preview_stack.addWidget(self.anim_player)
+                self._anim_signals = TaskSignals()
+                self._anim_signals.done.connect(self._on_animation_ready)
+                self._anim_signals.failed.connect(lambda e: self.preview_status.setText(f"⚠ Анимация: {e}"))
+            self.preview_stack.setCurrentWidget(self.anim_player)
+            self.start_preview_render()  # кадры для текущих параметров
+        else:
+            if self.anim_player is not None:
+                self.anim_player.stop()
+            self.preview_stack.setCurrentWidget(self.svg_widget)
+            self.start_preview_render()
+
+    def start_animation_prerender(self, svg_bytes):
+        from .anim_preview import PREVIEW_MAX_PX
+        self._anim_seq += 1
+        dpr = self.devicePixelRatioF()
+        side = min(self.preview_stack.width(), self.preview_stack.height(), PREVIEW_MAX_PX)
+        px = max(16, round(side * dpr))
+        self.preview_status.setText("Анимация: растеризация цикла...")
+        task = BackgroundTask(self._anim_signals, self._prerender_bg, self._anim_seq, svg_bytes, px, dpr)
+        QThreadPool.globalInstance().start(task)
+
+    @staticmethod
+    def _prerender_bg(seq, svg_bytes, px, dpr):
+        from .anim_preview import prerender_cycle
+        return (seq, dpr) + prerender_cycle(svg_bytes, px)
+
+    def _on_animation_ready(self, result):
+        seq, dpr, images, fps, cycle = result
+        if seq != self._anim_seq or not self.anim_check.isChecked():
+            return  # параметры уже сменились — ждём следующий цикл
+        self.anim_player.load_frames(images, fps, dpr)
+        self.preview_status.setText(f"Анимация: {len(images)} кадров, цикл {cycle:g} с @ {fps:.0f} fps"
+                                    if cycle else "Без анимации (статичный SVG)")
+
     def save_svg(self):
         tpl = self.template_combo.currentText()
         params = self.get_params()
@@ -0,0 +1,263 @@
+# === AXIOM_PY_HEADER ===
+# FILE: perf.py
+# TITLE: AXIOM PERF — SPANS, COUNTERS, PROFILER
+# VERSION: v1.0
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Инструментация горячих путей: спаны с гистограммами, счётчики, дампы JSON / Chrome trace, cProfile.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — span()/timed()/incr(), гистограммы по логарифмическим корзинам, dump_json/dump_chrome_trace/dump_at_exit, profile_start/stop.
+# =======================
+
+"""
+perf.py — лёгкая инструментация для генератора и панели.
+    with span("svg.format"):
+        ...
+Выключено по умолчанию: span() возвращает общий пустой контекст, incr() — сразу выходит
+(одна проверка флага, без времени и блокировок). Включение: enable() / переменная окружения
+AXIOM_PERF=1 (AXIOM_PERF=trace — дополнительно хранить события для Chrome trace).
+
+Агрегаты в памяти: по каждому спану count / total / min / max и гистограмма по корзинам
+(1-2-5 µs ... 10 s) -> p50 / p90 / p99. События трассировки — кольцевой буфер TRACE_CAPACITY.
+dump_json(path) — агрегаты, dump_chrome_trace(path) — chrome://tracing / Perfetto.
+profile_start()/profile_stop() — cProfile потока, который его включил (GUI-поток в панели).
+"""
+
+import atexit
+import bisect
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from collections import deque
+
+TRACE_CAPACITY = 100_000
+# Верхние границы корзин, µs: 1, 2, 5, 10, ... 10 000 000; последняя — всё, что больше
+BUCKETS_US = [m * 10 ** e for e in range(0, 8) for m in (1, 2, 5)][:-2]
+
+_enabled = False
+_tracing = False
+_lock = threading.Lock()
+_spans = {}
+_counters = {}
+_trace = deque(maxlen=TRACE_CAPACITY)
+_epoch_ns = time.perf_counter_ns()
+_profiler = None
+
+
+class _Histogram:
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+        self.buckets = [0] * (len(BUCKETS_US) + 1)
+
+    def add(self, dur_ns):
+        self.count += 1
+        self.total += dur_ns
+        self.min = dur_ns if self.min is None else min(self.min, dur_ns)
+        self.max = max(self.max, dur_ns)
+        # Индекс первой границы >= длительности; за последней — корзина «inf»
+        self.buckets[bisect.bisect_left(BUCKETS_US, dur_ns / 1000)] += 1
+
+    def percentile(self, q):
+        # Верхняя граница корзины, в которую попадает q-я доля (оценка, ms)
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target and n:
+                return (BUCKETS_US[i] if i < len(BUCKETS_US) else self.max / 1000) / 1000
+        return self.max / 1e6
+
+    def as_dict(self):
+        return {
+            "count": self.count,
+            "total_ms": self.total / 1e6,
+            "mean_ms": self.total / 1e6 / self.count if self.count else 0.0,
+            "min_ms": (self.min or 0) / 1e6,
+            "max_ms": self.max / 1e6,
+            "p50_ms": self.percentile(0.5),
+            "p90_ms": self.percentile(0.9),
+            "p99_ms": self.percentile(0.99),
+            "buckets_us": {str(b): n for b, n in zip(BUCKETS_US + ["inf"], self.buckets) if n},
+        }
+
+
+def _record(name, start_ns, dur_ns):
+    with _lock:
+        hist = _spans.get(name)
+        if hist is None:
+            hist = _spans[name] = _Histogram()
+        hist.add(dur_ns)
+        if _tracing:
+            _trace.append((name, start_ns, dur_ns, threading.get_ident()))
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.name, self.start, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name):
+    # Контекст замера; при выключенной инструментации — общий пустой объект
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def timed(name):
+    # Декоратор: вся функция — один спан (флаг проверяется при каждом вызове)
+    def decorate(fn):
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(name):
+                return fn(*args, **kwargs)
+        wrapper.__name__ = fn.__name__
+        wrapper.__doc__ = fn.__doc__
+        wrapper.__wrapped__ = fn
+        return wrapper
+    return decorate
+
+
+def incr(name, n=1):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+# ==== Управление ====
+def enable(trace=False):
+    global _enabled, _tracing
+    _enabled = True
+    _tracing = _tracing or trace
+
+
+def disable():
+    global _enabled, _tracing
+    _enabled = False
+    _tracing = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _spans.clear()
+        _counters.clear()
+        _trace.clear()
+
+
+# ==== Выгрузка ====
+def snapshot():
+    with _lock:
+        return {
+            "enabled": _enabled,
+            "counters": dict(_counters),
+            "spans": {name: hist.as_dict() for name, hist in sorted(_spans.items())},
+        }
+
+
+def summary(names=None, limit=4):
+    # Короткая строка для статус-бара: самые «дорогие» спаны по суммарному времени
+    with _lock:
+        items = [(n, h) for n, h in _spans.items() if names is None or n in names]
+        items.sort(key=lambda item: item[1].total, reverse=True)
+        parts = [f"{n} {h.count}× p50 {h.percentile(0.5):.2f} ms" for n, h in items[:limit]]
+    return " | ".join(parts) if parts else "нет замеров"
+
+
+def dump_json(path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, ensure_ascii=False, indent=1)
+    return path
+
+
+def dump_chrome_trace(path):
+    # Формат Trace Event: «X»-события (полная длительность), время в µs от старта процесса
+    pid = os.getpid()
+    with _lock:
+        events = [
+            {"name": name, "cat": name.split(".", 1)[0], "ph": "X", "pid": pid, "tid": tid,
+             "ts": (start - _epoch_ns) / 1000, "dur": dur / 1000}
+            for name, start, dur, tid in _trace
+        ]
+        counters = dict(_counters)
+    if counters:
+        events.append({"name": "counters", "ph": "C", "pid": pid, "tid": 0,
+                       "ts": (time.perf_counter_ns() - _epoch_ns) / 1000, "args": counters})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return path
+
+
+def dump_at_exit(json_path=None, trace_path=None):
+    # Включить замеры и выгрузить их при выходе процесса (флаги --perf / --perf-trace)
+    enable(trace=bool(trace_path))
+    if json_path:
+        atexit.register(dump_json, json_path)
+    if trace_path:
+        atexit.register(dump_chrome_trace, trace_path)
+
+
+# ==== cProfile ====
+def profiling():
+    return _profiler is not None
+
+
+def profile_start():
+    global _profiler
+    if _profiler is None:
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def profile_stop(path=None, limit=25):
+    # -> текст топа по cumulative; path — сохранить .prof для snakeviz / pstats
+    global _profiler
+    if _profiler is None:
+        return ""
+    profiler, _profiler = _profiler, None
+    profiler.disable()
+    if path:
+        profiler.dump_stats(path)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(limit)
+    return out.getvalue()
+
+
+if os.environ.get("AXIOM_PERF"):
+    enable(trace=os.environ["AXIOM_PERF"].lower() == "trace")
@@ -0,0 +1,266 @@
+# === AXIOM_PY_HEADER ===
+# FILE: preset_gallery.py
+# TITLE: AXIOM SVG GENERATOR — PRESET GALLERY
+# VERSION: v1.0
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Галерея пресетов с миниатюрами: виртуализированный QListView, фоновый рендер только видимых строк, LRU-кеш.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — PresetGalleryModel (QAbstractListModel) + PresetGalleryView (IconMode), ThumbnailTask в QThreadPool.
+# =======================
+
+"""
+preset_gallery.py — сетка миниатюр пресетов для SVGGeneratorPanel.
+— Модель хранит только список имён; миниатюра (DecorationRole) берётся из LRU-кеша QPixmap,
+  пока её нет — прозрачная заглушка. data() никогда не рендерит.
+— Вид (IconMode, uniformItemSizes, Batched) после прокрутки/ресайза, со склейкой THUMB_REQUEST_DELAY_MS,
+  запрашивает миниатюры только видимых строк плюс ряд запаса сверху и снизу.
+— ThumbnailTask: render_to_bytes -> rasterize_image (QImage) в пуле потоков; QPixmap собирается в GUI-потоке.
+  Задача строки, ушедшей из видимой области до старта, завершается без работы.
+— Изменение файла пресетов -> invalidate(): новое поколение, результаты старых задач отбрасываются.
+— Клик / Enter по миниатюре -> presetActivated(имя).
+"""
+
+from collections import OrderedDict
+
+from PyQt5.QtCore import (
+    Qt, QAbstractListModel, QModelIndex, QObject, QRunnable, QSize, QThread, QThreadPool, QTimer,
+    pyqtSignal
+)
+from PyQt5.QtGui import QGuiApplication, QPixmap
+from PyQt5.QtWidgets import QListView
+
+from .icon_service import rasterize_image
+from .perf import span, incr
+
+THUMB_SIZE = 64
+THUMB_CACHE_SIZE = 1024  # миниатюр в памяти (~16 KB каждая при 64 px, DPR 1)
+THUMB_REQUEST_DELAY_MS = 30  # склейка событий прокрутки перед запросом видимых строк
+NAME_ROLE = Qt.UserRole + 1
+
+
+class ThumbnailSignals(QObject):
+    # поколение, имя, QImage (None — пропущена или ошибка), текст ошибки
+    finished = pyqtSignal(int, str, object, str)
+
+
+class ThumbnailTask(QRunnable):
+    def __init__(self, generator, name, px, generation, signals, is_wanted):
+        super().__init__()
+        self.generator = generator
+        self.name = name
+        self.px = px
+        self.generation = generation
+        self.signals = signals
+        self.is_wanted = is_wanted  # callable(имя) -> строка всё ещё на экране
+
+    def run(self):
+        if not self.is_wanted(self.name):
+            incr("gallery.skipped")
+            self.signals.finished.emit(self.generation, self.name, None, "")
+            return
+        try:
+            with span("gallery.thumbnail"):
+                preset = self.generator.preset_store.get(self.name)
+                if not preset:
+                    raise KeyError(f"Preset {self.name} not found")
+                svg_bytes = self.generator.render_to_bytes(preset["template"], preset.get("params", {}))
+                image = rasterize_image(svg_bytes, self.px)
+        except Exception as e:
+            self.signals.finished.emit(self.generation, self.name, None, str(e) or type(e).__name__)
+            return
+        self.signals.finished.emit(self.generation, self.name, image, "")
+
+
+class PresetGalleryModel(QAbstractListModel):
+    def __init__(self, generator, thumb_size=THUMB_SIZE, cache_size=THUMB_CACHE_SIZE, parent=None):
+        super().__init__(parent)
+        self.generator = generator
+        self.thumb_size = thumb_size
+        self.cache_size = cache_size
+        self._names = []
+        self._rows = {}  # имя -> строка
+        self._thumbs = OrderedDict()  # имя -> QPixmap (LRU)
+        self._errors = {}  # имя -> текст ошибки (не перезапрашивается до invalidate)
+        self._pending = set()  # имена в очереди пула или в работе
+        self._wanted = frozenset()  # имена видимых строк — читается из рабочих потоков
+        self._generation = 0
+        self._placeholder = None
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, QThread.idealThreadCount() - 1))  # один поток — GUI
+        self._signals = ThumbnailSignals()
+        self._signals.finished.connect(self._on_thumbnail)
+
+    # ---- Список ----
+    def set_names(self, names):
+        names = list(names)
+        if names == self._names:
+            return
+        self.beginResetModel()
+        self._names = names
+        self._rows = {name: row for row, name in enumerate(names)}
+        self._wanted = frozenset()
+        self.endResetModel()
+
+    def invalidate(self):
+        # Пресеты изменились на диске: все миниатюры и ошибки устарели
+        self._generation += 1
+        self._thumbs.clear()
+        self._errors.clear()
+        self._pending.clear()
+        if self._names:
+            self.dataChanged.emit(self.index(0), self.index(len(self._names) - 1), [Qt.DecorationRole])
+
+    def name_at(self, row):
+        return self._names[row] if 0 <= row < len(self._names) else None
+
+    # ---- QAbstractListModel ----
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._names):
+            return None
+        name = self._names[index.row()]
+        if role in (Qt.DisplayRole, NAME_ROLE):
+            return name
+        if role == Qt.DecorationRole:
+            pm = self._thumbs.get(name)
+            if pm is None:
+                return self.placeholder()
+            self._thumbs.move_to_end(name)
+            return pm
+        if role == Qt.ToolTipRole:
+            error = self._errors.get(name)
+            return f"{name}\n⚠ {error}" if error else name
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # ---- Миниатюры ----
+    def placeholder(self):
+        if self._placeholder is None:
+            self._placeholder = QPixmap(self.thumb_size, self.thumb_size)
+            self._placeholder.fill(Qt.transparent)
+        return self._placeholder
+
+    def _device_ratio(self):
+        app = QGuiApplication.instance()
+        return app.devicePixelRatio() if app is not None else 1.0
+
+    def request(self, first, last):
+        # Видимые строки first..last: в пул уходят только те, чьих миниатюр ещё нет
+        names = self._names[max(first, 0):last + 1]
+        self._wanted = frozenset(names)
+        px = max(1, round(self.thumb_size * self._device_ratio()))
+        for name in names:
+            if name in self._thumbs or name in self._pending or name in self._errors:
+                continue
+            self._pending.add(name)
+            self._pool.start(ThumbnailTask(self.generator, name, px, self._generation,
+                                           self._signals, self._is_wanted))
+
+    def _is_wanted(self, name):
+        return name in self._wanted
+
+    def _on_thumbnail(self, generation, name, image, error):
+        if generation != self._generation:
+            return  # результат до invalidate()
+        self._pending.discard(name)
+        if error:
+            self._errors[name] = error
+        elif image is None:
+            return  # пропущена: строка ушла с экрана до старта задачи
+        else:
+            pm = QPixmap.fromImage(image)
+            pm.setDevicePixelRatio(self._device_ratio())
+            self._thumbs[name] = pm
+            # Видимые миниатюры не вытесняются, даже если окно больше кеша
+            while len(self._thumbs) > max(self.cache_size, len(self._wanted)):
+                self._thumbs.popitem(last=False)
+        row = self._rows.get(name)
+        if row is not None:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole, Qt.ToolTipRole])
+
+    def stats(self):
+        return {"rows": len(self._names), "cached": len(self._thumbs), "pending": len(self._pending),
+                "errors": len(self._errors), "max_entries": self.cache_size}
+
+
+class PresetGalleryView(QListView):
+    presetActivated = pyqtSignal(str)
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setObjectName("PresetGallery")
+        self.setModel(model)
+        # Виртуализация: одинаковые ячейки — раскладка без опроса каждой строки, отрисовка только видимых
+        self.setViewMode(QListView.IconMode)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setWrapping(True)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(500)
+        self.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.setSelectionMode(QListView.SingleSelection)
+        self.setEditTriggers(QListView.NoEditTriggers)
+        self.setTextElideMode(Qt.ElideMiddle)
+        size = model.thumb_size
+        self.setIconSize(QSize(size, size))
+        self.setGridSize(QSize(size + 40, size + 28))
+
+        self._request_timer = QTimer(self)
+        self._request_timer.setSingleShot(True)
+        self._request_timer.setInterval(THUMB_REQUEST_DELAY_MS)
+        self._request_timer.timeout.connect(self.request_visible)
+        self.verticalScrollBar().valueChanged.connect(self.schedule_request)
+        model.modelReset.connect(self.schedule_request)
+        model.dataChanged.connect(self._on_data_changed)
+        self.clicked.connect(self._on_activated)
+        self.activated.connect(self._on_activated)
+
+    def schedule_request(self, *_):
+        self._request_timer.start()
+
+    def visible_range(self):
+        # -> (first, last) строк в видимой области + ряд запаса; ячейки одинаковые, поэтому без indexAt()
+        rows = self.model().rowCount()
+        if not rows:
+            return 0, -1
+        grid = self.gridSize()
+        viewport = self.viewport().rect()
+        columns = max(1, viewport.width() // grid.width())
+        top_line = self.verticalScrollBar().value() // grid.height()
+        lines = viewport.height() // grid.height() + 1
+        first = max(0, (top_line - 1) * columns)
+        last = min(rows - 1, (top_line + lines + 1) * columns - 1)
+        return first, last
+
+    def request_visible(self):
+        if self.isVisible():
+            self.model().request(*self.visible_range())
+
+    def _on_data_changed(self, first, last, roles=()):
+        # invalidate() — весь диапазон: миниатюры видимых строк запрашиваются заново
+        if first.row() == 0 and last.row() == self.model().rowCount() - 1:
+            self.schedule_request()
+
+    def _on_activated(self, index):
+        name = self.model().data(index, NAME_ROLE)
+        if name:
+            self.presetActivated.emit(name)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_request()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.schedule_request()
@@ -0,0 +1,297 @@
+# === AXIOM_PY_HEADER ===
+# FILE: preset_store.py
+# TITLE: AXIOM SVG GENERATOR — PRESET STORE
+# VERSION: v1.4
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Единое хранилище пресетов: ленивая загрузка, индексы по имени и шаблону, перезагрузка по изменению.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — PresetStore: бэкенды JSON / JSONL / шардированная папка, индекс по шаблону, refresh() по mtime.
+# v1.1 — 2026-10-18 — Спан presets.load (perf.py) на первую загрузку источника.
+# v1.2 — 2026-10-18 — seed(): JSON-источник из предкомпилированного бандла без разбора файла.
+# v1.3 — 2026-10-18 — stamp источника — только после успешного разбора: битый файл не считается загруженным, прежние пресеты остаются.
+# v1.4 — 2026-10-18 — refresh() папки-шардов: новый набор источников собирается локально и подменяется, только когда все шарды загрузились.
+# =======================
+
+"""
+preset_store.py — единая точка доступа к пресетам SVG для CLI и GUI-панели.
+
+Форматы (выбираются по пути):
+— svg_presets.json   — {"presets": {ИМЯ: {"template", "description", "params"}}}
+— svg_presets.jsonl  — по пресету в строке: {"name", "template", "description", "params"};
+                       при индексации хранятся только смещения строк, params читаются по запросу
+— svg_presets.d/     — папка-шарды (*.json / *.jsonl); шард «<шаблон>.json», например
+                       core.svg.j2.json, загружается только при запросе пресетов этого шаблона
+
+Загрузка ленивая (при первом обращении); refresh() сверяет mtime/size и перечитывает
+только изменившиеся файлы.
+"""
+
+import json
+import os
+import re
+import threading
+
+try:
+    from .perf import span
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from perf import span
+
+PRESETS_NAMES = ("svg_presets.json", "svg_presets.jsonl", "svg_presets.d")
+
+# Быстрый разбор строк, записанных write_jsonl(): имя и шаблон без полного json.loads
+_JSONL_HEAD_RE = re.compile(rb'^\{"name":\s*"([^"\\\n]*)",\s*"template":\s*"([^"\\\n]*)"', re.M)
+
+
+def find_presets_path(templates_dir):
+    # templates/ или уровнем выше (ui/svg_presets.json) — первый найденный формат
+    for base in (templates_dir, os.path.dirname(os.path.abspath(templates_dir))):
+        for name in PRESETS_NAMES:
+            path = os.path.join(base, name)
+            if os.path.exists(path):
+                return path
+    return None
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class _JsonSource:
+    # Один JSON-файл: парсится целиком, индексируется по имени
+    def __init__(self, path):
+        self.path = path
+        self.stamp = None
+        self.entries = {}
+
+    def load(self):
+        # stamp — до чтения (правка во время разбора не потеряется), присваивается после успешного разбора
+        stamp = _stat_key(self.path)
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.entries = data.get("presets", {})
+        self.stamp = stamp
+
+    def index(self):
+        return [(name, p.get("template")) for name, p in self.entries.items()]
+
+    def get(self, name):
+        return self.entries.get(name)
+
+
+class _JsonlSource:
+    # JSONL: при загрузке — только смещения строк и шаблоны, пресет читается по запросу
+    def __init__(self, path):
+        self.path = path
+        self.stamp = None
+        self.offsets = {}
+        self.templates = {}
+
+    def load(self):
+        # Индекс собирается в локальных словарях: при ошибке разбора остаётся прежний
+        stamp = _stat_key(self.path)
+        offsets, templates = {}, {}
+        with open(self.path, "rb") as f:
+            data = f.read()
+        # Быстрый путь: один проход регуляркой по всему файлу, если все строки в формате write_jsonl()
+        matches = list(_JSONL_HEAD_RE.finditer(data))
+        if len(matches) == sum(1 for line in data.splitlines() if line.strip()):
+            for m in matches:
+                name = m.group(1).decode("utf-8")
+                offsets[name] = m.start()
+                templates[name] = m.group(2).decode("utf-8")
+        else:
+            offset = 0
+            for line in data.splitlines(keepends=True):
+                if line.strip():
+                    item = json.loads(line)
+                    offsets[item["name"]] = offset
+                    templates[item["name"]] = item.get("template")
+                offset += len(line)
+        self.offsets, self.templates = offsets, templates
+        self.stamp = stamp
+
+    def index(self):
+        return list(self.templates.items())
+
+    def get(self, name):
+        offset = self.offsets.get(name)
+        if offset is None:
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            item = json.loads(f.readline())
+        item.pop("name", None)
+        return item
+
+
+def _make_source(path):
+    return _JsonlSource(path) if path.endswith(".jsonl") else _JsonSource(path)
+
+
+class PresetStore:
+    """
+    Хранилище пресетов. Пресет — dict {"template", "description", "params"}.
+    names(template=None) — имена (в порядке файла), get(name) — пресет или None.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._sources = None  # путь -> источник; None — ещё не загружено
+        self._shard_templates = {}  # путь шарда -> шаблон (по имени файла) или None
+        self._dir_stamp = None
+        self._by_name = {}
+        self._by_template = {}
+
+    # ---- Загрузка и индекс ----
+    def _source_paths(self):
+        if not self.path or not os.path.exists(self.path):
+            return []
+        if os.path.isdir(self.path):
+            return sorted(
+                os.path.join(self.path, f) for f in os.listdir(self.path)
+                if f.endswith((".json", ".jsonl"))
+            )
+        return [self.path]
+
+    def _scan_sources(self):
+        # -> (путь -> источник, путь шарда -> шаблон, stamp папки); self не меняется
+        dir_stamp = _stat_key(self.path) if os.path.isdir(self.path or "") else None
+        sources, shard_templates = {}, {}
+        for p in self._source_paths():
+            sources[p] = _make_source(p)
+            base = os.path.basename(p)
+            stem = base[:-len(".jsonl")] if base.endswith(".jsonl") else base[:-len(".json")]
+            shard_templates[p] = stem if stem.endswith(".svg.j2") else None
+        return sources, shard_templates, dir_stamp
+
+    def _ensure_sources(self):
+        if self._sources is not None:
+            return
+        self._sources, self._shard_templates, self._dir_stamp = self._scan_sources()
+
+    def _load_source(self, path):
+        src = self._sources[path]
+        if src.stamp is None:
+            with span("presets.load"):
+                src.load()
+            for name, template in src.index():
+                self._by_name[name] = path
+                self._by_template.setdefault(template, []).append(name)
+
+    def _load_for(self, template=None):
+        # Шарды чужих шаблонов не трогаем — всё остальное загружаем при первом обращении
+        self._ensure_sources()
+        for path, shard_tpl in self._shard_templates.items():
+            if template is None or shard_tpl is None or shard_tpl == template:
+                self._load_source(path)
+
+    def _rebuild_index(self):
+        self._by_name = {}
+        self._by_template = {}
+        for path, src in self._sources.items():
+            if src.stamp is not None:
+                for name, template in src.index():
+                    self._by_name[name] = path
+                    self._by_template.setdefault(template, []).append(name)
+
+    def refresh(self):
+        # Перечитать изменившиеся файлы; True — если что-то поменялось
+        with self._lock:
+            if self._sources is None:
+                return False
+            changed = False
+            if os.path.isdir(self.path or "") and _stat_key(self.path) != self._dir_stamp:
+                # Добавились/удалились шарды — новый набор источников собирается локально:
+                # если какой-то шард не разобрался, исключение вылетает до подмены и прежние пресеты остаются
+                sources, shard_templates, dir_stamp = self._scan_sources()
+                for p, src in self._sources.items():
+                    if src.stamp is not None and p in sources:
+                        sources[p].load()
+                self._sources, self._shard_templates, self._dir_stamp = sources, shard_templates, dir_stamp
+                changed = True
+            try:
+                for src in self._sources.values():
+                    if src.stamp is not None and _stat_key(src.path) != src.stamp:
+                        src.load()
+                        changed = True
+            finally:
+                # Индекс — по тому, что успело перезагрузиться (упавший источник остаётся прежним)
+                if changed:
+                    self._rebuild_index()
+            return changed
+
+    def seed(self, path, stamp, entries):
+        # Пресеты JSON-файла, уже разобранные (бандл); stamp — (mtime_ns, size) на момент сборки.
+        # -> True, если источник принят (ещё не загружен и файл с тех пор не менялся)
+        with self._lock:
+            self._ensure_sources()
+            src = self._sources.get(path)
+            if not isinstance(src, _JsonSource) or src.stamp is not None or _stat_key(path) != tuple(stamp):
+                return False
+            src.entries = entries
+            src.stamp = tuple(stamp)
+            for name, template in src.index():
+                self._by_name[name] = path
+                self._by_template.setdefault(template, []).append(name)
+            return True
+
+    def ensure_loaded(self, template=None):
+        with self._lock:
+            self._load_for(template)
+
+    def watched_paths(self):
+        # Файлы/папка для QFileSystemWatcher
+        with self._lock:
+            self._ensure_sources()
+            paths = list(self._sources)
+            if self.path and os.path.isdir(self.path):
+                paths.append(self.path)
+            return paths
+
+    # ---- Запросы ----
+    def names(self, template=None):
+        with self._lock:
+            self._load_for(template)
+            if template is None:
+                return list(self._by_name)
+            return list(self._by_template.get(template, ()))
+
+    def templates(self):
+        with self._lock:
+            self._load_for()
+            return [t for t in self._by_template if t]
+
+    def get(self, name):
+        with self._lock:
+            path = self._by_name.get(name)
+            if path is None:
+                self._load_for()
+                path = self._by_name.get(name)
+            return self._sources[path].get(name) if path else None
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def __len__(self):
+        return len(self.names())
+
+    def as_dict(self):
+        # Совместимость со старым форматом load_presets(): {"presets": {...}}
+        return {"presets": {name: self.get(name) for name in self.names()}}
+
+
+def write_jsonl(presets, path):
+    # Конвертация {"ИМЯ": пресет} -> JSONL в формате, который индексируется без полного разбора
+    with open(path, "w", encoding="utf-8") as f:
+        for name, preset in presets.items():
+            row = {"name": name, "template": preset.get("template")}
+            row.update({k: v for k, v in preset.items() if k != "template"})
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
@@ -0,0 +1,78 @@
+# === AXIOM_PY_HEADER ===
+# FILE: preview_worker.py
+# TITLE: AXIOM SVG GENERATOR — PREVIEW WORKER
+# VERSION: v1.2
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Фоновый рендер предпросмотра SVG на QThreadPool с отбрасыванием устаревших результатов.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — PreviewRenderTask + PreviewSignals: рендер вне GUI-потока, номер последовательности.
+# v1.1 — 2026-10-18 — BackgroundTask: произвольная фоновая загрузка (пресеты) с сигналом результата.
+# v1.2 — 2026-10-18 — Спан preview.render и счётчик preview.stale (perf.py).
+# =======================
+
+"""
+preview_worker.py — рендер предпросмотра вне GUI-потока.
+— Каждая задача несёт номер последовательности (seq); панель принимает только последний.
+— Если к старту задачи уже запрошен более новый рендер — задача завершается без работы.
+— BackgroundTask — общая фоновая задача (например, загрузка пресетов при открытии панели).
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+try:
+    from .perf import span, incr
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from perf import span, incr
+
+
+class PreviewSignals(QObject):
+    # seq, svg-байты (пусто при ошибке), текст ошибки (пусто при успехе)
+    finished = pyqtSignal(int, bytes, str)
+
+
+class PreviewRenderTask(QRunnable):
+    def __init__(self, generator, template_name, params, seq, signals, latest_seq):
+        super().__init__()
+        self.generator = generator
+        self.template_name = template_name
+        self.params = params
+        self.seq = seq
+        self.signals = signals
+        self.latest_seq = latest_seq  # callable -> номер последнего запроса
+
+    def run(self):
+        if self.seq != self.latest_seq():
+            incr("preview.stale")
+            return  # пока ждали в очереди, пользователь напечатал ещё
+        try:
+            with span("preview.render"):
+                svg_bytes = self.generator.render_to_bytes(self.template_name, self.params)
+        except Exception as e:
+            self.signals.finished.emit(self.seq, b"", str(e))
+            return
+        self.signals.finished.emit(self.seq, svg_bytes, "")
+
+
+class TaskSignals(QObject):
+    done = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class BackgroundTask(QRunnable):
+    # fn(*args) в пуле потоков; результат/ошибка — сигналом в GUI-поток
+    def __init__(self, signals, fn, *args):
+        super().__init__()
+        self.signals = signals
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.done.emit(result)
@@ -0,0 +1,421 @@
+# === AXIOM_PY_HEADER ===
+# FILE: svg_animate.py
+# TITLE: AXIOM SVG GENERATOR — SMIL FRAMES & EXPORT
+# VERSION: v1.0
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Кадры SMIL-анимации (animate / animateTransform / set) как статичные SVG, экспорт PNG-последовательности / APNG / GIF.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — AnimatedSVG: цикл, кадр на момент t; FrameRing; параллельная растеризация кадров, сборка APNG без зависимостей.
+# =======================
+
+"""
+svg_animate.py — анимация шаблонов AXIOM (SMIL) без опроса QSvgWidget по таймеру.
+— AnimatedSVG(svg): разбор один раз; frame(t) — статичный SVG на момент t (атрибуты посчитаны,
+  элементы анимации удалены). Детерминированно: не зависит от часов, кадры можно считать в любом процессе.
+  Поддержка: animate / animateColor / set / animateTransform (values / from-to-by, keyTimes,
+  calcMode linear | discrete, begin, repeatCount, fill="freeze", additive="sum").
+— cycle_duration(): общий период всех анимаций (НОК длительностей, не длиннее MAX_CYCLE;
+  иначе — самая длинная длительность, шов на стыке цикла).
+— FrameRing — кольцевой буфер готовых кадров для проигрывания по времени.
+— export_frames(): растеризация кадров одного цикла пулом процессов -> PNG-последовательность,
+  APNG (сборка чанков без сторонних библиотек) или GIF (нужен Pillow).
+Запуск: python generate_svg.py --preset VIKTOR_CORE_LIVE --out live.svg --frames apng --fps 24
+"""
+
+import logging
+import math
+import os
+import re
+import struct
+import time
+import zlib
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow необязателен: нужен только для GIF
+    Image = None
+
+try:
+    from .perf import span
+    from .output_index import atomic_write
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from perf import span
+    from output_index import atomic_write
+
+log = logging.getLogger("axiom.svg")
+
+SVG_NS = "http://www.w3.org/2000/svg"
+XLINK_NS = "http://www.w3.org/1999/xlink"
+ANIMATION_TAGS = {"animate", "animateColor", "animateTransform", "set", "animateMotion"}
+FRAME_FORMATS = ("png", "apng", "gif")
+DEFAULT_FPS = 24
+MAX_CYCLE = 12.0  # с; длиннее — цикл по самой длинной анимации
+FRAMES_DIR = "frames"
+
+ET.register_namespace("", SVG_NS)
+ET.register_namespace("xlink", XLINK_NS)
+
+_CLOCK_RE = re.compile(r"^\s*(-?[\d.]+)\s*(ms|s|min|h)?\s*$")
+_NUMBER_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_HEX_RE = re.compile(r"^#([0-9a-fA-F]{3}|[0-9a-fA-F]{6})$")
+_CLOCK_UNITS = {None: 1.0, "s": 1.0, "ms": 0.001, "min": 60.0, "h": 3600.0}
+
+
+def parse_clock(value, default=0.0):
+    # "2.8s" / "500ms" / "1.5" -> секунды; indefinite / пусто / мусор -> default
+    m = _CLOCK_RE.match(value or "")
+    if not m:
+        return default
+    return float(m.group(1)) * _CLOCK_UNITS[m.group(2)]
+
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def _format_number(x):
+    text = f"{x:.3f}".rstrip("0").rstrip(".")
+    return "0" if text in ("-0", "") else text
+
+
+# ==== Значения: число-шаблон / цвет / строка ====
+def _parse_value(text):
+    text = text.strip()
+    m = _HEX_RE.match(text)
+    if m:
+        h = m.group(1)
+        if len(h) == 3:
+            h = "".join(c * 2 for c in h)
+        return ("color", tuple(int(h[i:i + 2], 16) for i in (0, 2, 4)))
+    numbers = [float(n) for n in _NUMBER_RE.findall(text)]
+    if numbers:
+        # «Форма» значения: текст между числами должен совпасть, чтобы интерполировать
+        return ("num", tuple(_NUMBER_RE.split(text)), numbers)
+    return ("str", text)
+
+
+def _interpolate(a, b, f):
+    if a[0] == b[0] == "color":
+        rgb = (round(x + (y - x) * f) for x, y in zip(a[1], b[1]))
+        return "#" + "".join(f"{c:02x}" for c in rgb)
+    if a[0] == b[0] == "num" and a[1] == b[1]:
+        nums = [x + (y - x) * f for x, y in zip(a[2], b[2])]
+        return _render_value((a[0], a[1], nums))
+    return _render_value(a)  # не интерполируется — дискретно до конца отрезка
+
+
+def _render_value(v):
+    if v[0] == "color":
+        return "#" + "".join(f"{c:02x}" for c in v[1])
+    if v[0] == "num":
+        parts = [v[1][0]]
+        for n, tail in zip(v[2], v[1][1:]):
+            parts.append(_format_number(n))
+            parts.append(tail)
+        return "".join(parts)
+    return v[1]
+
+
+class _Animation:
+    __slots__ = ("target", "kind", "attr", "values", "key_times", "discrete", "begin", "dur",
+                 "repeat", "freeze", "additive", "transform_type")
+
+    def __init__(self, target, node):
+        kind = _local(node.tag)
+        get = node.get
+        self.target = target
+        self.kind = kind
+        self.attr = get("attributeName")
+        self.begin = parse_clock(get("begin"), 0.0)
+        self.dur = parse_clock(get("dur"), 0.0)
+        self.freeze = get("fill") == "freeze"
+        self.additive = get("additive") == "sum"
+        self.transform_type = get("type", "translate")
+        repeat = get("repeatCount")
+        self.repeat = math.inf if repeat == "indefinite" else parse_clock(repeat, 1.0)
+        if kind == "set":
+            raw = [get("to", "")]
+            self.discrete = True
+            self.dur = self.dur or math.inf
+        elif get("values"):
+            raw = [v for v in get("values").split(";") if v.strip()]
+            self.discrete = get("calcMode") == "discrete"
+        else:
+            start = get("from", target.get(self.attr, "0"))
+            if get("to") is not None:
+                end = get("to")
+            else:
+                by = _parse_value(get("by", "0"))
+                base = _parse_value(start)
+                end = _render_value(base[:2] + ([x + y for x, y in zip(base[2], by[2])],)) \
+                    if base[0] == by[0] == "num" else start
+            raw = [start, end]
+            self.discrete = get("calcMode") == "discrete"
+        self.values = [_parse_value(v) for v in raw]
+        key_times = get("keyTimes")
+        if key_times:
+            self.key_times = [float(k) for k in key_times.split(";") if k.strip()]
+        else:
+            n = len(self.values)
+            steps = n if self.discrete else max(n - 1, 1)
+            self.key_times = [i / steps for i in range(n)]
+
+    def sample(self, t):
+        # -> строка значения на момент t или None (анимация не активна — базовое значение)
+        if self.dur <= 0 or not self.values or not self.attr:
+            return None
+        local = t - self.begin
+        if local < 0:
+            return None
+        active = self.dur * self.repeat
+        if local >= active:
+            if not self.freeze:
+                return None
+            progress = 1.0 if self.repeat == int(self.repeat) else (active % self.dur) / self.dur
+        else:
+            progress = (local % self.dur) / self.dur
+        values, kt = self.values, self.key_times
+        if len(values) == 1:
+            return _render_value(values[0])
+        if self.discrete:
+            i = max(j for j, k in enumerate(kt) if k <= progress) if progress >= kt[0] else 0
+            return _render_value(values[min(i, len(values) - 1)])
+        if progress >= kt[-1]:
+            return _render_value(values[-1])
+        for i in range(len(kt) - 1):
+            if kt[i] <= progress < kt[i + 1]:
+                span_len = kt[i + 1] - kt[i]
+                f = (progress - kt[i]) / span_len if span_len > 0 else 0.0
+                return _interpolate(values[i], values[i + 1], f)
+        return _render_value(values[0])
+
+
+class AnimatedSVG:
+    def __init__(self, svg):
+        if isinstance(svg, bytes):
+            svg = svg.decode("utf-8")
+        self.root = ET.fromstring(svg)
+        self.animations = []
+        # Элементы анимации удаляются из дерева один раз; цели запоминают базовые атрибуты
+        for parent in list(self.root.iter()):
+            for child in list(parent):
+                if _local(child.tag) in ANIMATION_TAGS:
+                    if _local(child.tag) != "animateMotion":  # движение по пути не поддерживается — кадр статичен
+                        self.animations.append(_Animation(parent, child))
+                    parent.remove(child)
+        self._base = {id(a.target): dict(a.target.attrib) for a in self.animations}
+        self._targets = {id(a.target): a.target for a in self.animations}
+
+    @property
+    def animated(self):
+        return bool(self.animations)
+
+    def cycle_duration(self, max_cycle=MAX_CYCLE):
+        # Бесконечные анимации — общий период (НОК длительностей с шагом 10 мс);
+        # только конечные — до окончания последней. Не длиннее max_cycle.
+        timed = [a for a in self.animations if 0 < a.dur < math.inf]
+        if not timed:
+            return 0.0
+        looping = [a.dur for a in timed if a.repeat == math.inf]
+        if not looping:
+            return min(max(a.begin + a.dur * a.repeat for a in timed), max_cycle)
+        lcm = 1
+        for d in looping:
+            lcm = math.lcm(lcm, max(1, round(d * 100)))
+        cycle = lcm / 100
+        return cycle if cycle <= max_cycle else max(looping)
+
+    def frame_times(self, fps=DEFAULT_FPS, duration=None):
+        duration = self.cycle_duration() if duration is None else duration
+        count = max(1, round(duration * fps))
+        return [i / fps for i in range(count)]
+
+    def frame(self, t):
+        # Статичный SVG на момент t
+        with span("anim.frame"):
+            for key, target in self._targets.items():
+                target.attrib.clear()
+                target.attrib.update(self._base[key])
+            for anim in self.animations:
+                value = anim.sample(t)
+                if value is None:
+                    continue
+                if anim.kind == "animateTransform":
+                    value = f"{anim.transform_type}({value})"
+                    base = anim.target.get("transform") if anim.additive else None
+                    anim.target.set("transform", f"{base} {value}" if base else value)
+                else:
+                    anim.target.set(anim.attr, value)
+            return ET.tostring(self.root, encoding="unicode")
+
+
+class FrameRing:
+    """
+    Кольцевой буфер кадров одного цикла. Кадр выбирается по прошедшему времени,
+    а не по счётчику тиков: дрожание таймера не замедляет и не ускоряет анимацию.
+    """
+
+    def __init__(self, frames=(), fps=DEFAULT_FPS):
+        self.reset(frames, fps)
+
+    def reset(self, frames, fps=DEFAULT_FPS):
+        self._frames = list(frames)
+        self.fps = fps
+
+    def __len__(self):
+        return len(self._frames)
+
+    def at(self, elapsed):
+        if not self._frames:
+            return None
+        return self._frames[int(elapsed * self.fps) % len(self._frames)]
+
+
+# ==== Растеризация кадров: пул процессов, QGuiApplication на воркер ====
+_worker_anim = None
+_worker_px = None
+
+
+def _init_frame_worker(svg, px):
+    global _worker_anim, _worker_px
+    try:
+        from .icon_service import ensure_gui_app
+    except ImportError:
+        from icon_service import ensure_gui_app
+    ensure_gui_app()
+    _worker_anim = AnimatedSVG(svg)
+    _worker_px = px
+
+
+def _render_frame(t):
+    try:
+        from .icon_service import rasterize_png
+    except ImportError:
+        from icon_service import rasterize_png
+    return rasterize_png(_worker_anim.frame(t).encode("utf-8"), _worker_px)
+
+
+def render_frames(svg, times, px, jobs=None):
+    # -> [PNG bytes] в порядке times; jobs=1 — в текущем процессе
+    try:
+        import PyQt5.QtSvg  # noqa: F401 — проверка до запуска пула: иначе воркеры падают в initializer
+    except ImportError:
+        raise RuntimeError("Frame rasterization needs PyQt5 (QtSvg)") from None
+    jobs = min(jobs or os.cpu_count() or 1, len(times))
+    if jobs <= 1:
+        _init_frame_worker(svg, px)
+        return [_render_frame(t) for t in times]
+    chunksize = max(1, len(times) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_frame_worker, initargs=(svg, px)) as pool:
+        return list(pool.map(_render_frame, times, chunksize=chunksize))
+
+
+# ==== APNG: чанки PNG-кадров -> acTL / fcTL / IDAT / fdAT ====
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_chunks(data):
+    if not data.startswith(_PNG_SIGNATURE):
+        raise ValueError("Not a PNG")
+    pos = len(_PNG_SIGNATURE)
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        yield kind, data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+
+
+def _chunk(kind, payload):
+    return struct.pack(">I", len(payload)) + kind + payload + struct.pack(">I", zlib.crc32(kind + payload))
+
+
+def build_apng(pngs, fps=DEFAULT_FPS, loops=0):
+    """
+    Собирает APNG из PNG-кадров одного размера и формата (как пишет rasterize_png).
+    loops=0 — бесконечно. Кадры полностью перекрывают холст (dispose NONE, blend SOURCE).
+    """
+    if not pngs:
+        raise ValueError("No frames")
+    frames = [list(_png_chunks(png)) for png in pngs]
+    ihdr = next(payload for kind, payload in frames[0] if kind == b"IHDR")
+    width, height = struct.unpack(">II", ihdr[:8])
+    delay = (1, fps) if fps == int(fps) else (round(1000 / fps), 1000)
+    out = [_PNG_SIGNATURE, _chunk(b"IHDR", ihdr), _chunk(b"acTL", struct.pack(">II", len(frames), loops))]
+    seq = 0
+    for index, chunks in enumerate(frames):
+        if next(payload for kind, payload in chunks if kind == b"IHDR") != ihdr:
+            raise ValueError(f"Frame {index}: size/format differs from frame 0")
+        out.append(_chunk(b"fcTL", struct.pack(">IIIIIHHBB", seq, width, height, 0, 0,
+                                                 int(delay[0]), int(delay[1]), 0, 0)))
+        seq += 1
+        for kind, payload in chunks:
+            if kind == b"PLTE" and index == 0:
+                out.insert(2, _chunk(kind, payload))
+            elif kind == b"IDAT":
+                if index == 0:
+                    out.append(_chunk(b"IDAT", payload))
+                else:
+                    out.append(_chunk(b"fdAT", struct.pack(">I", seq) + payload))
+                    seq += 1
+    out.append(_chunk(b"IEND", b""))
+    return b"".join(out)
+
+
+def build_gif(pngs, fps=DEFAULT_FPS, loops=0):
+    if Image is None:
+        raise RuntimeError("GIF export needs Pillow (pip install pillow); use --frames png or apng")
+    import io
+    images = [Image.open(io.BytesIO(png)).convert("RGBA") for png in pngs]
+    buf = io.BytesIO()
+    images[0].save(buf, "GIF", save_all=True, append_images=images[1:], duration=round(1000 / fps),
+                   loop=loops, disposal=2)
+    return buf.getvalue()
+
+
+def frame_paths(style_dir, stem, fmt, count=0):
+    # png -> style/frames/<stem>/<stem>_0000.png ...; apng -> style/<stem>.apng; gif -> style/<stem>.gif
+    if fmt == "png":
+        folder = os.path.join(style_dir, FRAMES_DIR, stem)
+        return [os.path.join(folder, f"{stem}_{i:04d}.png") for i in range(count)]
+    return [os.path.join(style_dir, f"{stem}.{fmt}")]
+
+
+def export_frames(svg, style_dir, stem, fmt="png", fps=DEFAULT_FPS, px=64, jobs=None):
+    """
+    Один цикл анимации -> файлы кадров. Возвращает (пути, число кадров, цикл в секундах).
+    Статичный SVG даёт один кадр.
+    """
+    if fmt not in FRAME_FORMATS:
+        raise ValueError(f"frames format must be one of {FRAME_FORMATS}")
+    anim = AnimatedSVG(svg)
+    cycle = anim.cycle_duration()
+    times = anim.frame_times(fps, cycle) if anim.animated else [0.0]
+    pngs = render_frames(svg, times, px, jobs)
+    if fmt == "png":
+        paths = frame_paths(style_dir, stem, fmt, len(pngs))
+        os.makedirs(os.path.dirname(paths[0]), exist_ok=True)
+        for path, png in zip(paths, pngs):
+            atomic_write(path, png, suffix=".png")
+        return paths, len(pngs), cycle
+    data = build_apng(pngs, fps) if fmt == "apng" else build_gif(pngs, fps)
+    path = frame_paths(style_dir, stem, fmt)[0]
+    atomic_write(path, data, suffix=f".{fmt}")
+    return [path], len(pngs), cycle
+
+
+def run_frame_export(svg, style_dir, stem, fmt="png", fps=DEFAULT_FPS, px=64, jobs=None):
+    # Экспорт + отчёт в стиле run_batch()
+    started = time.perf_counter()
+    paths, count, cycle = export_frames(svg, style_dir, stem, fmt, fps, px, jobs)
+    elapsed = time.perf_counter() - started
+    if not cycle:
+        log.warning(f"⚠ {stem}: нет анимации — экспортирован один кадр")
+    rate = count / elapsed if elapsed > 0 else 0.0
+    target = paths[0] if len(paths) == 1 else os.path.dirname(paths[0])
+    log.info(f"Frames: {count} frames ({cycle:g}s cycle @ {fps} fps, {px}px, {fmt}), "
+             f"{elapsed:.2f}s, {rate:.1f} frames/sec -> {target}")
+    return paths
@@ -0,0 +1,250 @@
+# === AXIOM_PY_HEADER ===
+# FILE: svg_atlas.py
+# TITLE: AXIOM SVG GENERATOR — ATLAS BUILDER
+# VERSION: v1.1
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Сборка наборов иконок в один SVG-спрайт (<symbol>) и один PNG-атлас с JSON-индексом.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — build_atlas(): спрайт + PNG-атлас + индекс; IconAtlas: O(1) выборка иконки из одного файла.
+# v1.1 — 2026-10-18 — logging (axiom.svg) вместо print для сводок и ошибок.
+# =======================
+
+"""
+svg_atlas.py — атлас иконок вместо сотен отдельных SVG.
+— <имя>.sprite.svg  — все иконки как <symbol id="axiom-<иконка>">; id внутри символов получают префикс иконки
+— <имя>.atlas.png   — сетка ячеек cell×cell (×DPR), по иконке в ячейке
+— <имя>.atlas.json  — индекс: иконка -> {"symbol", "rect": [x, y, w, h], "range": [start, end], "attrs", "template"}
+  range — байтовый диапазон содержимого символа в спрайте: SVG одной иконки вырезается без разбора файла.
+IconAtlas читает индекс и один файл (PNG или спрайт) при первом обращении; дальше — срез по rect/range.
+"""
+
+import json
+import logging
+import math
+import os
+import re
+import time
+
+try:
+    from .output_index import atomic_write
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from output_index import atomic_write
+
+log = logging.getLogger("axiom.svg")
+
+ATLAS_VERSION = 1
+SYMBOL_PREFIX = "axiom"
+SVG_NS = "http://www.w3.org/2000/svg"
+
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_ROOT_RE = re.compile(r"<svg\b([^>]*)>(.*)</svg>\s*$", re.S)
+_ROOT_DROP_RE = re.compile(r'\s(?:width|height|xmlns(?::\w+)?)="[^"]*"')
+_ID_RE = re.compile(r'\bid="([^"]+)"')
+_SLUG_RE = re.compile(r"[^a-z0-9_-]+")
+
+
+def atlas_paths(out_dir, name):
+    base = os.path.join(out_dir, name)
+    return base + ".sprite.svg", base + ".atlas.png", base + ".atlas.json"
+
+
+def symbol_id(icon_name):
+    return f"{SYMBOL_PREFIX}-{_SLUG_RE.sub('-', icon_name.lower()).strip('-')}"
+
+
+def split_svg(svg_text):
+    # Корневой <svg>: -> (атрибуты без width/height/xmlns, содержимое без комментариев)
+    m = _ROOT_RE.search(_COMMENT_RE.sub("", svg_text))
+    if not m:
+        raise ValueError("No root <svg> element")
+    attrs = _ROOT_DROP_RE.sub("", m.group(1)).strip().rstrip("/").strip()
+    inner = "\n".join(line.rstrip() for line in m.group(2).splitlines() if line.strip())
+    return attrs, inner
+
+
+def prefix_ids(inner, prefix):
+    # Уникальные id внутри спрайта: id="g" -> id="<prefix>-g", ссылки url(#g) / href="#g" следом
+    for old in set(_ID_RE.findall(inner)):
+        new = f"{prefix}-{old}"
+        esc = re.escape(old)
+        inner = re.sub(rf'\bid="{esc}"', f'id="{new}"', inner)
+        inner = re.sub(rf"url\(#{esc}\)", f"url(#{new})", inner)
+        inner = re.sub(rf'href="#{esc}"', f'href="#{new}"', inner)
+    return inner
+
+
+def icon_name(item):
+    return item.get("name") or os.path.splitext(os.path.basename(item["output"]))[0]
+
+
+def build_sprite(rendered):
+    """
+    rendered: [(имя, svg_text)] -> (байты спрайта, {имя: {"symbol", "range", "attrs"}}).
+    """
+    chunks = [f'<svg xmlns="{SVG_NS}" style="display:none">\n'.encode("utf-8")]
+    pos = len(chunks[0])
+    entries = {}
+    for name, svg_text in rendered:
+        attrs, inner = split_svg(svg_text)
+        sid = symbol_id(name)
+        head = f'<symbol id="{sid}" {attrs}>\n'.encode("utf-8")
+        body = prefix_ids(inner, sid).encode("utf-8")
+        start = pos + len(head)
+        entries[name] = {"symbol": sid, "range": [start, start + len(body)], "attrs": attrs}
+        chunks += [head, body, b"\n</symbol>\n"]
+        pos = start + len(body) + len(b"\n</symbol>\n")
+    chunks.append(b"</svg>\n")
+    return b"".join(chunks), entries
+
+
+def build_png_atlas(rendered, px, columns=None):
+    # Сетка ячеек px×px: -> (PNG-байты, {имя: [x, y, w, h]}, (ширина, высота))
+    from PyQt5.QtCore import QBuffer, QIODevice, Qt
+    from PyQt5.QtGui import QImage, QPainter
+
+    try:
+        from .icon_service import ensure_gui_app, rasterize_image
+    except ImportError:
+        from icon_service import ensure_gui_app, rasterize_image
+
+    ensure_gui_app()
+    columns = columns or max(1, math.ceil(math.sqrt(len(rendered))))
+    rows = max(1, math.ceil(len(rendered) / columns))
+    atlas = QImage(columns * px, rows * px, QImage.Format_ARGB32_Premultiplied)
+    atlas.fill(Qt.transparent)
+    rects = {}
+    painter = QPainter(atlas)
+    for i, (name, svg_text) in enumerate(rendered):
+        x, y = (i % columns) * px, (i // columns) * px
+        painter.drawImage(x, y, rasterize_image(svg_text.encode("utf-8"), px))
+        rects[name] = [x, y, px, px]
+    painter.end()
+    buf = QBuffer()
+    buf.open(QIODevice.WriteOnly)
+    atlas.save(buf, "PNG")
+    return bytes(buf.data()), rects, (atlas.width(), atlas.height())
+
+
+def build_atlas(gen, items, name="icons", out_dir=None, cell=64, dpr=1.0, png=True, columns=None):
+    """
+    Рендерит элементы пакета ({"template", "params", "output"|"name"}) в память и собирает
+    спрайт, PNG-атлас (png=True) и индекс в out_dir (по умолчанию style/).
+    Возвращает (индекс, ошибки [(имя, текст)]); элементы с ошибкой рендера в атлас не попадают.
+    """
+    out_dir = out_dir or gen.style_dir
+    rendered, errors, templates = [], [], {}
+    for item in items:
+        key = icon_name(item)
+        try:
+            rendered.append((key, gen.render_to_string(item["template"], item.get("params", {}))))
+            templates[key] = item["template"]
+        except Exception as e:
+            errors.append((key, f"{type(e).__name__}: {e}"))
+
+    sprite_path, png_path, index_path = atlas_paths(out_dir, name)
+    sprite, symbols = build_sprite(rendered)
+    icons = {key: dict(symbols[key], template=templates[key]) for key, _ in rendered}
+    index = {
+        "version": ATLAS_VERSION,
+        "sprite": os.path.basename(sprite_path),
+        "atlas": None,
+        "cell": cell,
+        "dpr": dpr,
+        "icons": icons,
+    }
+    if png and rendered:
+        data, rects, size = build_png_atlas(rendered, max(1, round(cell * dpr)), columns)
+        for key, rect in rects.items():
+            icons[key]["rect"] = rect
+        index["atlas"] = os.path.basename(png_path)
+        index["atlas_size"] = list(size)
+        atomic_write(png_path, data, suffix=".png")
+    atomic_write(sprite_path, sprite)
+    atomic_write(index_path, json.dumps(index, ensure_ascii=False, indent=1), suffix=".json")
+    return index, errors
+
+
+def run_atlas(gen, items, name="icons", cell=64, dpr=1.0, png=True):
+    # Сборка + отчёт в стиле run_batch()
+    started = time.perf_counter()
+    index, errors = build_atlas(gen, items, name, cell=cell, dpr=dpr, png=png)
+    elapsed = time.perf_counter() - started
+    for key, error in errors:
+        log.error(f"❗ {key}: {error}")
+    sprite_path, _, index_path = atlas_paths(gen.style_dir, name)
+    size = index.get("atlas_size")
+    atlas_info = f", atlas {size[0]}x{size[1]}" if size else ""
+    log.info(f"Atlas: {len(index['icons'])} icons, {len(errors)} failed, "
+             f"sprite {os.path.getsize(sprite_path) / 1024:.1f} KB{atlas_info}, {elapsed:.2f}s -> {index_path}")
+    return index, errors
+
+
+class IconAtlas:
+    """
+    Загрузчик атласа: names(), rect(имя), pixmap(имя), icon(имя), svg_bytes(имя).
+    Индекс читается сразу, PNG/спрайт — одним чтением при первом запросе; срез иконки — O(1).
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        base = os.path.dirname(os.path.abspath(index_path))
+        with open(index_path, encoding="utf-8") as f:
+            self.index = json.load(f)
+        if self.index.get("version") != ATLAS_VERSION:
+            raise ValueError(f"Unsupported atlas version: {self.index.get('version')}")
+        self.icons = self.index["icons"]
+        self.dpr = self.index.get("dpr", 1.0)
+        self.sprite_path = os.path.join(base, self.index["sprite"])
+        self.png_path = os.path.join(base, self.index["atlas"]) if self.index.get("atlas") else None
+        self._sprite = None
+        self._atlas = None
+        self._pixmaps = {}
+
+    def names(self):
+        return list(self.icons)
+
+    def __contains__(self, name):
+        return name in self.icons
+
+    def __len__(self):
+        return len(self.icons)
+
+    def rect(self, name):
+        return self.icons[name].get("rect")
+
+    def symbol_href(self, name):
+        # Для <use href="..."> во внешних SVG/HTML
+        return f"{os.path.basename(self.sprite_path)}#{self.icons[name]['symbol']}"
+
+    def svg_bytes(self, name):
+        # Самостоятельный SVG иконки из спрайта (например, для QSvgWidget.load(QByteArray))
+        if self._sprite is None:
+            with open(self.sprite_path, "rb") as f:
+                self._sprite = f.read()
+        entry = self.icons[name]
+        start, end = entry["range"]
+        head = f'<svg xmlns="{SVG_NS}" {entry["attrs"]}>\n'.encode("utf-8")
+        return head + self._sprite[start:end] + b"\n</svg>\n"
+
+    def pixmap(self, name):
+        from PyQt5.QtCore import QRect
+        from PyQt5.QtGui import QPixmap
+
+        pm = self._pixmaps.get(name)
+        if pm is not None:
+            return pm
+        if self.png_path is None:
+            raise ValueError(f"Atlas {self.index_path} has no PNG texture")
+        if self._atlas is None:
+            self._atlas = QPixmap(self.png_path)
+        pm = self._atlas.copy(QRect(*self.icons[name]["rect"]))
+        pm.setDevicePixelRatio(self.dpr)
+        self._pixmaps[name] = pm
+        return pm
+
+    def icon(self, name):
+        from PyQt5.QtGui import QIcon
+        return QIcon(self.pixmap(name))
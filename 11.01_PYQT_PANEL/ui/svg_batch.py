@@ -0,0 +1,238 @@
+# === AXIOM_PY_HEADER ===
+# FILE: svg_batch.py
+# TITLE: AXIOM SVG GENERATOR — BATCH ENGINE
+# VERSION: v1.6
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Пакетный рендер SVG по манифесту или по всем пресетам через пул процессов.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — Манифест JSON/JSONL, режим «все пресеты», пул процессов, сводка items/sec.
+# v1.1 — 2026-10-18 — Инкрементальный режим: воркеры пропускают неизменённые выходы, индекс сохраняется один раз.
+# v1.2 — 2026-10-18 — items_from_presets() читает пресеты из PresetStore.
+# v1.3 — 2026-10-18 — Уровень оптимизации выхода (optimize) передаётся воркерам.
+# v1.4 — 2026-10-18 — stream_batch(): потоковый рендер из генератора, ограниченное число чанков в полёте.
+# v1.5 — 2026-10-18 — logging (axiom.svg) вместо print для сводок и ошибок.
+# v1.6 — 2026-10-18 — Выход в sink (svg_sink.py): воркеры отдают байты, родитель пишет в один zip/tar; run_batch(..., sink=).
+# =======================
+
+"""
+svg_batch.py — пакетный режим генератора AXIOM SVG.
+— Элемент пакета: {"template": ..., "params": {...}, "output": ...}.
+— Источник: манифест (JSON-список / {"items": [...]} / JSONL) или все пресеты из svg_presets.json.
+— Рендер идёт в пуле процессов (по умолчанию — по воркеру на ядро), у каждого воркера свой
+  прогретый AxiomSVGGenerator, ошибки элементов не прерывают пакет.
+— Инкрементальный режим: воркеры читают индекс выходов, а обновления отдают родителю,
+  который сохраняет style/.axiom_svg_index.json один раз в конце.
+— Выход в sink (svg_sink.py, напр. один zip/tar): воркеры возвращают байты и запись индекса,
+  родитель пишет их в sink по мере готовности чанков.
+"""
+
+import os
+import json
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+
+try:
+    from .generate_svg import AxiomSVGGenerator
+    from .output_index import OutputIndex
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from generate_svg import AxiomSVGGenerator
+    from output_index import OutputIndex
+
+log = logging.getLogger("axiom.svg")
+
+
+def load_manifest(path):
+    # JSON (список или {"items": [...]}) либо JSONL — по одному элементу в строке
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            items = [json.loads(line) for line in f if line.strip()]
+        else:
+            data = json.load(f)
+            items = data.get("items", []) if isinstance(data, dict) else data
+    for i, item in enumerate(items):
+        missing = [k for k in ("template", "output") if not item.get(k)]
+        if missing:
+            raise ValueError(f"Manifest item #{i}: missing {', '.join(missing)}")
+        item.setdefault("params", {})
+    return items
+
+
+def items_from_presets(store, template=None):
+    # Пресеты из PresetStore -> элементы пакета (<имя_пресета>.svg в нижнем регистре)
+    items = []
+    for name in store.names(template):
+        preset = store.get(name)
+        items.append({
+            "template": preset["template"],
+            "params": preset.get("params", {}),
+            "output": f"{name.lower()}.svg",
+        })
+    return items
+
+
+# ==== Воркер пула: генератор создаётся один раз на процесс ====
+_worker_gen = None
+_worker_force = False
+
+
+def _init_worker(templates_dir, style_dir, incremental=False, force=False, optimize=0):
+    global _worker_gen, _worker_force
+    _worker_gen = AxiomSVGGenerator(templates_dir, style_dir, incremental=incremental, optimize=optimize)
+    _worker_gen.verbose = False
+    _worker_force = force
+
+
+def _render_chunk(chunk):
+    # -> ([(index, output, error, status)], {output: запись индекса})
+    results = []
+    entries = {}
+    stats = _worker_gen.write_stats
+    index_out = _worker_gen.output_index
+    for index, item in chunk:
+        output = item["output"]
+        try:
+            skipped_before = stats["skipped"]
+            _worker_gen.render(item["template"], item["params"], output, force=_worker_force)
+            status = "skipped" if stats["skipped"] > skipped_before else "written"
+            results.append((index, output, None, status))
+            if status == "written" and index_out is not None:
+                entries[output] = index_out.entries[output]
+        except Exception as e:
+            results.append((index, output, f"{type(e).__name__}: {e}", "failed"))
+    return results, entries
+
+
+def _render_chunk_data(chunk):
+    # -> [(index, output, error, байты, запись индекса)]: файл не пишется, выход уходит родителю в sink
+    results = []
+    for index, item in chunk:
+        try:
+            data, entry = _worker_gen.render_output(item["template"], item["params"])
+            results.append((index, item["output"], None, data, entry))
+        except Exception as e:
+            results.append((index, item["output"], f"{type(e).__name__}: {e}", None, None))
+    return results
+
+
+def _stream_chunks(indexed, worker, init_args, jobs, chunk_size):
+    # Результаты чанков по мере готовности; в памяти — не больше jobs * 2 чанков
+    if jobs == 1:
+        _init_worker(*init_args)
+        while True:
+            chunk = list(islice(indexed, chunk_size))
+            if not chunk:
+                return
+            yield worker(chunk)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=init_args) as pool:
+        pending = set()
+        while True:
+            while len(pending) < jobs * 2:
+                chunk = list(islice(indexed, chunk_size))
+                if not chunk:
+                    break
+                pending.add(pool.submit(worker, chunk))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def render_batch(items, templates_dir="templates", style_dir="style", jobs=None, chunk_size=None,
+                 incremental=False, force=False, optimize=0):
+    """
+    Рендерит все элементы пакета. Возвращает список (index, output, error, status) в порядке
+    манифеста; status — written / skipped / failed, error = None для успешных элементов.
+    jobs=None — по воркеру на ядро; jobs=1 — без пула, в текущем процессе.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    indexed = list(enumerate(items))
+    if not indexed:
+        return []
+    init_args = (templates_dir, style_dir, incremental, force, optimize)
+    results = []
+    entries = {}
+    if jobs == 1:
+        _init_worker(*init_args)
+        chunk_results, entries = _render_chunk(indexed)
+        results.extend(chunk_results)
+    else:
+        # Крупные чанки: меньше IPC на элемент, но не меньше ~4 чанков на воркер
+        chunk_size = chunk_size or max(1, min(256, len(indexed) // (jobs * 4)))
+        chunks = [indexed[i:i + chunk_size] for i in range(0, len(indexed), chunk_size)]
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=init_args) as pool:
+            for chunk_results, chunk_entries in pool.map(_render_chunk, chunks):
+                results.extend(chunk_results)
+                entries.update(chunk_entries)
+    if incremental and entries:
+        index = OutputIndex(style_dir)
+        index.update(entries)
+        index.save()
+    return results
+
+
+def stream_batch(items, templates_dir="templates", style_dir="style", jobs=None, chunk_size=256,
+                 optimize=0, on_result=None, sink=None):
+    """
+    Потоковый рендер: items — любой итератор (в т.ч. генератор на миллионы элементов).
+    В памяти — не больше jobs * 2 чанков; результаты не накапливаются, а отдаются в
+    on_result(index, output, error, status). Без индекса выходов (он держал бы все элементы).
+    sink — OutputSink (svg_sink.py): выходы пишутся в него, а не файлами в style_dir;
+    закрывает sink вызывающий.
+    Возвращает счётчики {"written", "skipped", "failed"}.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    counts = {"written": 0, "skipped": 0, "failed": 0}
+    init_args = (templates_dir, style_dir, False, False, optimize)
+
+    def report(result):
+        counts[result[3]] += 1
+        if on_result is not None:
+            on_result(*result)
+
+    if sink is None:
+        for chunk_results, _ in _stream_chunks(enumerate(items), _render_chunk, init_args, jobs, chunk_size):
+            for result in chunk_results:
+                report(result)
+        return counts
+    for chunk_results in _stream_chunks(enumerate(items), _render_chunk_data, init_args, jobs, chunk_size):
+        for index, output, error, data, entry in chunk_results:
+            if error is None:
+                try:
+                    sink.write(output, data, entry)
+                except ValueError as e:  # повтор имени в архиве
+                    error = str(e)
+            report((index, output, error, "failed" if error else "written"))
+    return counts
+
+
+def run_batch(items, templates_dir="templates", style_dir="style", jobs=None, incremental=True, force=False,
+              optimize=0, sink=None):
+    # Рендер + отчёт: ошибки по элементам и итоговая строка с items/sec; sink — всё в один архив/папку
+    started = time.perf_counter()
+    if sink is None:
+        results = render_batch(items, templates_dir, style_dir, jobs, incremental=incremental, force=force,
+                               optimize=optimize)
+    else:
+        results = []
+        chunk_size = max(1, min(256, len(items) // ((jobs or os.cpu_count() or 1) * 4)))
+        with sink:
+            stream_batch(items, templates_dir, style_dir, jobs, chunk_size, optimize=optimize,
+                         on_result=lambda *result: results.append(result), sink=sink)
+        results.sort()
+        log.info(f"Archive: {sink.summary()}")
+    elapsed = time.perf_counter() - started
+    failed = [r for r in results if r[2]]
+    for index, output, error, _ in failed:
+        log.error(f"❗ [{index}] {output}: {error}")
+    written = sum(1 for r in results if r[3] == "written")
+    skipped = sum(1 for r in results if r[3] == "skipped")
+    rate = len(results) / elapsed if elapsed > 0 else 0.0
+    log.info(f"Batch: {len(results) - len(failed)} ok ({written} written, {skipped} skipped), "
+             f"{len(failed)} failed, {elapsed:.2f}s, {rate:.1f} items/sec")
+    return results
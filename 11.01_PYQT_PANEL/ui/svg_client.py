@@ -0,0 +1,159 @@
+# === AXIOM_PY_HEADER ===
+# FILE: svg_client.py
+# TITLE: AXIOM SVG GENERATOR — DAEMON CLIENT
+# VERSION: v1.0
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Тонкий клиент демона рендера: те же флаги, что у generate_svg.py, без импорта генератора.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — DaemonClient (unix-сокет / localhost TCP, JSON-строки, конвейер), CLI с откатом на локальный рендер.
+# =======================
+
+"""
+svg_client.py — клиент svg_daemon.py.
+Протокол: по JSON-объекту в строке в обе стороны, ответы приходят в порядке запросов (конвейер).
+Запрос: {"id", "op": "render" | "render_bytes" | "stats" | "ping" | "shutdown",
+         "template", "preset", "params", "output", "force"}
+Ответ:  {"id", "ok": true, "path", "status": "written" | "skipped"} / {"id", "ok": true, "svg"} /
+        {"id", "ok": false, "error"}
+
+CLI совместим с generate_svg.py для одиночного рендера:
+    python svg_client.py --preset VIKTOR_CORE --out axiom_core.svg
+Если демон не запущен — тот же argv уходит в generate_svg.main() (обычный холодный запуск).
+Модуль намеренно использует только stdlib: импорт клиента — это и есть стоимость запуска.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+
+# Без tempfile: его импорт заметен на фоне запуска тонкого клиента
+DEFAULT_SOCKET = os.path.join(os.environ.get("TMPDIR", "/tmp"),
+                              f"axiom_svg_{os.getuid() if hasattr(os, 'getuid') else 0}.sock")
+DEFAULT_HOST = "127.0.0.1"
+
+
+class DaemonError(RuntimeError):
+    pass
+
+
+class DaemonClient:
+    def __init__(self, socket_path=DEFAULT_SOCKET, port=None, host=DEFAULT_HOST, timeout=30.0):
+        if port:
+            self.sock = socket.create_connection((host, port), timeout=timeout)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        else:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.settimeout(timeout)
+            self.sock.connect(socket_path)
+        self._file = self.sock.makefile("rb")
+        self._next_id = 0
+
+    def _send(self, requests):
+        lines = []
+        for req in requests:
+            self._next_id += 1
+            req = dict(req, id=req.get("id", self._next_id))
+            lines.append(json.dumps(req, ensure_ascii=False))
+        self.sock.sendall(("\n".join(lines) + "\n").encode("utf-8"))
+
+    def _recv(self):
+        line = self._file.readline()
+        if not line:
+            raise DaemonError("Daemon closed the connection")
+        return json.loads(line)
+
+    def pipeline(self, requests):
+        # Все запросы одним send, затем ответы в том же порядке
+        requests = list(requests)
+        if not requests:
+            return []
+        self._send(requests)
+        return [self._recv() for _ in requests]
+
+    def request(self, req):
+        resp = self.pipeline([req])[0]
+        if not resp.get("ok"):
+            raise DaemonError(resp.get("error", "unknown error"))
+        return resp
+
+    def render(self, template=None, params=None, output=None, preset=None, force=False):
+        return self.request({"op": "render", "template": template, "preset": preset,
+                             "params": params or {}, "output": output, "force": force})
+
+    def render_bytes(self, template=None, params=None, preset=None):
+        resp = self.request({"op": "render_bytes", "template": template, "preset": preset,
+                             "params": params or {}})
+        return resp["svg"].encode("utf-8")
+
+    def close(self):
+        self._file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(description="AXIOM SVG GENERATOR — daemon client", add_help=True)
+    parser.add_argument("--template", "-t", type=str)
+    parser.add_argument("--params", "-p", type=str)
+    parser.add_argument("--out", "-o", type=str)
+    parser.add_argument("--preset", type=str)
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--socket", type=str, default=DEFAULT_SOCKET, help="Unix-сокет демона")
+    parser.add_argument("--port", type=int, help="TCP-порт демона на localhost (вместо сокета)")
+    args, rest = parser.parse_known_args(argv)
+
+    # Флаги, которых демон не обслуживает (--batch, --list, --png, ...) — сразу в обычный CLI
+    if rest or not args.out or not (args.template or args.preset):
+        return _local(argv)
+    try:
+        client = DaemonClient(args.socket, port=args.port)
+    except OSError:
+        return _local(argv)
+    with client:
+        try:
+            resp = client.render(args.template, json.loads(args.params) if args.params else {},
+                                 args.out, preset=args.preset, force=args.force)
+        except DaemonError as e:
+            print(f"❗ {e}")
+            return 1
+    print(f"SVG создан: {resp['path']}" if resp["status"] == "written" else f"Без изменений: {resp['path']}")
+    return 0
+
+
+def _local(argv):
+    # Откат на обычный запуск генератора (без --socket/--port)
+    cleaned, skip = [], False
+    for arg in argv:
+        if skip:
+            skip = False
+            continue
+        if arg in ("--socket", "--port"):
+            skip = True
+            continue
+        if arg.startswith(("--socket=", "--port=")):
+            continue
+        cleaned.append(arg)
+    try:
+        from .generate_svg import main as generate_main
+    except ImportError:  # запуск как CLI-скрипт из ui/
+        from generate_svg import main as generate_main
+    try:
+        generate_main(cleaned)
+    except SystemExit as e:
+        return e.code or 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
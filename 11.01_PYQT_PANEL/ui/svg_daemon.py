@@ -0,0 +1,182 @@
+# === AXIOM_PY_HEADER ===
+# FILE: svg_daemon.py
+# TITLE: AXIOM SVG GENERATOR — RENDER DAEMON
+# VERSION: v1.2
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Долгоживущий сервер рендера на asyncio: прогретые шаблоны и пресеты, JSON-строки, конвейер запросов.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — RenderServer: unix-сокет / localhost TCP, render / render_bytes / stats / shutdown.
+# v1.1 — 2026-10-18 — logging (axiom.svg) вместо print для сводок и ошибок.
+# v1.2 — 2026-10-18 — Шаблон запроса (и шаблон пресета) — только имя *.svg.j2 из templates/: без путей и ../.
+# =======================
+
+"""
+svg_daemon.py — демон рендера вокруг одного AxiomSVGGenerator.
+— Скомпилированные шаблоны (TemplateCache) и PresetStore живут всё время работы процесса;
+  изменения файлов подхватываются как обычно (stat шаблона, refresh() пресетов не чаще раза в секунду).
+— Клиенты — по соединению на клиента, запросы в соединении обрабатываются по порядку
+  (конвейер: можно слать пачку строк, не дожидаясь ответов). Протокол — см. svg_client.py.
+— Рендер — микросекунды CPU, поэтому выполняется прямо в цикле событий, без пула потоков.
+— Индекс выходов сохраняется с задержкой SAVE_DELAY после последней записи и при остановке.
+Запуск: python generate_svg.py --serve [--socket PATH | --port N]
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+
+try:
+    from .svg_client import DEFAULT_SOCKET, DEFAULT_HOST
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from svg_client import DEFAULT_SOCKET, DEFAULT_HOST
+
+log = logging.getLogger("axiom.svg")
+
+SAVE_DELAY = 0.5
+PRESET_REFRESH_INTERVAL = 1.0
+
+
+class RenderServer:
+    def __init__(self, gen):
+        self.gen = gen
+        self.gen.verbose = False
+        self.requests = 0
+        self.clients = 0
+        self.started = time.monotonic()
+        self._stop = None
+        self._save_handle = None
+        self._presets_checked = 0.0
+        self._tasks = set()
+
+    # ---- Запросы ----
+    def _resolve(self, req):
+        # -> (шаблон, params): пресет даёт шаблон и базовые params, явные params приоритетны
+        params = {}
+        template = req.get("template")
+        if req.get("preset"):
+            now = time.monotonic()
+            if now - self._presets_checked > PRESET_REFRESH_INTERVAL:
+                self.gen.preset_store.refresh()
+                self._presets_checked = now
+            preset = self.gen.preset_store.get(req["preset"])
+            if not preset:
+                raise ValueError(f"Preset {req['preset']} not found")
+            params.update(preset.get("params", {}))
+            template = template or preset.get("template")
+        params.update(req.get("params") or {})
+        if not template:
+            raise ValueError("template or preset is required")
+        self._check_template(template)
+        return template, params
+
+    def _check_template(self, template):
+        # Клиент не должен читать через демон произвольные файлы: только имя шаблона из templates/
+        if (not isinstance(template, str) or os.path.basename(template) != template
+                or not template.endswith(".svg.j2")
+                or not os.path.isfile(os.path.join(self.gen.templates_dir, template))):
+            raise ValueError("template must be a *.svg.j2 file name inside templates/")
+
+    def handle(self, req):
+        self.requests += 1
+        op = req.get("op", "render")
+        if op == "render":
+            output = req.get("output")
+            if not output or os.path.basename(output) != output:
+                raise ValueError("output must be a file name inside style/")
+            template, params = self._resolve(req)
+            written = self.gen.write_stats["written"]
+            path = self.gen.render(template, params, output, force=bool(req.get("force")))
+            status = "written" if self.gen.write_stats["written"] > written else "skipped"
+            if status == "written":
+                self._schedule_save()
+            return {"path": path, "status": status}
+        if op == "render_bytes":
+            template, params = self._resolve(req)
+            return {"svg": self.gen.render_to_string(template, params)}
+        if op == "stats":
+            return {
+                "requests": self.requests, "clients": self.clients,
+                "uptime": round(time.monotonic() - self.started, 3),
+                "write_stats": dict(self.gen.write_stats), "template_cache": self.gen.cache_stats(),
+            }
+        if op == "ping":
+            return {}
+        if op == "shutdown":
+            self._stop.set()
+            return {}
+        raise ValueError(f"Unknown op: {op}")
+
+    def _schedule_save(self):
+        # Пачка записей -> одно сохранение индекса
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+        self._save_handle = asyncio.get_running_loop().call_later(SAVE_DELAY, self.gen.save_index)
+
+    async def handle_client(self, reader, writer):
+        self.clients += 1
+        self._tasks.add(asyncio.current_task())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                req_id = None
+                try:
+                    req = json.loads(line)
+                    req_id = req.get("id")
+                    resp = {"id": req_id, "ok": True}
+                    resp.update(self.handle(req))
+                except Exception as e:
+                    resp = {"id": req_id, "ok": False, "error": f"{type(e).__name__}: {e}"}
+                writer.write((json.dumps(resp, ensure_ascii=False) + "\n").encode("utf-8"))
+                await writer.drain()  # ждёт только при переполнении буфера (медленный клиент)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass  # клиент ушёл или демон останавливается
+        finally:
+            self.clients -= 1
+            self._tasks.discard(asyncio.current_task())
+            writer.close()
+
+    # ---- Запуск ----
+    async def serve(self, socket_path=DEFAULT_SOCKET, port=None, host=DEFAULT_HOST):
+        self._stop = asyncio.Event()
+        if port:
+            server = await asyncio.start_server(self.handle_client, host, port)
+            where = f"tcp://{host}:{port}"
+        else:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)  # сокет от прошлого запуска
+            server = await asyncio.start_unix_server(self.handle_client, socket_path)
+            where = f"unix://{socket_path}"
+        log.info(f"AXIOM SVG daemon: {where} (templates: {self.gen.templates_dir}, style: {self.gen.style_dir})")
+        try:
+            async with server:
+                await self._stop.wait()
+                # Простаивающие клиенты держали бы wait_closed() — завершаем их обработчики
+                tasks = list(self._tasks)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            if self._save_handle is not None:
+                self._save_handle.cancel()
+            self.gen.save_index()
+            if not port and os.path.exists(socket_path):
+                os.remove(socket_path)
+        log.info(f"AXIOM SVG daemon: stopped after {self.requests} requests")
+
+
+def run_daemon(gen, socket_path=DEFAULT_SOCKET, port=None):
+    server = RenderServer(gen)
+    try:
+        asyncio.run(server.serve(socket_path, port))
+    except KeyboardInterrupt:
+        gen.save_index()
+    return server
@@ -0,0 +1,171 @@
+# === AXIOM_PY_HEADER ===
+# FILE: svg_optimize.py
+# TITLE: AXIOM SVG GENERATOR — OPTIMIZER
+# VERSION: v1.1
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Пост-обработка отрендеренного SVG: комментарии, пробелы, точность чисел, атрибуты по умолчанию.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — optimize_svg(text, level 0..2), отчёт о размере и времени разбора.
+# v1.1 — 2026-10-18 — Пробелы между тегами внутри <text> сохраняются: «<tspan>A</tspan> <tspan>B</tspan>» не склеивается.
+# =======================
+
+"""
+svg_optimize.py — уменьшение выходных SVG без изменения картинки.
+Уровни:
+— 0 — без изменений
+— 1 — убрать комментарии (включая AXIOM_SVG_TEMPLATE_HEADER), <metadata>, пробелы между тегами и внутри тегов
+— 2 — уровень 1 + округление чисел (PRECISION знаков после точки) + удаление атрибутов со значением по умолчанию
+Результат детерминирован (порядок атрибутов сохраняется) и идемпотентен: повторная оптимизация
+даёт те же байты, поэтому индекс выходов и кеши по хешу работают как прежде.
+Текст внутри элементов (<text>Ω</text>, <style>) не трогается — меняются только теги.
+"""
+
+import re
+import time
+
+OPTIMIZE_LEVELS = (0, 1, 2)
+PRECISION = 3
+
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_METADATA_RE = re.compile(r"<metadata\b.*?</metadata>|<metadata\b[^>]*/>", re.S)
+# Пробелы между тегами; <text> целиком — первой альтернативой, чтобы пробел между <tspan> остался текстом
+_BETWEEN_TAGS_RE = re.compile(r"(<text\b[^>]*/>|<text\b.*?</text>)|(?<=>)\s+(?=<)", re.S)
+_TAG_RE = re.compile(r"<([A-Za-z][\w:.-]*)((?:\s+[\w:.-]+\s*=\s*\"[^\"]*\")*)\s*(/?)>")
+_ATTR_RE = re.compile(r"([\w:.-]+)\s*=\s*\"([^\"]*)\"")
+_NUMBER_RE = re.compile(r"-?(?:\d+\.\d+|\.\d+|\d+)(?:[eE][-+]?\d+)?")
+
+# Числовые атрибуты, в которых округляем числа (включая списки и path-данные)
+_NUMERIC_ATTRS = {
+    "x", "y", "x1", "y1", "x2", "y2", "cx", "cy", "r", "rx", "ry", "width", "height",
+    "d", "points", "viewBox", "stroke-width", "opacity", "fill-opacity", "stroke-opacity",
+    "stop-opacity", "offset", "font-size", "stroke-dashoffset", "stroke-miterlimit",
+}
+
+# Ненаследуемые атрибуты со значением по умолчанию — удаляются всегда (для указанных элементов)
+_DEFAULTS_LOCAL = {
+    "opacity": ("1", None),
+    "x": ("0", {"rect", "text", "use", "image"}),
+    "y": ("0", {"rect", "text", "use", "image"}),
+    "cx": ("0", {"circle", "ellipse"}),
+    "cy": ("0", {"circle", "ellipse"}),
+    "rx": ("0", {"rect"}),
+    "ry": ("0", {"rect"}),
+}
+
+# Наследуемые свойства: удаляются, только если в документе нигде нет другого значения
+# (иначе дочерний элемент с явным значением по умолчанию перекрывает родителя)
+_DEFAULTS_INHERITED = {
+    "fill-opacity": "1",
+    "stroke-opacity": "1",
+    "stroke-width": "1",
+    "stroke-linecap": "butt",
+    "stroke-linejoin": "miter",
+    "stroke-dasharray": "none",
+    "fill-rule": "nonzero",
+    "font-weight": "normal",
+    "font-style": "normal",
+    "text-anchor": "start",
+    "visibility": "visible",
+}
+
+
+def _format_number(match):
+    value = round(float(match.group(0)), PRECISION)
+    if value == int(value):
+        return str(int(value))
+    return f"{value:.{PRECISION}f}".rstrip("0")
+
+
+def round_numbers(value):
+    return _NUMBER_RE.sub(_format_number, value)
+
+
+def _inherited_overrides(svg):
+    # Наследуемые свойства, у которых в документе встречается не-дефолтное значение
+    overrides = set()
+    for name, value in _ATTR_RE.findall(svg):
+        default = _DEFAULTS_INHERITED.get(name)
+        if default is not None and round_numbers(value) != default:
+            overrides.add(name)
+    return overrides
+
+
+def _rewrite_tag(match, level, keep_inherited):
+    tag, attrs, selfclose = match.group(1), match.group(2), match.group(3)
+    parts = []
+    for name, value in _ATTR_RE.findall(attrs):
+        if level >= 2:
+            if name in _NUMERIC_ATTRS:
+                value = round_numbers(value)
+            local = _DEFAULTS_LOCAL.get(name)
+            if local and value == local[0] and (local[1] is None or tag in local[1]):
+                continue
+            if _DEFAULTS_INHERITED.get(name) == value and name not in keep_inherited:
+                continue
+        parts.append(f'{name}="{value}"')
+    body = " ".join([tag] + parts)
+    return f"<{body}/>" if selfclose else f"<{body}>"
+
+
+def optimize_svg(svg, level=1):
+    """SVG-строка -> оптимизированная SVG-строка (level 0 — без изменений)."""
+    if level not in OPTIMIZE_LEVELS:
+        raise ValueError(f"Unknown optimize level: {level} (0..2)")
+    if level == 0:
+        return svg
+    svg = _COMMENT_RE.sub("", svg)
+    svg = _METADATA_RE.sub("", svg)
+    svg = _BETWEEN_TAGS_RE.sub(lambda m: m.group(1) or "", svg.strip())
+    keep_inherited = _inherited_overrides(svg) if level >= 2 else set()
+    svg = _TAG_RE.sub(lambda m: _rewrite_tag(m, level, keep_inherited), svg)
+    return svg + "\n"
+
+
+# ==== Отчёт: размер и время разбора до/после ====
+def _svg_parser():
+    # QSvgRenderer, если есть PyQt5 (то, что реально разбирает QSvgWidget), иначе ElementTree
+    try:
+        from PyQt5.QtCore import QByteArray
+        from PyQt5.QtSvg import QSvgRenderer
+        try:
+            from .icon_service import ensure_gui_app
+        except ImportError:
+            from icon_service import ensure_gui_app
+        ensure_gui_app()
+        return "QSvgRenderer", lambda data: QSvgRenderer(QByteArray(data)).isValid()
+    except ImportError:
+        import xml.etree.ElementTree as ET
+        return "ElementTree", ET.fromstring
+
+
+def _parse_time(parse, docs, repeat=5):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for doc in docs:
+            parse(doc)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best / max(1, len(docs))
+
+
+def optimization_report(pairs, level):
+    # pairs: [(исходные байты, оптимизированные байты)] -> строка отчёта (и dict с цифрами)
+    if not pairs:
+        return "Optimize: нет выходов для отчёта", {}
+    raw = [a for a, _ in pairs]
+    opt = [b for _, b in pairs]
+    parser_name, parse = _svg_parser()
+    raw_size, opt_size = sum(map(len, raw)), sum(map(len, opt))
+    raw_t, opt_t = _parse_time(parse, raw), _parse_time(parse, opt)
+    stats = {
+        "files": len(pairs), "raw_bytes": raw_size, "optimized_bytes": opt_size,
+        "raw_parse_us": raw_t * 1e6, "optimized_parse_us": opt_t * 1e6, "parser": parser_name,
+    }
+    line = (f"Optimize L{level}: {len(pairs)} files, {raw_size / 1024:.1f} KB -> {opt_size / 1024:.1f} KB "
+            f"(-{100 * (1 - opt_size / max(1, raw_size)):.0f}%), parse {raw_t * 1e6:.1f} µs -> "
+            f"{opt_t * 1e6:.1f} µs per file (x{raw_t / max(opt_t, 1e-12):.2f}, {parser_name})")
+    return line, stats
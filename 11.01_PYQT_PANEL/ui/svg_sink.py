@@ -0,0 +1,241 @@
+# === AXIOM_PY_HEADER ===
+# FILE: svg_sink.py
+# TITLE: AXIOM SVG GENERATOR — OUTPUT SINKS
+# VERSION: v1.3
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Куда пишутся выходы пакетного рендера: папка, потоковый zip или tar — с индексом имя -> шаблон и хеши.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — DirectorySink / ZipSink / TarSink, open_sink() по расширению, буферизованная запись и один fsync в конце.
+# v1.1 — 2026-10-18 — Временный файл архива — tempfile.mkstemp: параллельные запуски в один путь не пишут в общий .tmp_.
+# v1.2 — 2026-10-18 — write_file(): член из файла на диске копируется порциями (манифест перебора), без чтения целиком.
+# v1.3 — 2026-10-18 — Временные файлы mkstemp (0600) перед os.replace получают FILE_MODE — права как у atomic_write.
+# =======================
+
+"""
+svg_sink.py — приёмники выходов для svg_batch / svg_sweep.
+    with open_sink("style/icons.zip") as sink:
+        sink.write("axiom_core.svg", svg_bytes, {"template": ..., "hash": ..., "params_hash": ...})
+        sink.write_file("icons.sweep.jsonl", "style/icons.sweep.jsonl")  # большой файл — порциями
+— DirectorySink — как прежде: файл на выход (atomic_write), индекс style/.axiom_svg_index.json — один раз в close().
+— ZipSink / TarSink — все выходы в один архив: члены пишутся в файл по мере рендера (в памяти — только
+  список имён), файл открыт с буфером SINK_BUFFER. В close() последним членом добавляется индекс
+  (INDEX_FILE, формат OutputIndex + params_hash), затем flush, один os.fsync и os.replace временного
+  файла — незавершённый архив под конечным именем не появляется.
+Индекс в архиве совместим с инкрементальным режимом: распакованный в style/ архив не перерендеривается.
+"""
+
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import zipfile
+from io import BytesIO
+
+try:
+    from .output_index import OutputIndex, INDEX_FILE, INDEX_VERSION, FILE_MODE, atomic_write
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from output_index import OutputIndex, INDEX_FILE, INDEX_VERSION, FILE_MODE, atomic_write
+
+SINK_BUFFER = 1 << 20  # буфер записи архива, байт
+ZIP_LEVEL = 6
+TAR_MODES = {".tar": "w|", ".tar.gz": "w|gz", ".tgz": "w|gz", ".tar.xz": "w|xz", ".txz": "w|xz",
+             ".tar.bz2": "w|bz2"}
+
+
+class OutputSink:
+    # Общий протокол: write(имя, байты, запись индекса) ... close(); abort() — бросить незавершённое
+    kind = "sink"
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}  # имя -> запись индекса
+        self.bytes_written = 0
+
+    def write(self, name, data, entry=None):
+        if name in self.entries:
+            raise ValueError(f"Duplicate output name: {name}")
+        self._write(name, data)
+        self.entries[name] = dict(entry or {}, size=len(data))
+        self.bytes_written += len(data)
+
+    def write_file(self, name, path, entry=None):
+        # Член из файла на диске: копирование порциями по SINK_BUFFER, файл целиком в память не читается
+        if name in self.entries:
+            raise ValueError(f"Duplicate output name: {name}")
+        size = os.path.getsize(path)
+        with open(path, "rb") as f:
+            self._write_file(name, f, size)
+        self.entries[name] = dict(entry or {}, size=size)
+        self.bytes_written += size
+
+    def _write(self, name, data):
+        raise NotImplementedError
+
+    def _write_file(self, name, fileobj, size):
+        raise NotImplementedError
+
+    def index_bytes(self):
+        data = {"version": INDEX_VERSION, "outputs": dict(sorted(self.entries.items()))}
+        return json.dumps(data, ensure_ascii=False, indent=1).encode("utf-8")
+
+    def close(self):
+        raise NotImplementedError
+
+    def abort(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def summary(self):
+        return f"{self.kind} {self.path}: {len(self.entries)} files, {self.bytes_written / 1024:.1f} KB"
+
+
+class DirectorySink(OutputSink):
+    kind = "dir"
+
+    def __init__(self, path):
+        super().__init__(path)
+        os.makedirs(path, exist_ok=True)
+
+    def _write(self, name, data):
+        atomic_write(os.path.join(self.path, name), data)
+
+    def _write_file(self, name, fileobj, size):
+        # Как atomic_write, но копированием из файла
+        fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=f"_{name}", dir=self.path)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                shutil.copyfileobj(fileobj, out, SINK_BUFFER)
+            os.chmod(tmp_path, FILE_MODE)
+            os.replace(tmp_path, os.path.join(self.path, name))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def close(self):
+        index = OutputIndex(self.path)
+        index.update(self.entries)
+        index.save()
+
+
+class _ArchiveSink(OutputSink):
+    # Архив пишется во временный файл рядом с целевым; буфер SINK_BUFFER, fsync — один раз в close()
+    def __init__(self, path):
+        super().__init__(path)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # Уникальное имя (mkstemp), как в atomic_write: два запуска с одним --archive не делят временный файл
+        fd, self._tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=f"_{os.path.basename(path)}", dir=directory)
+        self._file = os.fdopen(fd, "wb", buffering=SINK_BUFFER)
+        self._mtime = time.time()
+
+    def _finish(self):
+        raise NotImplementedError
+
+    def close(self):
+        if self._file is None:
+            return
+        try:
+            self._write(INDEX_FILE, self.index_bytes())
+            self._finish()
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+            os.chmod(self._tmp_path, FILE_MODE)  # mkstemp создал 0600
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+class ZipSink(_ArchiveSink):
+    kind = "zip"
+
+    def __init__(self, path, compression=zipfile.ZIP_DEFLATED, level=ZIP_LEVEL):
+        super().__init__(path)
+        self._zip = zipfile.ZipFile(self._file, "w", compression=compression, compresslevel=level)
+        self._date_time = time.localtime(self._mtime)[:6]
+
+    def _write(self, name, data):
+        info = zipfile.ZipInfo(name, date_time=self._date_time)
+        info.compress_type = self._zip.compression
+        info.external_attr = 0o644 << 16
+        self._zip.writestr(info, data)
+
+    def _write_file(self, name, fileobj, size):
+        info = zipfile.ZipInfo(name, date_time=self._date_time)
+        info.compress_type = self._zip.compression
+        info.external_attr = 0o644 << 16
+        info.file_size = size  # по размеру ZipFile сам решает, нужен ли zip64
+        with self._zip.open(info, "w") as member:
+            shutil.copyfileobj(fileobj, member, SINK_BUFFER)
+
+    def _finish(self):
+        self._zip.close()  # центральный каталог — в конец файла
+
+
+class TarSink(_ArchiveSink):
+    kind = "tar"
+
+    def __init__(self, path, mode="w|"):
+        super().__init__(path)
+        # Потоковый режим «w|»: без seek назад, сжатие (gz/xz/bz2) — на лету
+        self._tar = tarfile.open(fileobj=self._file, mode=mode, bufsize=SINK_BUFFER,
+                                 format=tarfile.PAX_FORMAT)
+
+    def _write(self, name, data):
+        self._write_file(name, BytesIO(data), len(data))
+
+    def _write_file(self, name, fileobj, size):
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = self._mtime
+        info.mode = 0o644
+        self._tar.addfile(info, fileobj)  # копирует ровно size байт порциями
+
+    def _finish(self):
+        self._tar.close()
+
+
+def archive_mode(path):
+    # -> "zip" / режим tarfile / None (не архив) по расширению
+    lower = path.lower()
+    if lower.endswith(".zip"):
+        return "zip"
+    for ext, mode in TAR_MODES.items():
+        if lower.endswith(ext):
+            return mode
+    return None
+
+
+def open_sink(target, compress=True):
+    # .zip -> ZipSink, .tar / .tar.gz / .tgz / .tar.xz / .tar.bz2 -> TarSink, иначе — папка;
+    # compress=False — zip без сжатия (ZIP_STORED), для tar сжатие задаёт расширение
+    mode = archive_mode(target)
+    if mode == "zip":
+        return ZipSink(target, zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED)
+    if mode is not None:
+        return TarSink(target, mode)
+    return DirectorySink(target)
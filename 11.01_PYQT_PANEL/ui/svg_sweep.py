@@ -0,0 +1,254 @@
+# === AXIOM_PY_HEADER ===
+# FILE: svg_sweep.py
+# TITLE: AXIOM SVG GENERATOR — PARAMETER SWEEP
+# VERSION: v1.4
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Семейства иконок: декартово произведение значений параметров, векторные цветовые рампы, потоковый рендер.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — Оси --sweep (списки, диапазоны, hsl()/hex-рампы), NumPy при наличии, генератор вариантов.
+# v1.1 — 2026-10-18 — logging (axiom.svg) вместо print для сводок и ошибок.
+# v1.2 — 2026-10-18 — run_sweep(..., sink=): варианты и .sweep.jsonl — в один архив (svg_sink.py).
+# v1.3 — 2026-10-18 — Манифест .sweep.jsonl копируется в архив порциями (sink.write_file), без чтения целиком.
+# v1.4 — 2026-10-18 — N диапазона проверяется при разборе (N >= 1): a..b/0 — ValueError, а не ZeroDivisionError.
+# =======================
+
+"""
+svg_sweep.py — перебор параметров шаблона.
+Ось — «имя=значения»:
+— size=16,32,64                  — список (числа распознаются автоматически)
+— glow_opacity=0.05..0.5/10      — 10 равномерных значений от 0.05 до 0.5 включительно
+— color=hsl(0..360/64)           — 64 оттенка; s и l по умолчанию 100% и 50%
+— color=hsl(200, 80%, 20..80%/7) — диапазоном может быть любой компонент (несколько — с общим N, идут вместе)
+— color=#ff0000..#0000ff/8       — линейная RGB-рампа между двумя цветами
+Полный круг оттенков (360) берётся без конечной точки: 0° и 360° — один цвет.
+
+Значения каждой оси считаются один раз и целиком (NumPy, если установлен; иначе — тот же расчёт
+списками), а не на каждый вариант. Варианты — itertools.product, отдаются генератором: миллион
+вариантов не держится в памяти, а уходит в svg_batch.stream_batch() чанками.
+"""
+
+import itertools
+import json
+import logging
+import os
+import re
+import time
+from contextlib import nullcontext
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: расчёт теми же формулами на списках
+    np = None
+
+try:
+    from .svg_batch import stream_batch
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from svg_batch import stream_batch
+
+log = logging.getLogger("axiom.svg")
+
+_RANGE_RE = re.compile(r"^\s*(-?[\d.]+)(%?)\s*\.\.\s*(-?[\d.]+)(%?)\s*/\s*(\d+)\s*$")
+_HSL_RE = re.compile(r"^hsl\((.*)\)$", re.I)
+_HEX_RAMP_RE = re.compile(r"^(#[0-9a-fA-F]{6})\s*\.\.\s*(#[0-9a-fA-F]{6})\s*/\s*(\d+)$")
+
+
+# ==== Векторные операции: NumPy или списки ====
+def linspace(start, stop, num, endpoint=True):
+    if np is not None:
+        return np.linspace(start, stop, num, endpoint=endpoint)
+    if num == 1:
+        return [float(start)]
+    step = (stop - start) / (num - 1 if endpoint else num)
+    return [start + step * i for i in range(num)]
+
+
+def _vec(values, n):
+    # Скаляр -> вектор длины n
+    if np is not None:
+        return np.broadcast_to(np.asarray(values, dtype=float), (n,))
+    return list(values) if isinstance(values, list) else [float(values)] * n
+
+
+def hsl_to_rgb(h, s, l):
+    """
+    Векторный HSL -> RGB (0..1): h в градусах, s и l в 0..1; аргументы — векторы одной длины.
+    f(n) = l - a * max(-1, min(k - 3, 9 - k, 1)), k = (n + h / 30) mod 12, a = s * min(l, 1 - l).
+    """
+    if np is not None:
+        h, s, l = np.asarray(h, float), np.asarray(s, float), np.asarray(l, float)
+        a = s * np.minimum(l, 1 - l)
+        channels = []
+        for n in (0, 8, 4):
+            k = (n + h / 30) % 12
+            channels.append(l - a * np.maximum(-1, np.minimum(np.minimum(k - 3, 9 - k), 1)))
+        return channels
+    a = [si * min(li, 1 - li) for si, li in zip(s, l)]
+    channels = []
+    for n in (0, 8, 4):
+        k = [(n + hi / 30) % 12 for hi in h]
+        channels.append([li - ai * max(-1, min(ki - 3, 9 - ki, 1)) for li, ai, ki in zip(l, a, k)])
+    return channels
+
+
+def rgb_to_hex(r, g, b):
+    if np is not None:
+        rgb = np.rint(np.clip(np.stack([r, g, b], axis=1), 0, 1) * 255).astype(int)
+        return [f"#{x:02x}{y:02x}{z:02x}" for x, y, z in rgb.tolist()]
+    return [
+        "#" + "".join(f"{round(min(1.0, max(0.0, c)) * 255):02x}" for c in px)
+        for px in zip(r, g, b)
+    ]
+
+
+# ==== Разбор осей ====
+def _count(text, spec):
+    # N диапазона «/N»: 0 значений не перебрать (а для полного круга hsl — деление на ноль в linspace)
+    num = int(text)
+    if num < 1:
+        raise ValueError(f"Sweep range needs at least 1 value (/N, N >= 1): {spec!r}")
+    return num
+
+
+def _component(text, scale):
+    # Компонент hsl(): скаляр или диапазон a..b/N -> (вектор или число, N или None)
+    m = _RANGE_RE.match(text)
+    if m:
+        start, stop, num = float(m.group(1)) / scale, float(m.group(3)) / scale, _count(m.group(5), text)
+        full_circle = scale == 1 and abs(stop - start) == 360
+        return linspace(start, stop, num, endpoint=not full_circle), num
+    return float(text.strip().rstrip("%")) / scale, None
+
+
+def hsl_ramp(args):
+    parts = [p.strip() for p in args.split(",")]
+    parts += ["100%", "50%"][len(parts) - 1:]
+    if len(parts) != 3:
+        raise ValueError(f"hsl(): ожидается 1..3 компонента, получено {args!r}")
+    comps = [_component(parts[0], 1), _component(parts[1], 100), _component(parts[2], 100)]
+    sizes = {num for _, num in comps if num is not None}
+    if len(sizes) > 1:
+        raise ValueError(f"hsl(): диапазоны компонентов должны иметь общее N: {args!r}")
+    n = sizes.pop() if sizes else 1
+    h, s, l = (_vec(values, n) for values, _ in comps)
+    return rgb_to_hex(*hsl_to_rgb(h, s, l))
+
+
+def hex_ramp(start, stop, num):
+    a = [int(start[i:i + 2], 16) / 255 for i in (1, 3, 5)]
+    b = [int(stop[i:i + 2], 16) / 255 for i in (1, 3, 5)]
+    t = linspace(0.0, 1.0, num)
+    if np is not None:
+        return rgb_to_hex(*[ca + (cb - ca) * t for ca, cb in zip(a, b)])
+    return rgb_to_hex(*[[ca + (cb - ca) * ti for ti in t] for ca, cb in zip(a, b)])
+
+
+def _scalar(text):
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def _numbers(values):
+    # Целые значения диапазона (size=16..256/16) — int, остальное — float с разумной точностью
+    values = [float(v) for v in values]
+    if all(v == int(v) for v in values):
+        return [int(v) for v in values]
+    return [round(v, 6) for v in values]
+
+
+def parse_axis(spec):
+    # "имя=значения" -> (имя, [значения])
+    name, sep, expr = spec.partition("=")
+    name, expr = name.strip(), expr.strip()
+    if not sep or not name or not expr:
+        raise ValueError(f"Sweep axis must be name=values: {spec!r}")
+    m = _HSL_RE.match(expr)
+    if m:
+        return name, hsl_ramp(m.group(1))
+    m = _HEX_RAMP_RE.match(expr)
+    if m:
+        return name, hex_ramp(m.group(1), m.group(2), _count(m.group(3), spec))
+    m = _RANGE_RE.match(expr)
+    if m and not m.group(2) and not m.group(4):
+        return name, _numbers(linspace(float(m.group(1)), float(m.group(3)), _count(m.group(5), spec)))
+    return name, [_scalar(v.strip()) for v in expr.split(",") if v.strip()]
+
+
+def parse_axes(specs):
+    axes = [parse_axis(spec) for spec in specs]
+    names = [name for name, _ in axes]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate sweep axis: {names}")
+    return axes
+
+
+def sweep_size(axes):
+    total = 1
+    for _, values in axes:
+        total *= len(values)
+    return total
+
+
+def iter_variants(axes, base_params=None):
+    # Декартово произведение осей поверх базовых параметров — по одному dict за раз
+    base = dict(base_params or {})
+    names = [name for name, _ in axes]
+    for combo in itertools.product(*(values for _, values in axes)):
+        params = dict(base)
+        params.update(zip(names, combo))
+        yield params
+
+
+def iter_sweep_items(template, axes, base_params=None, stem="sweep"):
+    # Элементы пакета: <stem>_<номер>.svg, номер с ведущими нулями по размеру перебора
+    width = len(str(max(0, sweep_size(axes) - 1)))
+    for i, params in enumerate(iter_variants(axes, base_params)):
+        yield {"template": template, "params": params, "output": f"{stem}_{i:0{width}d}.svg"}
+
+
+def run_sweep(template, axes, base_params, stem, templates_dir="templates", style_dir="style",
+              jobs=None, optimize=0, sink=None):
+    """
+    Потоковый рендер перебора + style/<stem>.sweep.jsonl (выход -> значения осей), пишется по ходу.
+    sink (svg_sink.py) — варианты пишутся в него, туда же в конце кладётся копия .sweep.jsonl; sink закрывается.
+    Возвращает счётчики stream_batch().
+    """
+    total = sweep_size(axes)
+    names = [name for name, _ in axes]
+    manifest_path = os.path.join(style_dir, f"{stem}.sweep.jsonl")
+    log.info(f"Sweep: {total} variants of {template} ({' x '.join(f'{n}[{len(v)}]' for n, v in axes)}), "
+             f"vector backend: {'numpy' if np is not None else 'python'}")
+    started = time.perf_counter()
+    with open(manifest_path, "w", encoding="utf-8") as manifest, sink or nullcontext():
+        def items():
+            # Строка манифеста пишется, когда элемент уходит в рендер — без накопления
+            for item in iter_sweep_items(template, axes, base_params, stem):
+                row = {"output": item["output"]}
+                row.update((n, item["params"][n]) for n in names)
+                manifest.write(json.dumps(row, ensure_ascii=False) + "\n")
+                yield item
+
+        def report_error(index, output, error, status):
+            if error:
+                log.error(f"❗ [{index}] {output}: {error}")
+
+        counts = stream_batch(items(), templates_dir, style_dir, jobs=jobs, optimize=optimize,
+                              on_result=report_error, sink=sink)
+        if sink is not None:
+            manifest.flush()
+            sink.write_file(os.path.basename(manifest_path), manifest_path)
+    if sink is not None:
+        log.info(f"Archive: {sink.summary()}")
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed if elapsed > 0 else 0.0
+    log.info(f"Sweep: {counts['written']} written, {counts['failed']} failed, {elapsed:.2f}s, "
+             f"{rate:.1f} items/sec -> {manifest_path}")
+    return counts
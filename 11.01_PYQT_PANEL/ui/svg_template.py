@@ -0,0 +1,252 @@
+# === AXIOM_PY_HEADER ===
+# FILE: svg_template.py
+# TITLE: AXIOM SVG GENERATOR — TEMPLATE ENGINE
+# VERSION: v1.3
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Встроенный шаблонизатор .svg.j2: подстановки, условия, циклы, значения по умолчанию.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — Компиляция шаблона в Python-функцию: {field}, {field:spec}, {field|default}, {% if/elif/else %}, {% for %}.
+# v1.1 — 2026-10-18 — Код шаблона хранится (code) и восстанавливается из бандла: SVGTemplate.from_code().
+# v1.2 — 2026-10-18 — Значение по умолчанию подставляется литералом (_literal): {x:.2f|0.5} форматирует число, а не строку.
+# v1.3 — 2026-10-18 — Спецификация подстановки — только по грамматике format-spec: CSS {fill:red} выводится как есть; умолчания inf/nan остаются строками.
+# =======================
+
+"""
+svg_template.py — шаблонизатор AXIOM для файлов *.svg.j2.
+
+Синтаксис:
+— {field}            — подстановка параметра (нет параметра -> KeyError, как у str.format)
+— {field:.2f}        — подстановка с format-спецификацией
+— {field|56}         — значение по умолчанию, если параметр не передан
+— {{ / }}            — литеральные фигурные скобки
+— {% if expr %} ... {% elif expr %} ... {% else %} ... {% endif %}
+— {% for item in items %} ... {% endfor %}
+— {# комментарий #}
+Прочие фигурные скобки (например, CSS в <style>) выводятся как есть, если не похожи на подстановку:
+спецификация после «:» должна быть format-spec (.2f, >8, 03d), поэтому {fill:red}, {fill:#fff},
+{ opacity: 1 } — текст. CSS вида {opacity:1} совпадает с {field:1} — пишите его через {{ / }}.
+
+Шаблон компилируется один раз в Python-функцию; рендер — один вызов и один join,
+без повторного разбора исходника.
+"""
+
+import ast
+import math
+import re
+
+try:
+    from .template_cache import extract_params, infer_param_type
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from template_cache import extract_params, infer_param_type
+
+
+class TemplateSyntaxError(ValueError):
+    pass
+
+
+_TOKEN_RE = re.compile(r"""
+    (?P<esc_open>\{\{)
+  | (?P<esc_close>\}\})
+  | (?P<block>(?:^[ \t]*)?\{%-?\s*(?P<stmt>.*?)\s*-?%\}(?:[ \t]*\r?\n)?)
+  | (?P<comment>\{\#.*?\#\})
+  | \{(?P<var>[A-Za-z_]\w*)
+     (?::(?P<spec>(?:[^{}|]?[<>=^])?[-+\ ]?z?\#?0?\d*[,_]?(?:\.\d+)?[bcdeEfFgGnosxX%]?))?
+     (?:\|(?P<default>[^{}]*))?\}
+""", re.S | re.X | re.M)
+
+_FOR_RE = re.compile(r"for\s+([A-Za-z_]\w*)\s+in\s+(.+)$", re.S)
+
+# Разрешённые узлы в выражениях условий/циклов
+_EXPR_NODES = (
+    ast.Expression, ast.Name, ast.Load, ast.Constant, ast.BoolOp, ast.And, ast.Or,
+    ast.UnaryOp, ast.Not, ast.USub, ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE,
+    ast.Gt, ast.GtE, ast.In, ast.NotIn, ast.Tuple, ast.List,
+)
+
+
+class _ContextNames(ast.NodeTransformer):
+    # name -> ctx.get('name', _defaults.get('name')): нет параметра и нет default — просто ложь
+    def visit_Name(self, node):
+        default = ast.Call(
+            func=ast.Attribute(value=ast.Name(id="_defaults", ctx=ast.Load()), attr="get", ctx=ast.Load()),
+            args=[ast.Constant(node.id)], keywords=[],
+        )
+        call = ast.Call(
+            func=ast.Attribute(value=ast.Name(id="ctx", ctx=ast.Load()), attr="get", ctx=ast.Load()),
+            args=[ast.Constant(node.id), default], keywords=[],
+        )
+        return ast.copy_location(call, node)
+
+
+def _compile_expr(expr, lineno, names):
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError as e:
+        raise TemplateSyntaxError(f"line {lineno}: bad expression {expr!r}: {e.msg}") from None
+    for node in ast.walk(tree):
+        if not isinstance(node, _EXPR_NODES):
+            raise TemplateSyntaxError(f"line {lineno}: unsupported expression {expr!r}")
+        if isinstance(node, ast.Name):
+            names.append(node.id)
+    tree = ast.fix_missing_locations(_ContextNames().visit(tree))
+    return ast.unparse(tree)
+
+
+class SVGTemplate:
+    """
+    Скомпилированный шаблон: render(params) -> str.
+    Атрибуты: source, python_source (сгенерированный код), code (его байткод), params ({имя: тип}),
+    defaults ({имя: значение по умолчанию}, числа/True/False приводятся к Python-типам).
+    """
+
+    def __init__(self, source, name="<template>"):
+        self.source = source
+        self.name = name
+        self.defaults = {}
+        self.loop_vars = set()
+        self._names = []  # все имена из подстановок и условий, в порядке появления
+        self.python_source = self._generate(source)
+        self.code = compile(self.python_source, f"<svg template {name}>", "exec")
+        self._bind()
+        # Типы — по атрибуту SVG (extract_params), иначе по имени
+        typed = extract_params(source)
+        self.params = {}
+        for pname in self._names:
+            if pname not in self.loop_vars and pname not in self.params:
+                self.params[pname] = typed.get(pname) or infer_param_type(pname)
+
+    def _bind(self):
+        namespace = {"_defaults": self.defaults}
+        exec(self.code, namespace)
+        self._render = namespace["_render"]
+
+    @classmethod
+    def from_code(cls, source, name, python_source, code, defaults, loop_vars, params):
+        # Из предкомпилированного бандла (template_bundle.py): без разбора и compile()
+        tpl = cls.__new__(cls)
+        tpl.source = source
+        tpl.name = name
+        tpl.defaults = dict(defaults)
+        tpl.loop_vars = set(loop_vars)
+        tpl._names = list(params)
+        tpl.python_source = python_source
+        tpl.code = code
+        tpl.params = dict(params)
+        tpl._bind()
+        return tpl
+
+    def render(self, params):
+        return self._render(params)
+
+    # ---- Кодогенерация ----
+    def _generate(self, source):
+        lines = ["def _render(ctx):"]
+        body = []  # (отступ, строка)
+        stack = []  # открытые блоки: (тип, номер строки)
+        pending = []  # подряд идущие литералы склеиваются в один append
+        depth = 1
+        loop_id = 0
+        has_loops = False
+
+        def flush():
+            if pending:
+                body.append((depth, f"_a({''.join(pending)!r})"))
+                pending.clear()
+
+        pos = 0
+        for m in _TOKEN_RE.finditer(source):
+            if m.start() > pos:
+                pending.append(source[pos:m.start()])
+            pos = m.end()
+            lineno = source.count("\n", 0, m.start()) + 1
+            if m.group("esc_open"):
+                pending.append("{")
+            elif m.group("esc_close"):
+                pending.append("}")
+            elif m.group("comment"):
+                continue
+            elif m.group("var"):
+                flush()
+                body.append((depth, f"_a({self._var_expr(m)})"))
+            else:
+                flush()
+                stmt = m.group("stmt")
+                keyword = stmt.split(None, 1)[0] if stmt else ""
+                if keyword == "if":
+                    body.append((depth, f"if {_compile_expr(stmt[2:].strip(), lineno, self._names)}:"))
+                    stack.append(("if", lineno))
+                    depth += 1
+                elif keyword in ("elif", "else"):
+                    if not stack or stack[-1][0] != "if":
+                        raise TemplateSyntaxError(f"line {lineno}: {keyword} without if")
+                    body.append((depth, "pass"))
+                    if keyword == "elif":
+                        body.append((depth - 1, f"elif {_compile_expr(stmt[4:].strip(), lineno, self._names)}:"))
+                    else:
+                        body.append((depth - 1, "else:"))
+                elif keyword == "for":
+                    fm = _FOR_RE.match(stmt)
+                    if not fm:
+                        raise TemplateSyntaxError(f"line {lineno}: bad for statement {stmt!r}")
+                    var, expr = fm.groups()
+                    self.loop_vars.add(var)
+                    loop_id += 1
+                    has_loops = True
+                    body.append((depth, f"for _v{loop_id} in ({_compile_expr(expr, lineno, self._names)} or ()):"))
+                    body.append((depth + 1, f"ctx[{var!r}] = _v{loop_id}"))
+                    stack.append(("for", lineno))
+                    depth += 1
+                elif keyword in ("endif", "endfor"):
+                    if not stack or stack[-1][0] != keyword[3:]:
+                        raise TemplateSyntaxError(f"line {lineno}: unexpected {keyword}")
+                    body.append((depth, "pass"))
+                    stack.pop()
+                    depth -= 1
+                else:
+                    raise TemplateSyntaxError(f"line {lineno}: unknown block {stmt!r}")
+        if pos < len(source):
+            pending.append(source[pos:])
+        flush()
+        if stack:
+            kind, lineno = stack[-1]
+            raise TemplateSyntaxError(f"line {lineno}: {kind} block is not closed")
+
+        # Циклы пишут переменную в контекст — работаем с копией, чтобы не портить params
+        if has_loops:
+            lines.append("    ctx = dict(ctx)")
+        lines.append("    _o = []")
+        lines.append("    _a = _o.append")
+        lines.extend("    " * d + code for d, code in body)
+        lines.append("    return ''.join(_o)")
+        return "\n".join(lines) + "\n"
+
+    def _var_expr(self, m):
+        name, spec, default = m.group("var"), m.group("spec"), m.group("default")
+        self._names.append(name)
+        if default is not None:
+            self.defaults[name] = _literal(default)
+            # Литерал, а не исходная строка: format("0.5", ".2f") упал бы с ValueError
+            value = f"ctx.get({name!r}, {self.defaults[name]!r})"
+        else:
+            value = f"ctx[{name!r}]"
+        if spec:
+            return f"format({value}, {spec!r})"
+        return f"str({value})"
+
+
+def _literal(text):
+    # "56" -> 56, "0.2" -> 0.2, "True" -> True; прочее ("#fff", "Ω") остаётся строкой
+    try:
+        value = ast.literal_eval(text.strip())
+    except (ValueError, SyntaxError):
+        return text
+    if isinstance(value, float) and not math.isfinite(value):
+        return text  # "1e400" -> inf: repr(inf) в сгенерированном коде — NameError
+    return value if isinstance(value, (int, float, bool)) else text
+
+
+def compile_template(source, name="<template>"):
+    return SVGTemplate(source, name)
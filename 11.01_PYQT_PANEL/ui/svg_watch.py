@@ -0,0 +1,277 @@
+# === AXIOM_PY_HEADER ===
+# FILE: svg_watch.py
+# TITLE: AXIOM SVG GENERATOR — WATCH MODE
+# VERSION: v1.1
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Режим --watch: граф зависимостей шаблон/пресет -> выходы, inotify или опрос, перерендер только затронутого.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — WatchSession + InotifyWatcher (ctypes) / PollingWatcher, склейка пачек событий, латентность цикла.
+# v1.1 — 2026-10-18 — logging (axiom.svg) вместо print для сводок и ошибок.
+# =======================
+
+"""
+svg_watch.py — живой перерендер при правке шаблонов и пресетов.
+— Граф: шаблон -> множество выходов, выход -> элемент пакета (template, params, output).
+— Изменился шаблон: перерендер только его выходов. Изменились пресеты/манифест: перечитываются,
+  перерендер только тех выходов, у которых поменялся шаблон или params (и новых).
+— Наблюдение: inotify через ctypes (Linux, следим за папками — ловим и атомарные rename редакторов),
+  иначе — опрос stat() с интервалом. Пачка событий склеивается до тишины в debounce секунд.
+— Запись идёт через инкрементальный индекс генератора: одинаковый результат на диск не пишется.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import time
+
+try:
+    from .svg_batch import load_manifest, items_from_presets
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from svg_batch import load_manifest, items_from_presets
+
+log = logging.getLogger("axiom.svg")
+
+DEFAULT_DEBOUNCE = 0.1
+POLL_INTERVAL = 0.25
+
+
+# ==== Наблюдатели: wait(timeout) -> множество изменившихся путей (пустое — таймаут) ====
+class PollingWatcher:
+    def __init__(self, paths, interval=POLL_INTERVAL):
+        self.paths = set(paths)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snap = {}
+        for path in self.paths:
+            entries = [path]
+            if os.path.isdir(path):
+                entries += [os.path.join(path, f) for f in os.listdir(path)]
+            for p in entries:
+                try:
+                    st = os.stat(p)
+                    snap[p] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    pass
+        return snap
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snap = self._scan()
+            changed = {p for p in snap.keys() | self._snapshot.keys() if snap.get(p) != self._snapshot.get(p)}
+            self._snapshot = snap
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            delay = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    # Следим за родительскими папками путей: редакторы сохраняют через temp + rename
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, paths):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self.fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}  # wd -> папка
+        self._files = set()
+        self._trees = set()  # папки, где важен любой файл (шарды пресетов)
+        for path in paths:
+            path = os.path.abspath(path)
+            if os.path.isdir(path):
+                self._trees.add(path)
+                self._add_dir(path)
+            else:
+                self._files.add(path)
+                self._add_dir(os.path.dirname(path))
+
+    def _add_dir(self, directory):
+        if directory in self._dirs.values():
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {directory}")
+        self._dirs[wd] = directory
+
+    def _read(self):
+        changed = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, _, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = data[offset:offset + length].split(b"\0", 1)[0].decode("utf-8", "replace")
+            offset += length
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            path = os.path.join(directory, name) if name else directory
+            if path in self._files or directory in self._trees:
+                changed.add(path)
+        return changed
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                return set()
+            changed = self._read()
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def make_watcher(paths, poll=False):
+    # inotify, если доступен (Linux); иначе — опрос
+    if not poll:
+        try:
+            return InotifyWatcher(paths)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(paths)
+
+
+def coalesce(watcher, debounce=DEFAULT_DEBOUNCE):
+    # Блокирующее ожидание первого события + сбор пачки до тишины в debounce секунд
+    changed = watcher.wait()
+    while True:
+        more = watcher.wait(debounce)
+        if not more:
+            return changed
+        changed |= more
+
+
+class WatchSession:
+    """
+    Граф зависимостей и перерендер. Источник элементов — манифест (manifest) или все пресеты.
+    cycle(changed_paths) -> dict со статистикой цикла.
+    """
+
+    def __init__(self, gen, manifest=None):
+        self.gen = gen
+        self.manifest = os.path.abspath(manifest) if manifest else None
+        self.templates_dir = os.path.abspath(gen.templates_dir)
+        self.items = {}
+        self.by_template = {}
+        self._set_items(self._load_items())
+
+    def _load_items(self):
+        if self.manifest:
+            items = load_manifest(self.manifest)
+        else:
+            self.gen.preset_store.refresh()
+            items = items_from_presets(self.gen.preset_store)
+        return {item["output"]: item for item in items}
+
+    def _set_items(self, items):
+        self.items = items
+        self.by_template = {}
+        for output, item in items.items():
+            self.by_template.setdefault(item["template"], set()).add(output)
+
+    def watched_paths(self):
+        if self.manifest:
+            sources = [self.manifest]
+        else:
+            sources = self.gen.preset_store.watched_paths()
+        return [self.templates_dir] + [os.path.abspath(p) for p in sources]
+
+    def affected(self, changed):
+        # Изменившиеся пути -> множество выходов для перерендера
+        outputs = set()
+        sources_changed = False
+        source_paths = set(self.watched_paths()[1:])
+        for path in changed:
+            path = os.path.abspath(path)
+            if path in source_paths or os.path.dirname(path) in source_paths:
+                sources_changed = True
+            elif os.path.dirname(path) == self.templates_dir and path.endswith(".svg.j2"):
+                outputs.update(self.by_template.get(os.path.basename(path), ()))
+        if sources_changed:
+            old = self.items
+            try:
+                self._set_items(self._load_items())
+            except (OSError, ValueError) as e:
+                log.error(f"❗ [watch] источник не прочитан, жду следующего сохранения: {e}")
+                return outputs
+            outputs.update(o for o, item in self.items.items() if old.get(o) != item)
+        return outputs & set(self.items)
+
+    def render(self, outputs):
+        stats = {"written": 0, "skipped": 0, "failed": 0}
+        ws = self.gen.write_stats
+        for output in sorted(outputs):
+            item = self.items[output]
+            before = ws["written"]
+            try:
+                self.gen.render(item["template"], item.get("params", {}), output)
+            except Exception as e:
+                stats["failed"] += 1
+                log.error(f"❗ [watch] {output}: {type(e).__name__}: {e}")
+                continue
+            stats["written" if ws["written"] > before else "skipped"] += 1
+        self.gen.save_index()
+        return stats
+
+    def cycle(self, changed):
+        started = time.perf_counter()
+        outputs = self.affected(changed)
+        stats = self.render(outputs)
+        stats.update(changed=len(changed), affected=len(outputs), ms=(time.perf_counter() - started) * 1000)
+        return stats
+
+    def run(self, poll=False, debounce=DEFAULT_DEBOUNCE):
+        # Первый проход — все выходы (неизменённые пропускаются индексом), дальше — по событиям
+        stats = self.render(set(self.items))
+        log.info(f"[watch] start: {len(self.items)} outputs, {stats['written']} written, "
+                 f"{stats['skipped']} up to date")
+        # Папка шардов наблюдается целиком, поэтому новые шарды не требуют перестройки наблюдателя
+        watcher = make_watcher(self.watched_paths(), poll=poll)
+        log.info(f"[watch] {type(watcher).__name__}: {', '.join(self.watched_paths())} (Ctrl+C — выход)")
+        try:
+            while True:
+                stats = self.cycle(coalesce(watcher, debounce))
+                log.info(f"[watch] {stats['changed']} changed -> {stats['affected']} affected: "
+                         f"{stats['written']} written, {stats['skipped']} unchanged, {stats['failed']} failed "
+                         f"in {stats['ms']:.1f} ms")
+        except KeyboardInterrupt:
+            log.info("[watch] stop")
+        finally:
+            watcher.close()
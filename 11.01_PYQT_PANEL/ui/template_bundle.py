@@ -0,0 +1,150 @@
+# === AXIOM_PY_HEADER ===
+# FILE: template_bundle.py
+# TITLE: AXIOM SVG GENERATOR — PRECOMPILED BUNDLE
+# VERSION: v1.2
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Все шаблоны (байткод) и пресеты одним бинарным файлом: сборка, загрузка одним чтением, откат на исходники.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — build_bundle() / read_bundle() / apply_bundle(): заголовок с версией, magic Python и sha256, marshal-тело.
+# v1.1 — 2026-10-18 — BUNDLE_VERSION 2: байткод шаблонов с литеральными умолчаниями (svg_template v1.2), старые бандлы игнорируются.
+# v1.2 — 2026-10-18 — BUNDLE_VERSION 3: код шаблонов svg_template v1.3 (format-spec по грамматике, умолчания inf/nan строками).
+# =======================
+
+"""
+template_bundle.py — холодный старт генератора без разбора шаблонов.
+Каждый новый процесс (панель, CLI, воркер пакета, CI) иначе читает все templates/*.svg.j2,
+токенизирует, генерирует и компилирует Python-код, разбирает svg_presets.json.
+
+Сборка (python generate_svg.py --build-bundle) пишет templates/.axiom_bundle.bin:
+    заголовок  <8s H 4s Q 32s>: MAGIC, BUNDLE_VERSION, magic байткода Python, длина тела, sha256 тела
+    тело       marshal: {"templates": {имя: (mtime_ns, size, source, python_source, code, defaults,
+                                            loop_vars, params)},
+                         "presets": (путь от templates/, mtime_ns, size, {имя: пресет}) | None}
+AxiomSVGGenerator читает файл одним read(); заголовок, версия Python или хеш не сошлись — бандл
+игнорируется целиком. Дальше свежесть по каждому исходнику: совпали mtime/size — шаблон кладётся
+в TemplateCache готовым (seed), иначе этот шаблон компилируется из исходника, как без бандла.
+Пресеты — только одиночный JSON (JSONL и папки-шарды и так индексируются без полного разбора).
+"""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import marshal
+import os
+import struct
+
+try:
+    from .svg_template import SVGTemplate
+    from .output_index import atomic_write
+    from .perf import span, incr
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from svg_template import SVGTemplate
+    from output_index import atomic_write
+    from perf import span, incr
+
+BUNDLE_FILE = ".axiom_bundle.bin"  # в папке шаблонов
+BUNDLE_VERSION = 3  # 2 — умолчания литералами (svg_template v1.2); 3 — разбор подстановок svg_template v1.3
+MAGIC = b"AXIOMBND"
+_HEADER = struct.Struct("<8sH4sQ32s")
+_PY_MAGIC = importlib.util.MAGIC_NUMBER  # marshal байткода не переносим между версиями Python
+
+log = logging.getLogger("axiom.svg")
+
+
+def bundle_path(templates_dir):
+    return os.path.join(templates_dir, BUNDLE_FILE)
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def build_bundle(templates_dir, presets_path=None, path=None):
+    # Компиляция всех шаблонов + разбор JSON-пресетов -> один файл; -> (путь, {"templates", "presets", "bytes"})
+    path = path or bundle_path(templates_dir)
+    templates = {}
+    for name in sorted(os.listdir(templates_dir)):
+        if not name.endswith(".svg.j2"):
+            continue
+        src_path = os.path.join(templates_dir, name)
+        mtime, size = _stamp(src_path)
+        with open(src_path, encoding="utf-8") as f:
+            source = f.read()
+        # Имя — как у TemplateCache (compiler(source)), чтобы байткод не отличался от обычной компиляции
+        tpl = SVGTemplate(source)
+        templates[name] = (mtime, size, source, tpl.python_source, tpl.code, tpl.defaults,
+                           tuple(sorted(tpl.loop_vars)), tpl.params)
+    presets = None
+    if presets_path and os.path.isfile(presets_path) and presets_path.endswith(".json"):
+        mtime, size = _stamp(presets_path)
+        with open(presets_path, encoding="utf-8") as f:
+            entries = json.load(f).get("presets", {})
+        presets = (os.path.relpath(presets_path, templates_dir), mtime, size, entries)
+    body = marshal.dumps({"templates": templates, "presets": presets})
+    header = _HEADER.pack(MAGIC, BUNDLE_VERSION, _PY_MAGIC, len(body), hashlib.sha256(body).digest())
+    atomic_write(path, header + body, suffix=".bin")
+    return path, {"templates": len(templates), "presets": len(presets[3]) if presets else 0,
+                  "bytes": _HEADER.size + len(body)}
+
+
+def read_bundle(path):
+    # Одно чтение файла; -> тело бандла или None (нет файла, другая версия / Python, повреждён)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, py_magic, length, digest = _HEADER.unpack_from(data)
+    body = memoryview(data)[_HEADER.size:]
+    if magic != MAGIC or version != BUNDLE_VERSION or py_magic != _PY_MAGIC or length != len(body):
+        log.debug(f"bundle {path}: other format or Python version — ignored")
+        return None
+    if hashlib.sha256(body).digest() != digest:
+        log.debug(f"bundle {path}: hash mismatch — ignored")
+        return None
+    try:
+        return marshal.loads(body)
+    except (ValueError, EOFError, TypeError):
+        return None
+
+
+def apply_bundle(generator, path=None):
+    # Свежие записи бандла -> кеш шаблонов и PresetStore генератора; -> {"fresh", "stale", "presets"} или None
+    path = path or bundle_path(generator.templates_dir)
+    with span("svg.bundle"):
+        bundle = read_bundle(path)
+        if bundle is None:
+            return None
+        stats = {"fresh": 0, "stale": 0, "presets": False}
+        for name, (mtime, size, source, python_source, code, defaults, loop_vars, params) \
+                in bundle["templates"].items():
+            src_path = os.path.join(generator.templates_dir, name)
+            try:
+                current = _stamp(src_path)
+            except OSError:
+                current = None
+            if current != (mtime, size):
+                stats["stale"] += 1
+                continue
+            tpl = SVGTemplate.from_code(source, "<template>", python_source, code, defaults, loop_vars, params)
+            generator.template_cache.seed(src_path, mtime, size, tpl)
+            stats["fresh"] += 1
+        presets = bundle.get("presets")
+        store = generator.preset_store
+        if presets and store.path:
+            rel, mtime, size, entries = presets
+            same = os.path.abspath(os.path.join(generator.templates_dir, rel)) == os.path.abspath(store.path)
+            stats["presets"] = same and store.seed(store.path, (mtime, size), entries)
+    incr("svg.bundle_fresh", stats["fresh"])
+    if stats["stale"]:
+        incr("svg.bundle_stale", stats["stale"])
+        log.debug(f"bundle {path}: {stats['stale']} stale template(s) compiled from sources "
+                  f"(--build-bundle to refresh)")
+    return stats
@@ -0,0 +1,173 @@
+# === AXIOM_PY_HEADER ===
+# FILE: template_cache.py
+# TITLE: AXIOM SVG GENERATOR — TEMPLATE CACHE
+# VERSION: v1.3
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: LRU-кеш скомпилированных SVG-шаблонов с инвалидацией по mtime/size.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — Кеш шаблонов: компиляция один раз, LRU-вытеснение, счётчики hit/miss.
+# v1.1 — 2026-10-18 — Интроспекция параметров шаблона (extract_params) с выводом типов.
+# v1.2 — 2026-10-18 — Типы параметров анимации: flag (animate), duration (*_dur), *_peak — opacity.
+# v1.3 — 2026-10-18 — seed(): запись из предкомпилированного бандла с mtime/size исходника.
+# =======================
+
+"""
+template_cache.py — кеш скомпилированных шаблонов для AxiomSVGGenerator.
+— Шаблон читается и компилируется один раз, дальше берётся из памяти.
+— Запись инвалидируется при изменении mtime/size файла (один os.stat на обращение).
+— Размер ограничен, старые записи вытесняются по LRU.
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from string import Formatter
+
+
+# Поле-подстановка и атрибут, в котором оно стоит: fill="{bg}" -> ("fill", "bg")
+_FIELD_RE = re.compile(r'(?:([\w:-]+)\s*=\s*"[^"{]*)?\{\s*([A-Za-z_]\w*)[^{}]*\}')
+# Имена в управляющих блоках: {% if label %}, {% for x in items %}
+_BLOCK_RE = re.compile(r"\{%\s*(?:if|elif|for\s+\w+\s+in)\s+(?:not\s+)?([A-Za-z_]\w*)")
+
+_COLOR_ATTRS = {"fill", "stroke", "stop-color", "flood-color", "lighting-color", "color"}
+_OPACITY_ATTRS = {"opacity", "fill-opacity", "stroke-opacity", "stop-opacity"}
+_SIZE_ATTRS = {"width", "height", "font-size", "stroke-width", "r", "rx", "ry"}
+
+
+def infer_param_type(name, attr=None):
+    # Тип параметра: flag / duration / color / opacity / size / text — по атрибуту SVG, затем по имени
+    if name == "animate":
+        return "flag"
+    if name.endswith("_dur"):
+        return "duration"
+    if attr in _OPACITY_ATTRS or "opacity" in name or name.endswith("_peak"):
+        return "opacity"
+    if attr in _COLOR_ATTRS or "color" in name or name == "bg":
+        return "color"
+    if attr in _SIZE_ATTRS or name == "size" or name.endswith(("_size", "_width", "_height")):
+        return "size"
+    return "text"
+
+
+def extract_params(source):
+    # Параметры шаблона в порядке первого появления: {имя: тип}
+    params = {}
+    for attr, name in _FIELD_RE.findall(source):
+        if name not in params:
+            params[name] = infer_param_type(name, attr or None)
+    for name in _BLOCK_RE.findall(source):
+        params.setdefault(name, infer_param_type(name))
+    return params
+
+
+class FormatTemplate:
+    """
+    Предразобранный шаблон в формате str.format.
+    Хранит список сегментов (литерал, имя поля, спецификация, конверсия),
+    поэтому рендер — это один проход и join без повторного парсинга.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.segments = self._compile(source)
+        self.params = extract_params(source)
+
+    @staticmethod
+    def _compile(source):
+        segments = []
+        for literal, field, spec, conv in Formatter().parse(source):
+            if field is None:
+                segments.append((literal, None, None, None))
+                continue
+            # Позиционные/составные поля и вложенные спецификации —
+            # отдаём штатному str.format, чтобы поведение не отличалось
+            if not field.isidentifier() or (spec and "{" in spec):
+                return None
+            segments.append((literal, field, spec, conv))
+        return segments
+
+    def render(self, params):
+        if self.segments is None:
+            return self.source.format(**params)
+        out = []
+        for literal, field, spec, conv in self.segments:
+            if literal:
+                out.append(literal)
+            if field is None:
+                continue
+            value = params[field]
+            if conv == "r":
+                value = repr(value)
+            elif conv == "s":
+                value = str(value)
+            elif conv == "a":
+                value = ascii(value)
+            out.append(format(value, spec))
+        return "".join(out)
+
+
+class TemplateCache:
+    """
+    LRU-кеш шаблонов: ключ — абсолютный путь, значение — (mtime_ns, size, compiled).
+    compiler — функция source -> скомпилированный шаблон с методом render(params).
+    """
+
+    def __init__(self, compiler=FormatTemplate, max_entries=64):
+        self.compiler = compiler
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        key = os.path.abspath(path)
+        st = os.stat(key)  # FileNotFoundError, если шаблона нет
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+        with open(key, encoding="utf-8") as f:
+            compiled = self.compiler(f.read())
+        with self._lock:
+            self._entries[key] = (st.st_mtime_ns, st.st_size, compiled)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return compiled
+
+    def seed(self, path, mtime_ns, size, compiled):
+        # Готовый шаблон (бандл) под mtime/size исходника: первый get() — попадание, если файл не менялся
+        key = os.path.abspath(path)
+        with self._lock:
+            self._entries[key] = (mtime_ns, size, compiled)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
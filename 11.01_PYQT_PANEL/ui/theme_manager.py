@@ -0,0 +1,81 @@
+# === AXIOM_PY_HEADER ===
+# FILE: theme_manager.py
+# TITLE: AXIOM THEME MANAGER
+# VERSION: v1.1
+# STATUS: ACTIVE
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/ui]
+# COMMENT: Единая загрузка QSS-тем: файл читается один раз, тема применяется на уровне приложения.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v1.0 — 2026-10-18 — ThemeManager: кеш QSS, apply() на QApplication, переключение red/default одним repolish.
+# v1.1 — 2026-10-18 — Спан qss.apply (perf.py), предупреждение об отсутствующем QSS через logging.
+# =======================
+
+"""
+theme_manager.py — менеджер QSS-тем AXIOM PANEL.
+— Каждый .qss читается с диска один раз (кеш по имени темы; перечитывается только при изменении файла).
+— Тема применяется только к QApplication: один проход polish вместо стилей на каждом виджете.
+— Виджеты стилизуются селекторами objectName / property("class") внутри .qss, без inline setStyleSheet.
+"""
+
+import logging
+import os
+
+try:
+    from .perf import span
+except ImportError:  # запуск как CLI-скрипт из ui/
+    from perf import span
+
+log = logging.getLogger("axiom.panel")
+
+STYLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style")
+
+THEMES = {
+    "red": "axiom_red.qss",
+    "default": "axiom_style.qss",
+}
+DEFAULT_THEME = "red"
+
+
+class ThemeManager:
+    def __init__(self, style_dir=STYLE_DIR):
+        self.style_dir = style_dir
+        self.current = None
+        self._cache = {}  # тема -> (mtime_ns, текст QSS)
+
+    def themes(self):
+        return list(THEMES)
+
+    def stylesheet(self, name):
+        path = os.path.join(self.style_dir, THEMES[name])
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            log.warning(f"⚠️ QSS файл не найден: {path}")
+            return ""
+        cached = self._cache.get(name)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with open(path, "r", encoding="utf-8") as f:
+            qss = f.read()
+        self._cache[name] = (mtime, qss)
+        return qss
+
+    def apply(self, app, name=DEFAULT_THEME):
+        # Один setStyleSheet на приложение — Qt перерисовывает все виджеты за один проход
+        if name == self.current:
+            return
+        with span("qss.apply"):
+            app.setStyleSheet(self.stylesheet(name))
+        self.current = name
+
+    def switch(self, name):
+        from PyQt5.QtWidgets import QApplication
+        app = QApplication.instance()
+        if app is not None:
+            self.apply(app, name)
+
+
+# Общий экземпляр для main.py, окон и панелей
+theme_manager = ThemeManager()
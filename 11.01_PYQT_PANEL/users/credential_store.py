@@ -0,0 +1,178 @@
+# === AXIOM_PY_HEADER ===
+# FILE: credential_store.py
+# TITLE: CREDENTIAL STORE
+# VERSION: v0.3
+# STATUS: DRAFT
+# ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/users]
+# COMMENT: Слой доступа к users/auth.json: индекс по логину, перезагрузка по mtime, сравнение хешей за постоянное время.
+# AUTHOR: CREATOR & AXIOM
+# DATE: 2026-10-18
+# === CHANGELOG ===
+# v0.1 — 2026-10-18 — CredentialStore: dict по логину, reload по mtime/size, hmac.compare_digest, upsert + атомарная запись.
+# v0.2 — 2026-10-18 — Медленные KDF: pbkdf2_sha256 / scrypt с параметрами в строке хеша; legacy SHA256 проверяется как раньше.
+# v0.3 — 2026-10-18 — Логин с legacy SHA256 (и с битым хешем) тоже платит хеш-заглушку KDF: время ответа не отличает его от неизвестного.
+# =======================
+
+"""
+credential_store.py — общий слой учётных записей для login_window.py и generate_user.py.
+- auth.json разбирается один раз в dict {login: запись}; повторно — только если файл изменился.
+- Проверка пароля: поиск по логину O(1) + hmac.compare_digest (без утечки по времени сравнения).
+- upsert() — O(1) вставка/обновление в индексе, файл перезаписывается атомарно (temp + rename).
+
+Форматы password_hash (параметры KDF хранятся в самой строке):
+- pbkdf2_sha256$<iterations>$<salt_b64>$<hash_b64>
+- scrypt$<n>$<r>$<p>$<salt_b64>$<hash_b64>
+- <64 hex> — legacy SHA256 без соли (проверяется, новые записи так не создаются)
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import tempfile
+import threading
+import time
+
+AUTH_FILE = os.path.join(os.path.dirname(__file__), "auth.json")
+
+DEFAULT_KDF = "pbkdf2_sha256"
+PBKDF2_ITERATIONS = 600_000
+SCRYPT_N, SCRYPT_R, SCRYPT_P = 2 ** 14, 8, 1
+SALT_BYTES = 16
+
+# Хеш-заглушка (той же стоимости, что и реальные) для неизвестного логина и для записей без KDF
+# (legacy SHA256, битая строка): иначе по времени ответа видно, какие логины существуют
+_dummy_hash = None
+
+
+def _b64(data):
+    return base64.b64encode(data).decode("ascii")
+
+
+def hash_password(password, kdf=DEFAULT_KDF, iterations=PBKDF2_ITERATIONS,
+                  n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, salt=None):
+    # Закодированный хеш с параметрами: его целиком и кладём в password_hash
+    pw = password.encode()
+    if kdf == "sha256":
+        return hashlib.sha256(pw).hexdigest()
+    salt = salt or os.urandom(SALT_BYTES)
+    if kdf == "pbkdf2_sha256":
+        dk = hashlib.pbkdf2_hmac("sha256", pw, salt, iterations)
+        return f"pbkdf2_sha256${iterations}${_b64(salt)}${_b64(dk)}"
+    if kdf == "scrypt":
+        dk = hashlib.scrypt(pw, salt=salt, n=n, r=r, p=p, maxmem=256 * n * r + (1 << 20))
+        return f"scrypt${n}${r}${p}${_b64(salt)}${_b64(dk)}"
+    raise ValueError(f"Unknown KDF: {kdf}")
+
+
+def verify_password(password, encoded):
+    # Пересчитать хеш с параметрами из строки и сравнить за постоянное время
+    pw = password.encode()
+    parts = encoded.split("$")
+    try:
+        if parts[0] == "pbkdf2_sha256" and len(parts) == 4:
+            expected = base64.b64decode(parts[3])
+            dk = hashlib.pbkdf2_hmac("sha256", pw, base64.b64decode(parts[2]), int(parts[1]))
+        elif parts[0] == "scrypt" and len(parts) == 6:
+            n, r, p = int(parts[1]), int(parts[2]), int(parts[3])
+            expected = base64.b64decode(parts[5])
+            dk = hashlib.scrypt(pw, salt=base64.b64decode(parts[4]), n=n, r=r, p=p,
+                                maxmem=256 * n * r + (1 << 20), dklen=len(expected))
+        elif len(parts) == 1:
+            expected = encoded.encode()
+            dk = hashlib.sha256(pw).hexdigest().encode()
+        else:
+            return False
+    except (ValueError, TypeError):
+        return False
+    return hmac.compare_digest(dk, expected)
+
+
+def needs_rehash(encoded):
+    # legacy SHA256 — кандидат на перехеширование через generate_user.py
+    return "$" not in encoded
+
+
+def calibrate_pbkdf2(target_ms=300):
+    # Подобрать число итераций PBKDF2 под целевое время проверки на этой машине
+    probe = 50_000
+    started = time.perf_counter()
+    hashlib.pbkdf2_hmac("sha256", b"calibrate", b"0" * SALT_BYTES, probe)
+    per_iter = (time.perf_counter() - started) / probe
+    return max(100_000, int(target_ms / 1000 / per_iter))
+
+
+class CredentialStore:
+    def __init__(self, path=AUTH_FILE):
+        self.path = path
+        self._users = {}
+        self._stamp = None
+        self._lock = threading.Lock()
+
+    def _reload_if_changed(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._users, self._stamp = {}, None
+            return
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._stamp:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            users = {u["login"]: u for u in data.get("users", []) if "login" in u}
+        except (OSError, ValueError, AttributeError, TypeError):
+            users = {}
+        self._users, self._stamp = users, stamp
+
+    def get(self, login):
+        with self._lock:
+            self._reload_if_changed()
+            return self._users.get(login)
+
+    def verify(self, login, password):
+        # Медленный KDF — вызывать вне GUI-потока (см. LoginWindow)
+        global _dummy_hash
+        user = self.get(login)
+        encoded = user.get("password_hash", "") if user is not None else ""
+        if user is None or not encoded.startswith(("pbkdf2_sha256$", "scrypt$")):
+            # Без медленного KDF ответ пришёл бы мгновенно — платим ту же цену, что и за реальную проверку
+            if _dummy_hash is None:
+                _dummy_hash = hash_password("axiom:no-such-user")
+            verify_password(password, _dummy_hash)
+            if user is None:
+                return False
+        return verify_password(password, encoded)
+
+    def upsert(self, login, password_hash):
+        # True — пользователь создан, False — обновлён существующий
+        with self._lock:
+            self._reload_if_changed()
+            created = login not in self._users
+            record = dict(self._users.get(login, {"login": login}))
+            record["password_hash"] = password_hash
+            self._users[login] = record
+            self._save()
+            return created
+
+    def _save(self):
+        data = {"users": list(self._users.values())}
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".auth_", suffix=".json", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        st = os.stat(self.path)
+        self._stamp = (st.st_mtime_ns, st.st_size)
+
+    def __len__(self):
+        with self._lock:
+            self._reload_if_changed()
+            return len(self._users)
@@ -1,59 +1,58 @@
 # === AXIOM_PY_HEADER ===
 # FILE: generate_user.py
 # TITLE: USER HASH GENERATOR
-# VERSION: v0.1
+# VERSION: v0.4
 # STATUS: DRAFT
 # ZONE: [11_SYSTEM_INTERFACE/11.01_PYQT_PANEL/users]
-# COMMENT: Утилита для генерации SHA256-хеша пароля и добавления пользователя в auth.json.
+# COMMENT: Утилита для хеширования пароля медленным KDF (PBKDF2 / scrypt через credential_store.py) и добавления пользователя в auth.json.
 # AUTHOR: CREATOR & AXIOM
 # DATE: 2025-07-26
 # === CHANGELOG ===
 # v0.1 — 2025-07-26 — Инициализация файла, генерация хеша, создание auth.json, добавление пользователя.
+# v0.2 — 2026-10-18 — Запись через credential_store.py: O(1) upsert по логину, атомарная перезапись auth.json.
+# v0.3 — 2026-10-18 — Хеш через медленный KDF (pbkdf2_sha256 / scrypt), параметры KDF — флагами, калибровка --target-ms.
+# v0.4 — 2026-10-18 — Заголовок: COMMENT описывает PBKDF2 / scrypt через credential_store.py вместо SHA256.
 # =======================
 
 """
 generate_user.py — консольный скрипт для добавления нового пользователя в систему авторизации AXIOM PANEL.
 - Запрашивает логин и пароль (скрыто)
-- Генерирует SHA256-хеш пароля
+- Генерирует хеш пароля медленным KDF (pbkdf2_sha256 по умолчанию, scrypt — опционально)
 - Добавляет пользователя в users/auth.json (создаёт файл, если не существует)
 - Безопасно работает только внутри users/ (и не должен уходить в git!)
 """
 
-import hashlib
-import json
-import os
+import argparse
 import getpass
 
-AUTH_FILE = os.path.join(os.path.dirname(__file__), "auth.json")
+from credential_store import (
+    AUTH_FILE, CredentialStore, hash_password, calibrate_pbkdf2,
+    PBKDF2_ITERATIONS, SCRYPT_N, SCRYPT_R, SCRYPT_P,
+)
 
 def main():
+    parser = argparse.ArgumentParser(description="AXIOM USER GENERATOR")
+    parser.add_argument("--kdf", choices=["pbkdf2_sha256", "scrypt", "sha256"], default="pbkdf2_sha256",
+                        help="Алгоритм хеширования (sha256 — только для совместимости)")
+    parser.add_argument("--iterations", type=int, default=PBKDF2_ITERATIONS, help="Итерации PBKDF2")
+    parser.add_argument("--target-ms", type=int, help="Подобрать итерации PBKDF2 под время проверки (мс)")
+    parser.add_argument("--scrypt-n", type=int, default=SCRYPT_N, help="scrypt: N (степень двойки)")
+    parser.add_argument("--scrypt-r", type=int, default=SCRYPT_R, help="scrypt: r")
+    parser.add_argument("--scrypt-p", type=int, default=SCRYPT_P, help="scrypt: p")
+    args = parser.parse_args()
+
     print("=== AXIOM USER GENERATOR ===")
     login = input("Введите логин: ").strip()
     password = getpass.getpass("Введите пароль: ").strip()
-    hash_pw = hashlib.sha256(password.encode()).hexdigest()
-    print(f"\nSHA256-хеш пароля: {hash_pw}\n")
-
-    # Загружаем или создаём файл auth.json
-    users = []
-    if os.path.exists(AUTH_FILE):
-        with open(AUTH_FILE, "r") as f:
-            try:
-                data = json.load(f)
-                users = data.get("users", [])
-            except Exception:
-                print("Ошибка чтения auth.json. Перезаписываем файл.")
-                users = []
-    # Проверяем, есть ли уже такой пользователь
-    for user in users:
-        if user["login"] == login:
-            print("Пользователь с таким логином уже существует! Обновляем пароль...")
-            user["password_hash"] = hash_pw
-            break
-    else:
-        users.append({"login": login, "password_hash": hash_pw})
-
-    with open(AUTH_FILE, "w") as f:
-        json.dump({"users": users}, f, indent=2, ensure_ascii=False)
+    iterations = calibrate_pbkdf2(args.target_ms) if args.target_ms else args.iterations
+    hash_pw = hash_password(password, kdf=args.kdf, iterations=iterations,
+                            n=args.scrypt_n, r=args.scrypt_r, p=args.scrypt_p)
+    print(f"\nХеш пароля ({args.kdf}): {hash_pw}\n")
+
+    # Загружаем или создаём auth.json; вставка/обновление — по индексу логинов
+    store = CredentialStore(AUTH_FILE)
+    if not store.upsert(login, hash_pw):
+        print("Пользователь с таким логином уже существует! Пароль обновлён.")
 
     print(f"Пользователь '{login}' успешно добавлен/обновлён в auth.json.")
 